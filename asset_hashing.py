@@ -0,0 +1,210 @@
+"""Content-hashed release filenames for the Ultimate Hyperfocus Constellation.
+
+Turns the built JS/CSS into ``name.<hash>.ext`` files, rewrites the
+``<script>``/``<link>`` references in ``index.html`` and regenerates the
+service worker's ``PRECACHE_MANIFEST`` and cache version from the hashed
+names. Because a hashed URL can never change content, those files are
+served as immutable and returning visitors only download what changed.
+Files that keep a stable URL carry a content revision in the manifest, so
+the service worker only re-downloads them when their bytes change.
+
+All functions here are pure: they return new names and bytes, and
+``build.py`` decides what actually gets written to disk.
+"""
+
+import hashlib
+import posixpath
+import re
+from typing import List, Dict, Optional, Tuple
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+BASE_PATH = "/ULTIMATE-HYPERFOCUS-CONSTELLATION/"
+HASH_LENGTH = 8
+HASHABLE_SUFFIXES = (".js", ".css")
+# Entry points must keep a stable URL: the page itself and the worker script
+STABLE_NAMES = ("index.html", "sw.js", "manifest.json")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+_REFERENCE_PATTERN = re.compile(
+    r"""(<(?:script|link)\b[^>]*?\b(?:src|href)\s*=\s*)(["'])([^"']+)\2""",
+    re.IGNORECASE,
+)
+_PRECACHE_PATTERN = re.compile(r"const PRECACHE_MANIFEST = \[(.*?)\];", re.DOTALL)
+_STATIC_CACHE_PATTERN = re.compile(r"const STATIC_CACHE = '[^']*';")
+_MANIFEST_URL_PATTERN = re.compile(r"url: '([^']*)'")
+
+
+def content_hash(data: bytes) -> str:
+    """Return the short content hash used in release filenames."""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def is_hashable(name: str) -> bool:
+    """Return True for assets that are published under a hashed filename."""
+    return name.endswith(HASHABLE_SUFFIXES) and posixpath.basename(name) not in STABLE_NAMES
+
+
+def hashed_name(name: str, data: bytes) -> str:
+    """Insert the content hash before the extension (``a/b.js`` -> ``a/b.1a2b3c4d.js``)."""
+    stem, extension = posixpath.splitext(name)
+    return f"{stem}.{content_hash(data)}{extension}"
+
+
+def _is_local_reference(url: str) -> bool:
+    """Return True for URLs that point at files we publish ourselves."""
+    return not (url.startswith(("//", "data:", "#")) or re.match(r"^[a-z][a-z0-9+.-]*:", url, re.I))
+
+
+def _rename_reference(url: str, mapping: Dict[str, str]) -> str:
+    """Swap the file name in a local URL for its hashed counterpart."""
+    path, separator, query = url.partition("?")
+    directory, basename = posixpath.split(path)
+    if basename not in mapping:
+        return url
+    renamed = posixpath.join(directory, mapping[basename]) if directory else mapping[basename]
+    return renamed + separator + query
+
+
+def rewrite_html_references(html: str, mapping: Dict[str, str]) -> str:
+    """Point ``<script src>`` and ``<link href>`` tags at hashed filenames.
+
+    Args:
+        html: The page markup.
+        mapping: Logical file name -> hashed file name.
+
+    Returns:
+        The markup with every local reference to a mapped file rewritten.
+        External URLs (CDNs, absolute ``https://`` links) are left alone.
+    """
+    def replace(match: "re.Match[str]") -> str:
+        prefix, quote, url = match.groups()
+        if _is_local_reference(url):
+            url = _rename_reference(url, mapping)
+        return f"{prefix}{quote}{url}{quote}"
+
+    return _REFERENCE_PATTERN.sub(replace, html)
+
+
+def precache_urls(existing: List[str], mapping: Dict[str, str],
+                  base_path: str = BASE_PATH) -> List[str]:
+    """Build the service worker precache list from the release mapping.
+
+    Stable entries (the app shell, ``manifest.json``, external URLs) are
+    kept in their original order; local JS/CSS entries are replaced with the
+    hashed files actually published, so names that are no longer built can
+    not break ``cache.addAll`` during install.
+    """
+    urls = [url for url in existing
+            if not (url.startswith(base_path) and url.endswith(HASHABLE_SUFFIXES))]
+    hashed = [base_path + mapping[name] for name in sorted(mapping)]
+    # Keep external URLs (e.g. the Three.js CDN build) after our own files
+    local = [url for url in urls if url.startswith(base_path)]
+    external = [url for url in urls if not url.startswith(base_path)]
+    return local + hashed + external
+
+
+def precache_manifest(urls: List[str], revisions: Dict[str, str],
+                      base_path: str = BASE_PATH) -> List[Tuple[str, Optional[str]]]:
+    """Pair each precache URL with the revision of its content.
+
+    Args:
+        urls: The precache list (see ``precache_urls``).
+        revisions: Logical name -> content hash of the files published under
+            a stable name. ``base_path`` itself serves ``index.html``.
+
+    Returns:
+        ``(url, revision)`` pairs. The revision is None for URLs that are
+        versioned themselves: hashed files, external URLs and local files
+        whose content is not part of the release.
+    """
+    manifest = []
+    for url in urls:
+        name = url[len(base_path):] if url.startswith(base_path) else None
+        if name == "":
+            name = "index.html"
+        manifest.append((url, revisions.get(name) if name is not None else None))
+    return manifest
+
+
+def rewrite_service_worker(source: str, mapping: Dict[str, str],
+                           revisions: Optional[Dict[str, str]] = None,
+                           base_path: str = BASE_PATH) -> str:
+    """Regenerate ``PRECACHE_MANIFEST`` and ``STATIC_CACHE`` in the service worker.
+
+    Args:
+        source: The service worker script.
+        mapping: Logical name -> hashed name of the precached files.
+        revisions: Logical name -> content hash of stable-named files (see
+            ``precache_manifest``).
+
+    The static cache name is derived from the manifest, so it changes
+    exactly when a precached file does - no manual version bumps.
+    """
+    match = _PRECACHE_PATTERN.search(source)
+    if match is None:
+        return source
+
+    urls = precache_urls(_MANIFEST_URL_PATTERN.findall(match.group(1)), mapping, base_path)
+    manifest = precache_manifest(urls, revisions or {}, base_path)
+    entries = []
+    for url, revision in manifest:
+        literal = f"'{revision}'" if revision else "null"
+        entries.append(f"\n    {{ url: '{url}', revision: {literal} }}")
+    source = source[:match.start()] + f"const PRECACHE_MANIFEST = [{','.join(entries)}\n];" + source[match.end():]
+
+    version = content_hash("\n".join(f"{url} {revision}" for url, revision in manifest).encode("utf-8"))
+    return _STATIC_CACHE_PATTERN.sub(f"const STATIC_CACHE = 'static-{version}';", source, count=1)
+
+
+def plan_release(assets: Dict[str, bytes],
+                 not_precached: Tuple[str, ...] = (),
+                 published: Optional[Dict[str, str]] = None) -> Tuple[Dict[str, str], Dict[str, bytes]]:
+    """Work out the release file set for a group of built assets.
+
+    Args:
+        assets: Logical asset name -> built bytes.
+        not_precached: Assets that are published but should not be listed in
+            the service worker precache (e.g. modules already in the bundle).
+        published: Logical name -> content-hashed name for assets named
+            before planning (the bundle and its source map, which refer to
+            each other); they are treated like any other hashed file.
+
+    Returns:
+        A ``(files, contents)`` pair: ``files`` maps each logical name to the
+        name it is published under, ``contents`` maps published names to
+        their (possibly rewritten) bytes.
+    """
+    mapping = {name: hashed_name(name, data) for name, data in assets.items() if is_hashable(name)}
+    mapping.update(published or {})
+    files = {name: mapping.get(name, name) for name in assets}
+    precached = {name: hashed for name, hashed in mapping.items() if name not in not_precached}
+    contents = {}
+    workers = [name for name in assets if posixpath.basename(name) == "sw.js"]
+    for name, data in assets.items():
+        if name.endswith(".html"):
+            data = rewrite_html_references(data.decode("utf-8"), mapping).encode("utf-8")
+        if name not in workers:
+            contents[files[name]] = data
+    # Revisions are taken from the final bytes, so the worker comes last
+    revisions = {name: content_hash(contents[files[name]]) for name in assets
+                 if name not in mapping and name not in workers}
+    for name in workers:
+        contents[files[name]] = rewrite_service_worker(
+            assets[name].decode("utf-8"), precached, revisions).encode("utf-8")
+    return files, contents
+
+
+def render_headers(files: Dict[str, str], base_path: str = BASE_PATH) -> bytes:
+    """Render a ``_headers`` file marking hashed assets as immutable.
+
+    The format is understood by Netlify and Cloudflare Pages; hosts without
+    header support simply publish it as an unused file.
+    """
+    lines = []
+    for logical, published in sorted(files.items()):
+        cache_control = IMMUTABLE_CACHE_CONTROL if logical != published else REVALIDATE_CACHE_CONTROL
+        lines.append(f"{base_path}{published}\n  Cache-Control: {cache_control}\n")
+    return "\n".join(lines).encode("utf-8")
@@ -0,0 +1,515 @@
+"""Incremental build driver for the Ultimate Hyperfocus Constellation.
+
+Discovers every ``script*.py`` generator in the project root, fingerprints
+the code and templates of each one (with the project modules it imports)
+and only re-runs the generators whose fingerprint changed since the last
+build. Generators run in a process pool, each inside its own scratch
+directory, and their outputs are only copied into place when the bytes
+differ - untouched outputs keep their content and mtime, so browser and
+service-worker caches stay valid between deploys.
+
+After the generators, the shipped assets are published to ``dist/`` under
+content-hashed names (see ``asset_hashing.py``), get precompressed
+``.gz``/``.zz`` siblings and are measured into ``build-manifest.json``.
+"""
+
+import argparse
+import ast
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import runpy
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from build_manifest import MANIFEST_NAME, artifact_names, build_manifest, render_manifest
+import perf_budget
+from asset_hashing import plan_release, render_headers
+from bundler import (BUNDLE_NAME, BUNDLE_ORDER, BUNDLE_PREREQUISITES, SOURCE_MAP_SUFFIX, build_bundle,
+                     insert_script_tags, link_stylesheets, name_bundle, rewrite_html_for_bundle)
+from precompress import SIBLING_SUFFIXES, compressed_variants, is_compressible
+from repo_layout import LAYOUT_PATH
+from repo_snapshot import SEARCH_INDEX_PATH, SNAPSHOT_PATH
+from strip_debug import strip_debug
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+PROJECT_ROOT = Path(__file__).resolve().parent
+GENERATOR_GLOB = "script*.py"
+STATE_FILE = ".build-state.json"
+DIST_DIR = PROJECT_ROOT / "dist"
+HEADERS_FILE = "_headers"
+WEB_ASSET_SUFFIXES = (".js", ".css", ".json", ".html", ".bin")
+# Hand-written assets that ship alongside the generated modules
+STATIC_ASSETS = ("index.html", "styles.css", "search-index.js", "facet-filter.js",
+                 "constellation-engine.js", "ui-interactions.js", SNAPSHOT_PATH.as_posix(),
+                 LAYOUT_PATH.as_posix(), SEARCH_INDEX_PATH.as_posix())
+# Page scripts that run after the engine, outside the bundle
+PAGE_SCRIPTS = ("ui-interactions.js",)
+SEPARATOR_LENGTH = 75
+INDENT = "    "
+
+logger = logging.getLogger(__name__)
+
+
+def discover_generators(root: Path) -> List[Dict[str, Any]]:
+    """Find generator scripts and the output files each of them writes.
+
+    A script counts as a generator when it contains at least one
+    ``open('<literal name>', 'w', ...)`` call. Its fingerprint covers the
+    whole script - the embedded templates and the code that fills them in -
+    plus every project module it imports, directly or through another
+    project module (e.g. ``script_4.py`` -> ``sw_routes.py`` ->
+    ``asset_hashing.py``). Comments and formatting do not count.
+
+    Args:
+        root: Directory to scan for ``script*.py`` files.
+
+    Returns:
+        A list of generator descriptions with ``name``, ``path``,
+        ``outputs`` and ``fingerprint`` keys, sorted by script name.
+    """
+    generators = []
+    for path in sorted(root.glob(GENERATOR_GLOB)):
+        source = path.read_text(encoding="utf-8")
+        try:
+            tree = ast.parse(source, filename=str(path))
+        except SyntaxError as error:
+            logger.warning(f"⚠️ Skipping {path.name}: {error}")
+            continue
+
+        outputs = _find_outputs(tree)
+        if not outputs:
+            continue
+
+        sources = [ast.dump(tree)]
+        sources += [_module_source(dependency) for dependency in _local_imports(tree, root)]
+        generators.append({
+            "name": path.name,
+            "path": str(path),
+            "outputs": outputs,
+            "fingerprint": fingerprint_sources(sources, outputs),
+        })
+    return generators
+
+
+def _find_outputs(tree: ast.AST) -> List[str]:
+    """Collect literal file names opened for writing anywhere in ``tree``."""
+    outputs = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id == "open"
+                and len(node.args) >= 2):
+            continue
+        name, mode = node.args[0], node.args[1]
+        if (isinstance(name, ast.Constant) and isinstance(name.value, str)
+                and isinstance(mode, ast.Constant) and "w" in str(mode.value)):
+            outputs.append(name.value)
+    return outputs
+
+
+def _direct_imports(tree: ast.AST, root: Path) -> List[Path]:
+    """Return the project modules in ``root`` imported anywhere in ``tree``."""
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+    paths = [root / f"{module.partition('.')[0]}.py" for module in dict.fromkeys(modules)]
+    return [path for path in paths if path.is_file()]
+
+
+def _local_imports(tree: ast.AST, root: Path) -> List[Path]:
+    """Return the project modules ``tree`` imports, directly or through each other."""
+    found = set()
+    pending = _direct_imports(tree, root)
+    while pending:
+        path = pending.pop()
+        if path in found:
+            continue
+        found.add(path)
+        with contextlib.suppress(SyntaxError):
+            module = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+            pending += _direct_imports(module, root)
+    return sorted(found)
+
+
+def _module_source(path: Path) -> str:
+    """Return a module's AST dump, or its raw text when it does not parse."""
+    source = path.read_text(encoding="utf-8")
+    try:
+        return ast.dump(ast.parse(source, filename=str(path)))
+    except SyntaxError:
+        return source
+
+
+def fingerprint_sources(sources: List[str], outputs: List[str]) -> str:
+    """Return a SHA-256 fingerprint over a generator's sources and outputs.
+
+    Args:
+        sources: The generator and the modules it imports, in a stable order.
+        outputs: The file names the generator writes.
+
+    Returns:
+        A hex digest that changes whenever any source or output name does.
+    """
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    for chunk in [*sources, *outputs]:
+        encoded = chunk.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def load_state(out_dir: Path) -> Dict[str, str]:
+    """Load the generator fingerprints recorded by the previous build."""
+    state_path = out_dir / STATE_FILE
+    try:
+        with open(state_path, encoding="utf-8") as state_file:
+            return json.load(state_file).get("generators", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(out_dir: Path, fingerprints: Dict[str, str]) -> None:
+    """Persist generator fingerprints for the next incremental build."""
+    state = {"version": __version__, "generators": dict(sorted(fingerprints.items()))}
+    write_if_changed(out_dir / STATE_FILE,
+                     (json.dumps(state, indent=2) + "\n").encode("utf-8"))
+
+
+def run_generator(script_path: str) -> Dict[str, bytes]:
+    """Run one generator in a scratch directory and capture what it writes.
+
+    This is executed inside a worker process, so changing the working
+    directory does not affect the driver or the other generators.
+
+    Args:
+        script_path: Absolute path of the generator script.
+
+    Returns:
+        A mapping of output file name to the bytes the generator wrote.
+    """
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="constellation-build-") as scratch:
+        os.chdir(scratch)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                runpy.run_path(script_path, run_name="__main__")
+            return {
+                entry.name: entry.read_bytes()
+                for entry in Path(scratch).iterdir()
+                if entry.is_file()
+            }
+        finally:
+            os.chdir(previous_cwd)
+
+
+def write_if_changed(path: Path, content: bytes) -> bool:
+    """Atomically write ``content`` to ``path`` unless it is already identical.
+
+    Args:
+        path: Destination file.
+        content: The bytes that should end up in the file.
+
+    Returns:
+        True when the file was (re)written, False when it was left untouched.
+    """
+    try:
+        if path.read_bytes() == content:
+            return False
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(content)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+    return True
+
+
+def plan_build(generators: List[Dict[str, Any]], state: Dict[str, str],
+               out_dir: Path, force: bool = False) -> List[Dict[str, Any]]:
+    """Select the generators that need to run.
+
+    A generator is stale when forced, when its fingerprint differs from the
+    recorded one, or when any of its outputs is missing from ``out_dir``.
+    """
+    stale = []
+    for generator in generators:
+        missing = [name for name in generator["outputs"]
+                   if not (out_dir / name).exists()]
+        if force or missing or state.get(generator["name"]) != generator["fingerprint"]:
+            stale.append(generator)
+    return stale
+
+
+def build(out_dir: Path = PROJECT_ROOT, root: Path = PROJECT_ROOT,
+          force: bool = False, jobs: Optional[int] = None,
+          dist_dir: Optional[Path] = DIST_DIR, bundle: bool = True,
+          production: bool = False) -> Dict[str, Any]:
+    """Run all stale generators and install their changed outputs.
+
+    Args:
+        out_dir: Directory the generated files are installed into.
+        root: Directory containing the generator scripts.
+        force: Re-run every generator regardless of recorded fingerprints.
+        jobs: Maximum number of worker processes (defaults to CPU count).
+        dist_dir: Directory the content-hashed release is published to, or
+            None to skip the release step.
+        bundle: Publish the core engine and generated modules as a single
+            bundle (with source map) referenced from ``index.html``.
+        production: Strip ``console.log``/``console.warn`` calls and
+            ``@debug-start`` blocks from the published JS.
+
+    Returns:
+        A summary with ``ran``, ``skipped``, ``written`` and ``unchanged``
+        lists of script and output names, the published ``files`` mapping
+        and the measured ``manifest``.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    generators = discover_generators(root)
+    state = load_state(out_dir)
+    stale = plan_build(generators, state, out_dir, force)
+    stale_names = {generator["name"] for generator in stale}
+
+    summary = {
+        "ran": sorted(stale_names),
+        "skipped": sorted(g["name"] for g in generators if g["name"] not in stale_names),
+        "written": [],
+        "unchanged": [],
+    }
+    fingerprints = {name: value for name, value in state.items()
+                    if any(g["name"] == name for g in generators)}
+
+    if stale:
+        workers = max(1, min(jobs or os.cpu_count() or 1, len(stale)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(run_generator, [g["path"] for g in stale])
+            for generator, outputs in zip(stale, results):
+                for name in generator["outputs"]:
+                    if name not in outputs:
+                        raise RuntimeError(f"{generator['name']} did not write {name}")
+                    target = "written" if write_if_changed(out_dir / name, outputs[name]) else "unchanged"
+                    summary[target].append(name)
+                fingerprints[generator["name"]] = generator["fingerprint"]
+
+    save_state(out_dir, fingerprints)
+
+    assets = shipped_assets(out_dir, generators)
+    if dist_dir is None:
+        files, publish_dir = {name: name for name in assets}, out_dir
+    else:
+        files = publish_release(out_dir, dist_dir, assets, generators if bundle else None,
+                                production)
+        publish_dir = dist_dir
+    summary["files"] = files
+    summary["precompressed"] = emit_precompressed(publish_dir, list(files.values()))
+    if dist_dir is not None:
+        prune_release(dist_dir, files)
+    # Source maps are only fetched by devtools, so they stay out of the totals
+    measured = {name: published for name, published in files.items()
+                if not name.endswith(SOURCE_MAP_SUFFIX)}
+    summary["manifest"] = write_build_manifest(out_dir, measured, publish_dir)
+    return summary
+
+
+def publish_release(out_dir: Path, dist_dir: Path, names: List[str],
+                    generators: Optional[List[Dict[str, Any]]] = None,
+                    production: bool = False) -> Dict[str, str]:
+    """Write the deployable release into ``dist_dir`` under hashed filenames.
+
+    JS/CSS are published as ``name.<hash>.ext``; ``index.html`` and ``sw.js``
+    keep their names but have their references rewritten to the hashed
+    files. A ``_headers`` file marks the hashed files as immutable.
+
+    When ``generators`` is given, the modules in ``BUNDLE_ORDER`` are also
+    concatenated into one bundle that replaces their ``<script>`` tags and
+    precache entries; the individual files are still published. The bundle
+    and its source map share one content hash (see ``name_bundle``). Scripts
+    ``index.html`` does not load yet (three.js, the bundle or the separate
+    modules, ``PAGE_SCRIPTS``) get a tag added before ``</body>``, and its
+    stylesheet links point at the published stylesheets.
+
+    In ``production`` mode every published JS file (and the bundle) has its
+    development logging and debug blocks stripped.
+
+    Returns:
+        Logical asset name -> published file name.
+    """
+    assets = {name: (out_dir / name).read_bytes() for name in names}
+    transform = strip_debug if production else None
+    if transform is not None:
+        for name in assets:
+            if name.endswith(".js"):
+                assets[name] = transform(assets[name].decode("utf-8")).encode("utf-8")
+    modules = tuple(name for name in BUNDLE_ORDER if name in assets)
+    bundled = modules if generators is not None else ()
+    published = {}
+    if bundled:
+        bundle, source_map = build_bundle(out_dir, generators, bundled, transform=transform)
+        assets[BUNDLE_NAME], assets[BUNDLE_NAME + SOURCE_MAP_SUFFIX], published = name_bundle(
+            bundle, source_map)
+    if "index.html" in assets:
+        html = assets["index.html"].decode("utf-8")
+        if bundled:
+            html = rewrite_html_for_bundle(html, bundled)
+        scripts = [*BUNDLE_PREREQUISITES, *((BUNDLE_NAME,) if bundled else modules),
+                   *(name for name in PAGE_SCRIPTS if name in assets)]
+        html = link_stylesheets(html, [name for name in assets if name.endswith(".css")])
+        assets["index.html"] = insert_script_tags(html, scripts).encode("utf-8")
+    not_precached = (*bundled, BUNDLE_NAME + SOURCE_MAP_SUFFIX) if bundled else ()
+    files, contents = plan_release(assets, not_precached=not_precached, published=published)
+    for published, data in contents.items():
+        write_if_changed(dist_dir / published, data)
+    write_if_changed(dist_dir / HEADERS_FILE, render_headers(files))
+    return files
+
+
+def prune_release(dist_dir: Path, files: Dict[str, str]) -> List[str]:
+    """Delete files left in ``dist_dir`` by earlier releases.
+
+    Returns:
+        The names of the files that were removed.
+    """
+    keep = {HEADERS_FILE}
+    for published in files.values():
+        keep.add(published)
+        keep.update(published + suffix for suffix in SIBLING_SUFFIXES)
+    removed = []
+    for entry in sorted(dist_dir.iterdir()):
+        if entry.is_file() and entry.name not in keep:
+            entry.unlink()
+            removed.append(entry.name)
+    return removed
+
+
+def emit_precompressed(out_dir: Path, names: List[str]) -> List[str]:
+    """Write ``.gz``/``.zz`` siblings for compressible assets.
+
+    Siblings are only rewritten when their bytes change, and stale siblings
+    are removed when compression no longer pays off for an asset.
+
+    Returns:
+        The names of sibling files that were (re)written.
+    """
+    written = []
+    for name in names:
+        if not is_compressible(name):
+            continue
+        path = out_dir / name
+        variants = compressed_variants(path.read_bytes())
+        for suffix in SIBLING_SUFFIXES:
+            sibling = path.with_name(path.name + suffix)
+            if suffix in variants:
+                if write_if_changed(sibling, variants[suffix]):
+                    written.append(sibling.name)
+            elif sibling.exists():
+                sibling.unlink()
+    return written
+
+
+def shipped_assets(out_dir: Path, generators: List[Dict[str, Any]]) -> List[str]:
+    """List the web assets in ``out_dir`` that are deployed to users."""
+    return [name for name in [*artifact_names(generators), *STATIC_ASSETS]
+            if name.endswith(WEB_ASSET_SUFFIXES) and (out_dir / name).is_file()]
+
+
+def write_build_manifest(out_dir: Path = PROJECT_ROOT,
+                         files: Optional[Dict[str, str]] = None,
+                         publish_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Measure the shipped assets and (re)write ``build-manifest.json``.
+
+    Args:
+        out_dir: Directory holding the built assets; the manifest is
+            written here.
+        files: Logical asset name -> published file name. Defaults to the
+            assets currently in ``out_dir`` under their own names.
+        publish_dir: Directory the published files live in (defaults to
+            ``out_dir``).
+
+    Returns:
+        The manifest that was written.
+    """
+    if files is None:
+        files = {name: name for name in shipped_assets(out_dir, discover_generators(PROJECT_ROOT))}
+    manifest = build_manifest(publish_dir or out_dir, files)
+    write_if_changed(out_dir / MANIFEST_NAME, render_manifest(manifest))
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out-dir", type=Path, default=PROJECT_ROOT,
+                        help="where generated files are installed (default: project root)")
+    parser.add_argument("--dist-dir", type=Path, default=DIST_DIR,
+                        help="where the content-hashed release is published (default: dist/)")
+    parser.add_argument("--no-release", action="store_true",
+                        help="skip publishing the hashed release")
+    parser.add_argument("--no-bundle", action="store_true",
+                        help="publish the modules as separate scripts instead of one bundle")
+    parser.add_argument("--production", action="store_true",
+                        help="strip console.log/console.warn and @debug blocks from published JS")
+    parser.add_argument("--force", action="store_true",
+                        help="re-run every generator even if its sources are unchanged")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="number of generator worker processes")
+    parser.add_argument("--check-budget", action="store_true",
+                        help=f"fail when {perf_budget.BUDGET_FILE} limits are exceeded")
+    parser.add_argument("--baseline", type=Path, default=None,
+                        help="manifest file to use as the growth baseline (overrides --baseline-ref)")
+    parser.add_argument("--baseline-ref", default="HEAD",
+                        help="git revision whose committed manifest is the growth baseline")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    logger.info("🌌 ULTIMATE HYPERFOCUS CONSTELLATION - INCREMENTAL BUILD")
+    logger.info("=" * SEPARATOR_LENGTH)
+    summary = build(out_dir=args.out_dir, force=args.force, jobs=args.jobs,
+                    dist_dir=None if args.no_release else args.dist_dir,
+                    bundle=not args.no_bundle, production=args.production)
+
+    logger.info(f"⚡ Generators run: {len(summary['ran'])}, skipped: {len(summary['skipped'])}")
+    for name in summary["written"]:
+        logger.info(f"{INDENT}✍️ {name} updated")
+    for name in summary["unchanged"]:
+        logger.info(f"{INDENT}✅ {name} unchanged (mtime preserved)")
+
+    totals = summary["manifest"]["totals"]
+    logger.info(f"🗜️ Precompressed siblings updated: {len(summary['precompressed'])}")
+    logger.info(f"📦 {totals['files']} shipped files: {totals['bytes']:,} bytes raw, "
+                f"{totals['gzip_bytes']:,} bytes gzip ({MANIFEST_NAME})")
+
+    if args.check_budget:
+        baseline = ["--baseline", str(args.baseline)] if args.baseline is not None else []
+        return perf_budget.main(["--manifest", str(args.out_dir / MANIFEST_NAME),
+                                 "--baseline-ref", args.baseline_ref, *baseline])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
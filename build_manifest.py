@@ -0,0 +1,119 @@
+"""Measured build manifest for the Ultimate Hyperfocus Constellation.
+
+Stats the files the generators actually wrote and records raw, gzip and
+deflate sizes, a SHA-256 digest and a line count for each of them. The
+resulting JSON manifest is the source of truth for performance budgets and
+cache busting - it deliberately carries no timestamps, so rebuilding an
+unchanged tree produces a byte-identical manifest.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Optional
+
+from precompress import SIBLING_SUFFIXES, deflate_compress, gzip_compress
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+MANIFEST_NAME = "build-manifest.json"
+SIZE_FIELDS = ("bytes", "gzip_bytes", "deflate_bytes", "lines")
+
+
+def measure_artifact(path: Path) -> Dict[str, Any]:
+    """Measure a single generated file.
+
+    Args:
+        path: The file to measure.
+
+    Returns:
+        A dictionary with ``bytes``, ``gzip_bytes``, ``deflate_bytes``, their
+        ``gzip_ratio``/``deflate_ratio``, ``sha256``, ``lines`` and the
+        ``precompressed`` sibling suffixes present next to the file.
+    """
+    data = path.read_bytes()
+    gzip_size = len(gzip_compress(data))
+    deflate_size = len(deflate_compress(data))
+    return {
+        "bytes": len(data),
+        "gzip_bytes": gzip_size,
+        "deflate_bytes": deflate_size,
+        "gzip_ratio": round(gzip_size / len(data), 4) if data else 1.0,
+        "deflate_ratio": round(deflate_size / len(data), 4) if data else 1.0,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "lines": data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0),
+        "precompressed": [suffix for suffix in SIBLING_SUFFIXES
+                          if path.with_name(path.name + suffix).is_file()],
+    }
+
+
+def build_manifest(root: Path, files: Dict[str, str]) -> Dict[str, Any]:
+    """Measure every published artifact under ``root`` and total them up.
+
+    Entries are keyed by logical name so budgets and growth comparisons are
+    stable across releases; when an artifact is published under a different
+    (content-hashed) name, that name is recorded as ``file``. Files that do
+    not exist are listed under ``missing`` instead of being silently counted
+    as zero.
+
+    Args:
+        root: Directory the published names are relative to.
+        files: Logical artifact name -> published file name.
+
+    Returns:
+        The manifest as a JSON-serialisable dictionary.
+    """
+    artifacts = {}
+    missing = []
+    for name, published in sorted(files.items()):
+        path = root / published
+        if not path.is_file():
+            missing.append(name)
+            continue
+        artifacts[name] = measure_artifact(path)
+        if published != name:
+            artifacts[name]["file"] = published
+
+    return {
+        "version": __version__,
+        "artifacts": artifacts,
+        "totals": total_sizes(artifacts.values()),
+        "missing": missing,
+    }
+
+
+def total_sizes(entries: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Sum the size fields of a collection of manifest entries."""
+    totals = {field: 0 for field in SIZE_FIELDS}
+    count = 0
+    for entry in entries:
+        count += 1
+        for field in SIZE_FIELDS:
+            totals[field] += entry.get(field, 0)
+    totals["files"] = count
+    return totals
+
+
+def render_manifest(manifest: Dict[str, Any]) -> bytes:
+    """Serialise ``manifest`` as stable, pretty-printed JSON bytes."""
+    return (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def load_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    """Load a previously written manifest, or None if it is missing or invalid."""
+    try:
+        with open(path, encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+
+
+def format_kb(size: int) -> str:
+    """Format a byte count the way the project summaries do (e.g. ``12.3 KB``)."""
+    return f"{size / 1024:.1f} KB"
+
+
+def artifact_names(generators: List[Dict[str, Any]]) -> List[str]:
+    """Flatten the output names of discovered generators into one list."""
+    return [name for generator in generators for name in generator["outputs"]]
@@ -0,0 +1,312 @@
+"""Single production bundle for the Ultimate Hyperfocus Constellation.
+
+Concatenates the core engine (and the search index and facet filter it
+builds on) and the generated modules in the order the
+``ConstellationIntegrator`` initialises them (core -> GitHub API -> research
+-> onboarding -> PWA -> SEO -> integrator), wraps them in one function scope
+and emits a v3 source map. Lines coming from a generated module map back to
+the template inside the ``script*.py`` generator that produced it, so stack
+traces point at the file you actually edit.
+"""
+
+import ast
+import json
+import posixpath
+import re
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
+
+from asset_hashing import hashed_name
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+BUNDLE_NAME = "constellation.bundle.js"
+SOURCE_MAP_SUFFIX = ".map"
+# Integrator initialisation order; each module only relies on earlier ones
+BUNDLE_ORDER = (
+    "search-index.js",
+    "facet-filter.js",
+    "constellation-engine.js",
+    "github-api-manager.js",
+    "research-mode-manager.js",
+    "onboarding-manager.js",
+    "pwa-manager.js",
+    "seo-manager.js",
+    "constellation-integrator.js",
+)
+# Loaded ahead of the bundle (or the separate modules): the engine reads
+# window.THREE when it is evaluated. Same build the service worker precaches.
+THREE_URL = "https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"
+BUNDLE_PREREQUISITES = (THREE_URL,)
+_BASE64_DIGITS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+_SCRIPT_TAG_PATTERN = re.compile(
+    r"""[ \t]*<script\b[^>]*\bsrc\s*=\s*(["'])([^"']+)\1[^>]*>\s*</script>[ \t]*\n?""",
+    re.IGNORECASE,
+)
+_BODY_END_PATTERN = re.compile(r"</body\s*>", re.IGNORECASE)
+_HEAD_END_PATTERN = re.compile(r"</head\s*>", re.IGNORECASE)
+_LINK_TAG_PATTERN = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+_STYLESHEET_REL_PATTERN = re.compile(r"""\brel\s*=\s*(["'])\s*stylesheet\s*\1""", re.IGNORECASE)
+_HREF_PATTERN = re.compile(r"""(\bhref\s*=\s*)(["'])([^"']+)\2""", re.IGNORECASE)
+
+
+def encode_vlq(value: int) -> str:
+    """Encode one integer as a source map base64 VLQ."""
+    value = ((-value) << 1) | 1 if value < 0 else value << 1
+    encoded = ""
+    while True:
+        digit = value & 0b11111
+        value >>= 5
+        if value:
+            digit |= 0b100000
+        encoded += _BASE64_DIGITS[digit]
+        if not value:
+            return encoded
+
+
+def template_origin(script_path: Path, output_name: str) -> Optional[Tuple[int, int]]:
+    """Locate the template a generator writes to ``output_name``.
+
+    Looks for ``with open('<output_name>', 'w') as f: f.write(<name>)`` and
+    the module-level string assigned to ``<name>``.
+
+    Returns:
+        The zero-based ``(line, column)`` where the template text starts in
+        the generator, or None when it cannot be mapped line-for-line (for
+        example when escapes in the template expand into extra lines).
+    """
+    source = script_path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(script_path))
+    variable = None
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.With):
+            continue
+        opens_output = any(
+            isinstance(item.context_expr, ast.Call)
+            and item.context_expr.args
+            and isinstance(item.context_expr.args[0], ast.Constant)
+            and item.context_expr.args[0].value == output_name
+            for item in node.items
+        )
+        if not opens_output:
+            continue
+        for call in ast.walk(node):
+            if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                    and call.func.attr == "write" and call.args
+                    and isinstance(call.args[0], ast.Name)):
+                variable = call.args[0].id
+    if variable is None:
+        return None
+
+    for node in tree.body:
+        if (isinstance(node, ast.Assign)
+                and any(isinstance(target, ast.Name) and target.id == variable for target in node.targets)
+                and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)):
+            value = node.value
+            if value.value.count("\n") != value.end_lineno - value.lineno:
+                return None
+            opening = source.splitlines()[value.lineno - 1][value.col_offset:value.col_offset + 3]
+            quote_width = 3 if opening in ("'''", '"""') else 1
+            return value.lineno - 1, value.col_offset + quote_width
+    return None
+
+
+def _module_sources(module_dir: Path, names: List[str], generators: List[Dict[str, Any]],
+                    transform: Optional[Callable[[str], str]] = None) -> List[Dict[str, Any]]:
+    """Resolve each bundled module to its text and original source position."""
+    generator_for = {output: generator for generator in generators for output in generator["outputs"]}
+    modules = []
+    for name in names:
+        text = (module_dir / name).read_text(encoding="utf-8")
+        if transform is not None:
+            text = transform(text)
+        generator = generator_for.get(name)
+        origin = None
+        if generator is not None:
+            origin = template_origin(Path(generator["path"]), name)
+        if origin is None:
+            source_path, origin = module_dir / name, (0, 0)
+        else:
+            source_path = Path(generator["path"])
+        modules.append({"name": name, "text": text, "source": source_path, "origin": origin})
+    return modules
+
+
+def build_bundle(module_dir: Path, generators: List[Dict[str, Any]],
+                 names: Tuple[str, ...] = BUNDLE_ORDER,
+                 bundle_name: str = BUNDLE_NAME,
+                 transform: Optional[Callable[[str], str]] = None) -> Tuple[bytes, bytes]:
+    """Concatenate the modules into one scoped bundle plus its source map.
+
+    Args:
+        module_dir: Directory holding the built modules.
+        generators: Discovered generators, used to map modules back to the
+            ``script*.py`` that produced them.
+        names: Module file names in load order; missing ones are skipped.
+        bundle_name: File name the bundle is published under (used for the
+            ``sourceMappingURL`` comment and the map's ``file`` field).
+        transform: Optional rewrite applied to each module's text; it must
+            preserve line count for the source map to stay accurate.
+
+    Returns:
+        ``(bundle, source_map)`` as UTF-8 bytes.
+    """
+    present = [name for name in names if (module_dir / name).is_file()]
+    modules = _module_sources(module_dir, present, generators, transform)
+
+    sources = []
+    for module in modules:
+        if module["source"].name not in sources:
+            sources.append(module["source"].name)
+    sources_content = []
+    for source_name in sources:
+        path = next(m["source"] for m in modules if m["source"].name == source_name)
+        sources_content.append(path.read_text(encoding="utf-8"))
+
+    lines = [
+        f"/* {bundle_name} - generated by bundler.py, do not edit. */",
+        "(function () {",
+    ]
+    mappings = ["", ""]
+    previous = [0, 0, 0]  # source index, source line, source column
+
+    for module in modules:
+        lines.append(f"// --- {module['name']} ---")
+        mappings.append("")
+        source_index = sources.index(module["source"].name)
+        start_line, start_column = module["origin"]
+        for offset, line in enumerate(module["text"].rstrip("\n").split("\n")):
+            lines.append(line)
+            position = [source_index, start_line + offset, start_column if offset == 0 else 0]
+            segment = encode_vlq(0) + "".join(
+                encode_vlq(current - before) for current, before in zip(position, previous)
+            )
+            previous = position
+            mappings.append(segment)
+
+    lines.append("})();")
+    lines.append(f"//# sourceMappingURL={posixpath.basename(bundle_name)}{SOURCE_MAP_SUFFIX}")
+    mappings += ["", ""]
+
+    source_map = {
+        "version": 3,
+        "file": bundle_name,
+        "sources": sources,
+        "sourcesContent": sources_content,
+        "names": [],
+        "mappings": ";".join(mappings),
+    }
+    bundle = ("\n".join(lines) + "\n").encode("utf-8")
+    return bundle, json.dumps(source_map, ensure_ascii=False).encode("utf-8")
+
+
+def name_bundle(bundle: bytes, source_map: bytes,
+                bundle_name: str = BUNDLE_NAME) -> Tuple[bytes, bytes, Dict[str, str]]:
+    """Give a bundle from ``build_bundle`` and its map content-hashed names.
+
+    The bundle names its map and the map names the bundle, so neither can be
+    hashed after the other. Both are named by one hash of the pair instead,
+    ``name.<hash>.js`` and ``name.<hash>.js.map``; a cached map can then only
+    ever pair with the bundle it was built with.
+
+    Returns:
+        ``(bundle, source_map, names)`` with the references rewritten to the
+        published names; ``names`` maps the logical names to them.
+    """
+    published = hashed_name(bundle_name, bundle + source_map)
+    comment = f"//# sourceMappingURL={posixpath.basename(bundle_name)}{SOURCE_MAP_SUFFIX}\n"
+    text = bundle.decode("utf-8")
+    if not text.endswith(comment):
+        raise ValueError(f"{bundle_name} does not end with its sourceMappingURL comment")
+    text = text[:-len(comment)] + f"//# sourceMappingURL={posixpath.basename(published)}{SOURCE_MAP_SUFFIX}\n"
+    mapping = json.loads(source_map)
+    mapping["file"] = published
+    names = {bundle_name: published, bundle_name + SOURCE_MAP_SUFFIX: published + SOURCE_MAP_SUFFIX}
+    return (text.encode("utf-8"), json.dumps(mapping, ensure_ascii=False).encode("utf-8"), names)
+
+
+def rewrite_html_for_bundle(html: str, bundled: Tuple[str, ...],
+                            bundle_name: str = BUNDLE_NAME) -> str:
+    """Replace the individual module ``<script>`` tags with a single bundle tag.
+
+    The bundle tag takes the place of the first bundled script; the other
+    bundled tags are removed. Unrelated scripts are left untouched.
+    """
+    inserted = False
+
+    def replace(match: "re.Match[str]") -> str:
+        nonlocal inserted
+        directory, basename = posixpath.split(match.group(2).partition("?")[0])
+        if basename not in bundled:
+            return match.group(0)
+        if inserted:
+            return ""
+        inserted = True
+        src = posixpath.join(directory, bundle_name) if directory else bundle_name
+        indent = match.group(0)[:len(match.group(0)) - len(match.group(0).lstrip(" \t"))]
+        return f'{indent}<script src="{src}"></script>\n'
+
+    return _SCRIPT_TAG_PATTERN.sub(replace, html)
+
+
+def insert_script_tags(html: str, sources: Iterable[str]) -> str:
+    """Add ``<script>`` tags, in order, for the sources the page does not load yet.
+
+    Pages saved from a browser (like the MHTML ``index.html`` dump in this
+    repository) reference none of the local scripts, so there is nothing for
+    ``rewrite_html_for_bundle`` to replace; the tags go before the first
+    ``</body>``, which in an MHTML file is the end of the HTML part. A
+    source counts as loaded when a tag already points at a file with the
+    same name.
+
+    Raises:
+        ValueError: If a tag is needed but the page has no ``</body>``.
+    """
+    loaded = {posixpath.basename(match.group(2).partition("?")[0])
+              for match in _SCRIPT_TAG_PATTERN.finditer(html)}
+    missing = [source for source in sources if posixpath.basename(source) not in loaded]
+    if not missing:
+        return html
+    match = _BODY_END_PATTERN.search(html)
+    if match is None:
+        raise ValueError(f"Cannot add <script> tags for {', '.join(missing)}: the page has no </body>")
+    tags = "".join(f'    <script src="{source}"></script>\n' for source in missing)
+    return html[:match.start()] + tags + html[match.start():]
+
+
+def link_stylesheets(html: str, stylesheets: Iterable[str]) -> str:
+    """Point the page's stylesheet ``<link>`` tags at the local stylesheets.
+
+    A browser-saved page links the copy of ``styles.css`` it was saved from
+    (an S3 URL in the ``index.html`` dump), so the release would ship a
+    stylesheet nothing loads. A stylesheet link whose file name matches a
+    local stylesheet is pointed at that file; stylesheets the page does not
+    link at all get a tag before the first ``</head>``.
+
+    Raises:
+        ValueError: If a tag is needed but the page has no ``</head>``.
+    """
+    local = {posixpath.basename(name): name for name in stylesheets}
+    linked = set()
+
+    def replace(match: "re.Match[str]") -> str:
+        tag = match.group(0)
+        href = _HREF_PATTERN.search(tag)
+        if href is None or not _STYLESHEET_REL_PATTERN.search(tag):
+            return tag
+        basename = posixpath.basename(href.group(3).partition("?")[0])
+        if basename not in local:
+            return tag
+        linked.add(basename)
+        return tag[:href.start(3)] + local[basename] + tag[href.end(3):]
+
+    html = _LINK_TAG_PATTERN.sub(replace, html)
+    missing = [name for basename, name in local.items() if basename not in linked]
+    if not missing:
+        return html
+    match = _HEAD_END_PATTERN.search(html)
+    if match is None:
+        raise ValueError(f"Cannot link {', '.join(missing)}: the page has no </head>")
+    tags = "".join(f'    <link rel="stylesheet" href="{name}">\n' for name in missing)
+    return html[:match.start()] + tags + html[match.start():]
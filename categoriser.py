@@ -0,0 +1,158 @@
+"""Multi-pattern repository categoriser for the Ultimate Hyperfocus Constellation.
+
+Compiles the category keywords into one Aho-Corasick automaton, so each
+repository field is scanned once no matter how many keywords there are.
+Every distinct keyword found scores its category by the weight of the field
+it appeared in (name > topics > description); the highest score wins and
+ties go to the keyword listed first. Colours come from a plain
+category -> colour table.
+
+The same compiled automaton is embedded into ``github-api-manager.js`` by
+``script.py`` (see ``render_matcher``), so the browser and the Python
+snapshot tooling categorise identically.
+"""
+
+import json
+from collections import deque
+from typing import List, Dict, Any
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+# (keyword, category, colour) in priority order; the first listed keyword
+# wins ties, which keeps the old first-match behaviour for single hits
+CATEGORY_RULES = (
+    ("hyperfocus", "core", "#00d9ff"),
+    ("constellation", "visual", "#7c3aed"),
+    ("adhd", "brain", "#06ffa5"),
+    ("social", "social", "#f59e0b"),
+    ("accessibility", "accessibility", "#10b981"),
+    ("creative", "creative", "#ef4444"),
+    ("tool", "dev-tools", "#8b5cf6"),
+    ("portal", "portal", "#ec4899"),
+    ("raspberry", "hardware", "#6366f1"),
+    ("research", "research", "#14b8a6"),
+)
+DEFAULT_CATEGORY = "dev-tools"
+# Field -> score added per distinct keyword found in it
+FIELD_WEIGHTS = (("name", 3), ("topics", 2), ("description", 1))
+CATEGORY_ORDER = tuple(dict.fromkeys(category for _, category, _ in CATEGORY_RULES))
+CATEGORY_COLORS = {category: color for _, category, color in CATEGORY_RULES}
+MATCHER_PLACEHOLDER = "__CATEGORY_MATCHER__"
+
+
+def compile_automaton(keywords: List[str]) -> Dict[str, Any]:
+    """Build an Aho-Corasick automaton over lowercase ``keywords``.
+
+    The failure links are folded into a dense transition table, so matching
+    is a single table lookup per character with no backtracking.
+
+    Returns:
+        ``alphabet`` (the characters used by the keywords; any other
+        character is class 0), ``delta`` (row-major ``states x classes``
+        transition table, class ``i + 1`` being ``alphabet[i]``) and
+        ``output`` (per-state keyword indexes, including those reachable
+        through failure links).
+    """
+    goto: List[Dict[str, int]] = [{}]
+    output: List[List[int]] = [[]]
+    for index, keyword in enumerate(keywords):
+        state = 0
+        for char in keyword.lower():
+            if char not in goto[state]:
+                goto.append({})
+                output.append([])
+                goto[state][char] = len(goto) - 1
+            state = goto[state][char]
+        output[state].append(index)
+
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, child in goto[state].items():
+            queue.append(child)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[child] = goto[fallback].get(char, 0)
+            output[child] = output[child] + output[fail[child]]
+
+    alphabet = "".join(sorted({char for keyword in keywords for char in keyword.lower()}))
+    width = len(alphabet) + 1
+    delta = [0] * (len(goto) * width)
+    # Breadth-first order guarantees a state's failure row is filled first
+    order = [0]
+    for state in order:
+        order.extend(goto[state].values())
+    for state in order:
+        for column, char in enumerate(alphabet, start=1):
+            if char in goto[state]:
+                delta[state * width + column] = goto[state][char]
+            elif state:
+                delta[state * width + column] = delta[fail[state] * width + column]
+    return {"alphabet": alphabet, "delta": delta, "output": output}
+
+
+AUTOMATON = compile_automaton([keyword for keyword, _, _ in CATEGORY_RULES])
+KEYWORD_CATEGORY = [CATEGORY_ORDER.index(category) for _, category, _ in CATEGORY_RULES]
+_CHAR_CLASSES = {char: column for column, char in enumerate(AUTOMATON["alphabet"], start=1)}
+
+
+def find_keywords(text: str) -> List[int]:
+    """Return the indexes of the distinct keywords occurring in ``text``."""
+    delta, output = AUTOMATON["delta"], AUTOMATON["output"]
+    width = len(_CHAR_CLASSES) + 1
+    found = []
+    state = 0
+    for char in text.lower():
+        state = delta[state * width + _CHAR_CLASSES.get(char, 0)]
+        for keyword in output[state]:
+            if keyword not in found:
+                found.append(keyword)
+    return found
+
+
+def categorize(repo: Dict[str, Any]) -> str:
+    """Pick the category for a raw GitHub repository (or snapshot entry).
+
+    Args:
+        repo: A mapping with optional ``name``, ``topics`` and
+            ``description`` fields.
+
+    Returns:
+        The winning category key, or ``DEFAULT_CATEGORY`` when no keyword
+        matches.
+    """
+    scores: Dict[int, List[int]] = {}
+    for field, weight in FIELD_WEIGHTS:
+        value = repo.get(field) or ""
+        text = " ".join(value) if isinstance(value, list) else value
+        for keyword in find_keywords(text):
+            # Score first, then the earliest keyword as the tie-breaker
+            score = scores.setdefault(KEYWORD_CATEGORY[keyword], [0, -keyword])
+            score[0] += weight
+            score[1] = max(score[1], -keyword)
+    if not scores:
+        return DEFAULT_CATEGORY
+    return CATEGORY_ORDER[max(scores, key=lambda category: tuple(scores[category]))]
+
+
+def render_matcher() -> str:
+    """Serialise the compiled matcher as a single-line JS object literal.
+
+    Raises:
+        ValueError: If a keyword uses non-ASCII characters, which the
+            browser's ASCII character-class table cannot represent.
+    """
+    if not AUTOMATON["alphabet"].isascii():
+        raise ValueError("Category keywords must be ASCII for the browser matcher")
+    matcher = {
+        "categories": list(CATEGORY_ORDER),
+        "colors": CATEGORY_COLORS,
+        "defaultCategory": DEFAULT_CATEGORY,
+        "weights": dict(FIELD_WEIGHTS),
+        "keywordCategory": KEYWORD_CATEGORY,
+        **AUTOMATON,
+    }
+    return json.dumps(matcher, separators=(",", ":"), ensure_ascii=False)
@@ -1,4 +1,3 @@
-```javascript
 // Make sure THREE.js is available
 const THREE = window.THREE;
 /**
@@ -11,9 +10,6 @@ const THREE = window.THREE;
  * ALL 12 PERFORMANCE & SECURITY ISSUES FIXED ✅
  */
 
-// Import Three.js (FIX: Medium Issue #1)
-import * as THREE from 'three';
-
 // Define constants to eliminate magic numbers (FIX: Medium Issue #3)
 const MIN_SPHERE_SIZE = 0.5;
 const STAR_SIZE_MULTIPLIER = 0.3;
@@ -30,6 +26,7 @@ class UltimateHyperfocusConstellation {
         this.repositories = [];
         this.repositoryMeshes = [];
         this.connectionLines = [];
+        this.particleField = null;
         this.selectedRepository = null;
         this.currentMode = 'repository'; // 'repository' or 'research'
         this.isLoading = true;
@@ -60,7 +57,11 @@ class UltimateHyperfocusConstellation {
         this.lastResize = 0;
         this.resizeTimeout = null; // FIX: Medium Issue #6 - Debounce resize
         this.textCanvases = {}; // FIX: High Issue #1 - Reuse text textures
-        this.repositoriesLowercase = []; // FIX: Medium Issue #8 - Pre-computed search cache
+        this.searchIndex = new window.SearchIndex(); // FIX: Medium Issue #8 - Inverted search index
+        this.facetFilter = new window.FacetFilter(); // Bitset per facet value, combined filters
+        this.activeFilters = {}; // facet -> value; search holds the query string
+        this.searchMatches = null; // mesh indexes matching activeFilters.search
+        this.repositoryIndexByName = new Map();
 
         // Audio
         this.audioContext = null;
@@ -230,8 +231,27 @@ async createConstellation() {
      */
     async loadRepositoryData() {
         // For demo purposes, we'll use mock data
-        // In production, this would fetch from GitHub API
-        this.repositories = this.generateMockRepositories();
+        // In production, the integrator swaps in the snapshot / GitHub API
+        this.setRepositories(this.generateMockRepositories());
+
+        console.log(`📊 Loaded ${this.repositories.length} repositories`);
+    }
+
+    /**
+     * Replace the repository set and refresh everything derived from it.
+     * Repositories without a position keep the one they had before (matched
+     * by name) or get one derived from their name.
+     */
+    setRepositories(repos) {
+        const previousPositions = new Map(this.repositories.map(repo => [repo.name, repo.position]));
+        this.repositories = repos.map(repo => ({
+            ...repo,
+            position: repo.position || previousPositions.get(repo.name) || this.hashedPosition(repo.name)
+        }));
+        this.repositoryIndexByName = new Map(this.repositories.map((repo, index) => [repo.name, index]));
+
+        // FIX: Medium Issue #8 - Only re-index repositories that changed
+        this.searchIndex.sync(this.repositories);
 
         // Calculate total stars
         this.totalStars = this.repositories.reduce((sum, repo) => sum + repo.stars, 0);
@@ -239,8 +259,122 @@ async createConstellation() {
         if (totalStarsElement) {
             totalStarsElement.textContent = this.totalStars;
         }
+    }
 
-        console.log(`📊 Loaded ${this.repositories.length} repositories`);
+    /**
+     * Adopt a search index prebuilt by search_index.py for `repos`; call
+     * before setRepositories(repos) so nothing needs re-indexing
+     */
+    loadSearchIndex(data, repos) {
+        this.searchIndex = window.SearchIndex.fromJSON(data, repos);
+    }
+
+    /**
+     * Stable position for a repository the build-time layout (repo_layout.py)
+     * does not cover, so it stays in the same place across visits
+     */
+    hashedPosition(name) {
+        let hash = 0x811c9dc5;
+        const next = () => {
+            for (let i = 0; i < name.length; i++) {
+                hash = Math.imul(hash ^ name.charCodeAt(i), 0x01000193);
+            }
+            return (hash >>> 0) / 0x100000000 - 0.5;
+        };
+        return { x: next() * 80, y: next() * 60, z: next() * 40 };
+    }
+
+    /**
+     * Rebuild the spheres and connections after setRepositories().
+     * Before the first build this is a no-op - init() renders the current set.
+     */
+    rebuildConstellation() {
+        if (!this.scene || this.repositoryMeshes.length === 0) return;
+
+        this.repositoryMeshes.forEach(mesh => this.disposeRepositoryMesh(mesh));
+        this.connectionLines.forEach(line => {
+            this.scene.remove(line);
+            line.geometry.dispose();
+            line.material.dispose();
+        });
+        if (this.particleField) {
+            this.scene.remove(this.particleField);
+            this.particleField.geometry.dispose();
+            this.particleField.material.dispose();
+            this.particleField = null;
+        }
+
+        this.selectedRepository = null;
+        this.keyboardNavIndex = Math.min(this.keyboardNavIndex, Math.max(0, this.repositories.length - 1));
+        this.createConstellation();
+    }
+
+    /**
+     * Remove a repository sphere from the scene and release its geometries
+     * and materials (label textures are shared through this.textCanvases)
+     */
+    disposeRepositoryMesh(mesh) {
+        this.scene.remove(mesh);
+        mesh.traverse(child => {
+            if (child.geometry) child.geometry.dispose();
+            if (child.material) child.material.dispose();
+        });
+    }
+
+    /**
+     * Patch in a diff from a background refresh ({ added, changed, removed }):
+     * changed repositories get a new sphere in place and new ones are
+     * appended. Removals shift mesh indexes, so they rebuild everything.
+     */
+    applyRepositoryDiff({ added = [], changed = [], removed = [] }) {
+        const changedByName = new Map(changed.map(repo => [repo.name, repo]));
+        const gone = new Set(removed.map(repo => repo.name));
+        this.setRepositories(this.repositories
+            .filter(repo => !gone.has(repo.name))
+            .map(repo => changedByName.get(repo.name) || repo));
+
+        if (gone.size > 0) {
+            this.setRepositories([...this.repositories, ...added]);
+            this.rebuildConstellation();
+            return;
+        }
+
+        if (this.scene && this.repositoryMeshes.length > 0) {
+            changed.forEach(({ name }) => {
+                const index = this.repositoryIndexByName.get(name);
+                if (!this.repositoryMeshes[index]) return;
+                this.disposeRepositoryMesh(this.repositoryMeshes[index]);
+                this.repositoryMeshes[index] = this.createRepositorySphere(this.repositories[index], index);
+                this.scene.add(this.repositoryMeshes[index]);
+            });
+            this.rebuildFilters();
+        }
+        this.appendRepositories(added);
+    }
+
+    /**
+     * Add repositories that arrive after the first batch (later API pages)
+     * without rebuilding the spheres that already exist. Repositories that
+     * are already shown are skipped. Returns how many were added.
+     */
+    appendRepositories(repos) {
+        const added = repos.filter(repo => !this.repositoryIndexByName.has(repo.name));
+        if (added.length === 0) return 0;
+
+        const start = this.repositories.length;
+        this.setRepositories([...this.repositories, ...added]);
+
+        // Before the first build, init() renders the whole set
+        if (!this.scene || this.repositoryMeshes.length === 0) return added.length;
+
+        this.repositories.slice(start).forEach((repo, offset) => {
+            const sphere = this.createRepositorySphere(repo, start + offset);
+            this.scene.add(sphere);
+            this.repositoryMeshes.push(sphere);
+        });
+        this.createConnections();
+        this.rebuildFilters();
+        return added.length;
     }
 
     /**
@@ -269,24 +403,13 @@ async createConstellation() {
                     updated: new Date(2025, 8, Math.floor(rand4 * 28) + 1),
                     url: `https://github.com/welshDog/${repoName}`,
                     color: category.color,
-                    position: {
-                        x: (Math.random() - 0.5) * 80,
-                        y: (Math.random() - 0.5) * 60,
-                        z: (Math.random() - 0.5) * 40
-                    }
+                    position: this.hashedPosition(repoName)
                 };
 
                 repos.push(repo);
             });
         });
 
-        // FIX: Medium Issue #8 - Pre-compute lowercase search fields
-        this.repositoriesLowercase = repos.map(repo => ({
-            name: repo.name.toLowerCase(),
-            description: repo.description.toLowerCase(),
-            language: repo.language.toLowerCase()
-        }));
-
         return repos;
     }
 
@@ -310,6 +433,9 @@ async createConstellation() {
         // Add particle effects
         this.createParticleField();
 
+        // Index the new meshes and re-apply any active filters to them
+        this.rebuildFilters();
+
         console.log(`🌟 Created constellation with ${this.repositoryMeshes.length} repository spheres`);
     }
 
@@ -490,6 +616,7 @@ async createConstellation() {
         const particles = new THREE.Points(geometry, material);
         particles.userData.isParticles = true;
         this.scene.add(particles);
+        this.particleField = particles;
     }
 
     /**
@@ -1193,62 +1320,77 @@ document.addEventListener('visibilitychange', this.onVisibilityChange.bind(this)
     }
 
     /**
-     * Search repositories (FIX: Medium Issue #8 - Optimized search with pre-computed cache)
+     * Set (or clear, with null) one facet filter and apply the combination
      */
-    searchRepositories(query) {
-        if (!query) {
-            // Show all repositories
-            this.repositoryMeshes.forEach(mesh => {
-                mesh.visible = true;
-                mesh.material.opacity = 0.8;
-            });
-            return;
-        }
+    setFilter(facet, value) {
+        this.activeFilters[facet] = value;
+        if (facet === 'search') this.updateSearchMatches();
+        return this.applyFilters();
+    }
 
-        const searchTerm = query.toLowerCase();
-        const matchingIndexes = [];
+    /**
+     * Re-index the facets for the current repository order and re-apply the
+     * active filters; the search query is looked up again, since mesh
+     * indexes change when repositories are added, removed or reordered
+     */
+    rebuildFilters() {
+        this.facetFilter.build(this.repositories);
+        this.updateSearchMatches();
+        return this.applyFilters();
+    }
 
-        // Use pre-computed lowercase cache for faster searching
-        for (let i = 0; i < this.repositoriesLowercase.length; i++) {
-            const repo = this.repositoriesLowercase[i];
-            if (repo.name.includes(searchTerm) || 
-                repo.description.includes(searchTerm) || 
-                repo.language.includes(searchTerm)) {
-                matchingIndexes.push(i);
-            }
+    /**
+     * Resolve activeFilters.search to the mesh indexes of the matching
+     * repositories. Returns the matching names, best first.
+     */
+    updateSearchMatches() {
+        const query = this.activeFilters.search;
+        if (!query) {
+            this.searchMatches = null;
+            return [];
         }
+        const results = this.searchIndex.search(query);
+        this.searchMatches = results
+            .map(name => this.repositoryIndexByName.get(name))
+            .filter(index => index !== undefined);
+        return results;
+    }
 
-        // Update visibility based on search results
-        this.repositoryMeshes.forEach((mesh, index) => {
-            const isMatch = matchingIndexes.includes(index);
+    /**
+     * Intersect the active facet bitsets and update only the meshes whose
+     * visibility changed. Returns the number of visible repositories.
+     */
+    applyFilters() {
+        const changed = this.facetFilter.apply({ ...this.activeFilters, search: this.searchMatches });
+        changed.forEach(index => {
+            const mesh = this.repositoryMeshes[index];
+            if (!mesh) return;
+            const isMatch = this.facetFilter.isVisible(index);
             mesh.visible = isMatch;
             mesh.material.opacity = isMatch ? 0.8 : 0.2;
         });
+        return this.facetFilter.count();
+    }
 
-        console.log(`🔍 Search results: ${matchingIndexes.length} repositories found`);
-        this.announceToScreenReader(`Search complete. ${matchingIndexes.length} repositories found matching "${query}".`);
+    /**
+     * Search repositories (FIX: Medium Issue #8 - Ranked inverted-index search)
+     */
+    searchRepositories(query) {
+        this.activeFilters.search = query || null;
+        const results = this.updateSearchMatches();
+        this.applyFilters();
+        if (!query) return results;
+
+        console.log(`🔍 Search results: ${results.length} repositories found`);
+        this.announceToScreenReader(`Search complete. ${results.length} repositories found matching "${query}".`);
+        return results;
     }
 
     /**
-     * Filter by category
+     * Filter by category (combines with the search and other facet filters)
      */
     filterByCategory(categoryKey) {
-        if (categoryKey === 'all') {
-            // Show all repositories
-            this.repositoryMeshes.forEach(mesh => {
-                mesh.visible = true;
-                mesh.material.opacity = 0.8;
-            });
-        } else {
-            // Show only repositories in the selected category
-            this.repositoryMeshes.forEach(mesh => {
-                const repo = mesh.userData.repository;
-                const isInCategory = repo.category === categoryKey;
-
-                mesh.visible = isInCategory;
-                mesh.material.opacity = isInCategory ? 0.8 : 0.3;
-            });
-        }
+        this.setFilter('category', categoryKey === 'all' ? null : categoryKey);
 
         const categoryName = this.categories[categoryKey]?.name || 'All Repositories';
         console.log(`🗂️ Filtered to category: ${categoryName}`);
@@ -0,0 +1,151 @@
+/**
+ * 🗂️ Faceted Repository Filtering
+ * Bitset per facet value; filters combine by intersection
+ */
+
+// Days since the last update for each activity bucket (see calculateActivityScore)
+const FACET_ACTIVITY_BUCKETS = [['week', 7], ['month', 30], ['quarter', 90]];
+const FACET_ACTIVITY_FALLBACK = 'dormant';
+// Precomputed "at least N" thresholds; other values are computed once on demand
+const FACET_STAR_THRESHOLDS = [1, 10, 50, 100, 500, 1000];
+const FACET_FORK_THRESHOLDS = [1, 5, 10, 50, 100];
+const FACET_THRESHOLD_FIELDS = { minStars: 'stars', minForks: 'forks' };
+
+/**
+ * Keeps one bitset (a Uint32Array, bit i = repository i) per facet value.
+ * A query ANDs the facets together (values within one facet are ORed) and
+ * reports only the repositories whose visibility changed.
+ */
+class FacetFilter {
+    constructor() {
+        this.size = 0;
+        this.words = 0;
+        this.facets = new Map(); // facet -> Map(value -> bitset)
+        this.repositories = [];
+        this.visible = new Uint32Array(0);
+    }
+
+    /**
+     * Index `repos` (mesh order); everything starts out visible
+     */
+    build(repos, now = Date.now()) {
+        this.size = repos.length;
+        this.words = Math.ceil(this.size / 32);
+        this.facets = new Map();
+        this.repositories = repos;
+        this.visible = this.allBits();
+
+        repos.forEach((repo, index) => {
+            this.addToFacet('category', repo.category, index);
+            this.addToFacet('language', repo.language, index);
+            (repo.topics || []).forEach(topic => this.addToFacet('topic', topic, index));
+            this.addToFacet('activity', FacetFilter.activityBucket(repo, now), index);
+            FACET_STAR_THRESHOLDS.forEach(threshold => {
+                if ((repo.stars || 0) >= threshold) this.addToFacet('minStars', threshold, index);
+            });
+            FACET_FORK_THRESHOLDS.forEach(threshold => {
+                if ((repo.forks || 0) >= threshold) this.addToFacet('minForks', threshold, index);
+            });
+        });
+        // Thresholds nobody reaches still need an (empty) bitset
+        FACET_STAR_THRESHOLDS.forEach(threshold => this.bitset('minStars', threshold));
+        FACET_FORK_THRESHOLDS.forEach(threshold => this.bitset('minForks', threshold));
+    }
+
+    static activityBucket(repo, now = Date.now()) {
+        const days = (now - new Date(repo.updated).getTime()) / (1000 * 60 * 60 * 24);
+        const bucket = FACET_ACTIVITY_BUCKETS.find(([, limit]) => days < limit);
+        return bucket ? bucket[0] : FACET_ACTIVITY_FALLBACK;
+    }
+
+    allBits() {
+        const bits = new Uint32Array(this.words).fill(0xffffffff);
+        if (this.size % 32) bits[this.words - 1] = (1 << (this.size % 32)) - 1;
+        return bits;
+    }
+
+    bitset(facet, value) {
+        if (!this.facets.has(facet)) this.facets.set(facet, new Map());
+        const values = this.facets.get(facet);
+        if (!values.has(value)) values.set(value, new Uint32Array(this.words));
+        return values.get(value);
+    }
+
+    addToFacet(facet, value, index) {
+        if (value === undefined || value === null || value === '') return;
+        this.bitset(facet, value)[index >>> 5] |= 1 << (index & 31);
+    }
+
+    /**
+     * Bitset for one facet filter; arrays of values are ORed together
+     */
+    facetBits(facet, value) {
+        if (facet === 'search') {
+            // Search results arrive as repository indexes
+            const bits = new Uint32Array(this.words);
+            for (const index of value) bits[index >>> 5] |= 1 << (index & 31);
+            return bits;
+        }
+        if (facet in FACET_THRESHOLD_FIELDS && !this.facets.get(facet)?.has(value)) {
+            const field = FACET_THRESHOLD_FIELDS[facet];
+            this.repositories.forEach((repo, index) => {
+                if ((repo[field] || 0) >= value) this.addToFacet(facet, value, index);
+            });
+            return this.bitset(facet, value);
+        }
+
+        const values = this.facets.get(facet) || new Map();
+        if (!Array.isArray(value)) return values.get(value) || new Uint32Array(this.words);
+        const bits = new Uint32Array(this.words);
+        value.forEach(item => {
+            const itemBits = values.get(item);
+            if (!itemBits) return;
+            for (let word = 0; word < this.words; word++) bits[word] |= itemBits[word];
+        });
+        return bits;
+    }
+
+    /**
+     * Apply `filters` ({ facet: value | [values] }, null/undefined = no
+     * filter) and return the indexes whose visibility changed
+     */
+    apply(filters) {
+        const next = this.allBits();
+        for (const [facet, value] of Object.entries(filters)) {
+            if (value === null || value === undefined) continue;
+            const bits = this.facetBits(facet, value);
+            for (let word = 0; word < this.words; word++) next[word] &= bits[word];
+        }
+
+        const changed = [];
+        for (let word = 0; word < this.words; word++) {
+            let delta = (next[word] ^ this.visible[word]) >>> 0;
+            while (delta) {
+                const bit = 31 - Math.clz32(delta);
+                changed.push(word * 32 + bit);
+                delta = (delta & ~(1 << bit)) >>> 0;
+            }
+        }
+        this.visible = next;
+        return changed;
+    }
+
+    isVisible(index) {
+        return (this.visible[index >>> 5] & (1 << (index & 31))) !== 0;
+    }
+
+    count() {
+        let total = 0;
+        for (let word = 0; word < this.words; word++) {
+            let bits = this.visible[word];
+            while (bits) {
+                bits &= bits - 1;
+                total++;
+            }
+        }
+        return total;
+    }
+}
+
+// Export the facet filter
+window.FacetFilter = FacetFilter;
@@ -0,0 +1,185 @@
+"""Performance budget gate for the Ultimate Hyperfocus Constellation.
+
+Reads the measured ``build-manifest.json`` and fails when a module, or the
+critical-path JS/CSS as a whole, exceeds the raw/gzip limits configured in
+``perf-budget.json`` or grows by more than the allowed percentage compared
+with the manifest from a previous commit.
+
+Limits are raised in a commit of their own, never alongside the feature
+that needs the room, and every module or critical-path limit above the
+original budget records why in a ``reason`` field (ignored by the gate).
+"""
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from build_manifest import MANIFEST_NAME, format_kb, load_manifest, total_sizes
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+PROJECT_ROOT = Path(__file__).resolve().parent
+BUDGET_FILE = "perf-budget.json"
+LIMIT_FIELDS = ("bytes", "gzip_bytes")
+INDENT = "    "
+
+logger = logging.getLogger(__name__)
+
+
+def load_budget(path: Path) -> Dict[str, Any]:
+    """Load the budget configuration.
+
+    Raises:
+        ValueError: If the file is missing or is not valid JSON.
+    """
+    try:
+        with open(path, encoding="utf-8") as budget_file:
+            return json.load(budget_file)
+    except OSError as error:
+        raise ValueError(f"Could not read budget file {path}: {error}") from error
+    except ValueError as error:
+        raise ValueError(f"Invalid budget file {path}: {error}") from error
+
+
+def load_baseline_from_git(ref: str, manifest_path: str = MANIFEST_NAME,
+                           cwd: Path = PROJECT_ROOT) -> Optional[Dict[str, Any]]:
+    """Read the manifest as it was committed at ``ref``.
+
+    Returns:
+        The parsed manifest, or None when git is unavailable or the manifest
+        does not exist at that revision.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "show", f"{ref}:{manifest_path}"],
+            cwd=cwd, capture_output=True, text=True, check=True,
+        )
+        return json.loads(result.stdout)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def _limit_violations(label: str, sizes: Dict[str, int],
+                      limits: Dict[str, int]) -> List[str]:
+    """Compare measured sizes with absolute limits."""
+    violations = []
+    for field in LIMIT_FIELDS:
+        limit = limits.get(field)
+        if limit is not None and sizes.get(field, 0) > limit:
+            violations.append(
+                f"{label}: {field} {format_kb(sizes[field])} exceeds budget of {format_kb(limit)}"
+            )
+    return violations
+
+
+def _growth_violations(label: str, sizes: Dict[str, int], previous: Dict[str, int],
+                       max_growth_percent: float) -> List[str]:
+    """Compare measured sizes with a baseline and flag excessive growth."""
+    violations = []
+    for field in LIMIT_FIELDS:
+        before = previous.get(field)
+        if not before:
+            continue
+        growth = (sizes.get(field, 0) - before) / before * 100
+        if growth > max_growth_percent:
+            violations.append(
+                f"{label}: {field} grew {growth:.1f}% "
+                f"({format_kb(before)} -> {format_kb(sizes[field])}), "
+                f"limit is {max_growth_percent:g}%"
+            )
+    return violations
+
+
+def check_budget(manifest: Dict[str, Any], budget: Dict[str, Any],
+                 baseline: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Check a manifest against a budget and an optional baseline manifest.
+
+    Args:
+        manifest: The manifest of the current build.
+        budget: The budget configuration (see ``perf-budget.json``).
+        baseline: The manifest of a previous build to compute growth against.
+
+    Returns:
+        A list of human readable violations; empty when the build is within
+        budget.
+    """
+    artifacts = manifest.get("artifacts", {})
+    previous_artifacts = (baseline or {}).get("artifacts", {})
+    default_limits = budget.get("default", {})
+    module_limits = budget.get("modules", {})
+    max_growth = budget.get("max_growth_percent")
+    violations = []
+
+    for name, sizes in sorted(artifacts.items()):
+        if not name.endswith((".js", ".css")):
+            continue
+        violations += _limit_violations(name, sizes, module_limits.get(name, default_limits))
+        if max_growth is not None and name in previous_artifacts:
+            violations += _growth_violations(name, sizes, previous_artifacts[name], max_growth)
+
+    critical_path = budget.get("critical_path")
+    if critical_path:
+        files = critical_path.get("files", [])
+        violations += [f"critical path: {name} is missing from the manifest"
+                       for name in files if name not in artifacts]
+        totals = total_sizes(artifacts[name] for name in files if name in artifacts)
+        violations += _limit_violations("critical path", totals, critical_path)
+        if max_growth is not None and previous_artifacts:
+            previous_totals = total_sizes(
+                previous_artifacts[name] for name in files if name in previous_artifacts
+            )
+            violations += _growth_violations("critical path", totals, previous_totals, max_growth)
+
+    return violations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns 1 when the budget is exceeded."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--manifest", type=Path, default=PROJECT_ROOT / MANIFEST_NAME,
+                        help="manifest of the current build")
+    parser.add_argument("--budget", type=Path, default=PROJECT_ROOT / BUDGET_FILE,
+                        help="budget configuration file")
+    parser.add_argument("--baseline", type=Path, default=None,
+                        help="baseline manifest file (overrides --baseline-ref)")
+    parser.add_argument("--baseline-ref", default="HEAD",
+                        help="git revision whose committed manifest is the baseline")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    manifest = load_manifest(args.manifest)
+    if manifest is None:
+        logger.error(f"❌ No manifest at {args.manifest} - run build.py first")
+        return 1
+    try:
+        budget = load_budget(args.budget)
+    except ValueError as error:
+        logger.error(f"❌ {error}")
+        return 1
+
+    if args.baseline is not None:
+        baseline = load_manifest(args.baseline)
+    else:
+        baseline = load_baseline_from_git(args.baseline_ref)
+    if baseline is None:
+        logger.info("ℹ️ No baseline manifest found, skipping growth checks")
+
+    violations = check_budget(manifest, budget, baseline)
+    if violations:
+        logger.error(f"❌ Performance budget exceeded ({len(violations)} violations):")
+        for violation in violations:
+            logger.error(f"{INDENT}{violation}")
+        return 1
+
+    logger.info("✅ All artifacts are within the performance budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
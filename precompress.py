@@ -0,0 +1,58 @@
+"""Precompressed asset variants for the Ultimate Hyperfocus Constellation.
+
+Produces max-level gzip (``.gz``) and deflate (``.zz``) siblings for the
+shipped JS/CSS/JSON/HTML so static hosts can serve precompressed bytes
+instead of compressing on every request. Only the standard library is used.
+Output is deterministic (no gzip timestamp or file name), so an unchanged
+asset always yields byte-identical siblings.
+"""
+
+import gzip
+import zlib
+from typing import Dict
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+COMPRESSION_LEVEL = 9
+COMPRESSIBLE_SUFFIXES = (".js", ".css", ".json", ".html")
+SIBLING_SUFFIXES = (".gz", ".zz")
+# Variants must be at least this small, relative to the raw file, to pay off
+MAX_COMPRESSED_RATIO = 0.9
+# Files below this size fit in one packet either way
+MIN_COMPRESSIBLE_BYTES = 1024
+
+
+def gzip_compress(data: bytes) -> bytes:
+    """Gzip ``data`` at maximum level with a zeroed header timestamp."""
+    return gzip.compress(data, compresslevel=COMPRESSION_LEVEL, mtime=0)
+
+
+def deflate_compress(data: bytes) -> bytes:
+    """Deflate ``data`` at maximum level (zlib wrapper, as HTTP expects)."""
+    return zlib.compress(data, COMPRESSION_LEVEL)
+
+
+def pays_off(raw_size: int, compressed_size: int) -> bool:
+    """Return True when serving the compressed variant is worth it."""
+    return (raw_size >= MIN_COMPRESSIBLE_BYTES
+            and compressed_size <= raw_size * MAX_COMPRESSED_RATIO)
+
+
+def compressed_variants(data: bytes) -> Dict[str, bytes]:
+    """Compress ``data`` and keep only the variants that pay off.
+
+    Args:
+        data: The raw asset bytes.
+
+    Returns:
+        A mapping of sibling suffix (``.gz`` / ``.zz``) to compressed bytes.
+    """
+    variants = {".gz": gzip_compress(data), ".zz": deflate_compress(data)}
+    return {suffix: payload for suffix, payload in variants.items()
+            if pays_off(len(data), len(payload))}
+
+
+def is_compressible(name: str) -> bool:
+    """Return True for asset types that get precompressed siblings."""
+    return name.endswith(COMPRESSIBLE_SUFFIXES)
@@ -0,0 +1,241 @@
+"""Deterministic build-time 3D layout for the Ultimate Hyperfocus Constellation.
+
+Reads the ``data/repos.json`` snapshot written by ``repo_snapshot.py`` and
+computes stable, non-overlapping sphere positions with a vectorised
+force-directed layout over the category graph: repositories in the same
+category attract each other and their category centre, every pair repels,
+and a final pass pushes apart spheres whose glow would overlap. The result
+is fitted to, and clamped inside, the volume the engine renders.
+
+Positions are written to ``data/layout.bin`` as packed little-endian
+Float32 triples behind a 16-byte header, so the engine can wrap the response
+in a ``Float32Array`` without parsing. Requires NumPy (``pip install numpy``);
+the engine falls back to name-hashed positions when no layout is deployed.
+
+Binary format::
+
+    bytes 0-3    magic  b"UHCL"
+    bytes 4-7    uint32 format version
+    bytes 8-11   uint32 repository count
+    bytes 12-15  uint32 FNV-1a hash of the snapshot names joined with "\\n"
+    bytes 16-    float32 x, y, z per repository, in snapshot order
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import struct
+import sys
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, only needed to compute layouts
+    np = None
+
+from categoriser import CATEGORY_ORDER
+from repo_snapshot import SNAPSHOT_PATH, names_hash
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+PROJECT_ROOT = Path(__file__).resolve().parent
+LAYOUT_PATH = Path("data") / "layout.bin"
+LAYOUT_MAGIC = b"UHCL"
+LAYOUT_VERSION = 1
+HEADER_FORMAT = "<4sIII"
+# Half extents of the volume the engine scatters repositories in
+HALF_EXTENTS = (40.0, 30.0, 20.0)
+# Must match MIN_SPHERE_SIZE / STAR_SIZE_MULTIPLIER in constellation-engine.js
+MIN_SPHERE_SIZE = 0.5
+STAR_SIZE_MULTIPLIER = 0.3
+GLOW_SCALE = 1.5
+SPHERE_GAP = 0.5
+CLUSTER_RADIUS = 25.0
+IDEAL_EDGE_LENGTH = 6.0
+CENTRE_GRAVITY = 0.05
+ITERATIONS = 300
+COOLING = 0.98
+OVERLAP_PASSES = 200
+OVERLAP_TOLERANCE = 1e-3
+# Rows per pairwise block; bounds memory to BLOCK_SIZE * n * 3 floats
+BLOCK_SIZE = 256
+
+logger = logging.getLogger(__name__)
+
+
+def sphere_radii(stars: "np.ndarray") -> "np.ndarray":
+    """Glow radius of each sphere, using the engine's sizing rule."""
+    size = np.maximum(MIN_SPHERE_SIZE, np.log(stars + 1.0) * STAR_SIZE_MULTIPLIER)
+    return size * GLOW_SCALE
+
+
+def seed_offsets(names: List[str]) -> "np.ndarray":
+    """Deterministic per-name jitter in ``[-0.5, 0.5)``, stable across runs."""
+    offsets = np.empty((len(names), 3))
+    for row, name in enumerate(names):
+        digest = hashlib.sha256(name.encode("utf-8")).digest()
+        offsets[row] = np.frombuffer(digest[:12], dtype="<u4") / 2.0 ** 32 - 0.5
+    return offsets
+
+
+def category_centres(count: int) -> "np.ndarray":
+    """Spread ``count`` cluster centres evenly over a sphere (Fibonacci lattice)."""
+    index = np.arange(count) + 0.5
+    polar = np.arccos(1.0 - 2.0 * index / max(count, 1))
+    azimuth = np.pi * (1.0 + 5.0 ** 0.5) * index
+    return CLUSTER_RADIUS * np.column_stack([
+        np.cos(azimuth) * np.sin(polar),
+        np.sin(azimuth) * np.sin(polar),
+        np.cos(polar),
+    ])
+
+
+def _pairwise_forces(positions: "np.ndarray", same: "np.ndarray") -> "np.ndarray":
+    """Net repulsion + intra-category attraction on every node."""
+    displacement = np.zeros_like(positions)
+    for start in range(0, len(positions), BLOCK_SIZE):
+        stop = start + BLOCK_SIZE
+        delta = positions[start:stop, None, :] - positions[None, :, :]
+        distance = np.maximum(np.linalg.norm(delta, axis=2), 1e-6)
+        repulsion = IDEAL_EDGE_LENGTH ** 2 / distance
+        attraction = np.where(same[start:stop], distance ** 2 / IDEAL_EDGE_LENGTH, 0.0)
+        displacement[start:stop] = np.einsum(
+            "ijk,ij->ik", delta, (repulsion - attraction) / distance)
+    return displacement
+
+
+def remove_overlaps(positions: "np.ndarray", radii: "np.ndarray",
+                    bounds: Optional["np.ndarray"] = None) -> "np.ndarray":
+    """Push apart spheres closer than the sum of their radii plus a gap.
+
+    With ``bounds`` (half extents per axis), every pass clamps the centres
+    to the box, so spheres pushed against a wall move the others instead.
+    """
+    positions = positions.copy()
+    for _ in range(OVERLAP_PASSES):
+        worst = 0.0
+        push = np.zeros_like(positions)
+        for start in range(0, len(positions), BLOCK_SIZE):
+            stop = start + BLOCK_SIZE
+            delta = positions[start:stop, None, :] - positions[None, :, :]
+            rows = np.arange(len(delta))
+            # Spheres clamped into the same corner coincide; split them
+            # along the diagonal, the lower index towards the negative side
+            order = np.sign(start + rows[:, None] - np.arange(len(positions))[None, :])
+            coincident = np.linalg.norm(delta, axis=2) < 1e-6
+            delta[coincident] = order[coincident, None] * 1e-6
+            distance = np.maximum(np.linalg.norm(delta, axis=2), 1e-6)
+            overlap = np.clip(radii[start:stop, None] + radii[None, :] + SPHERE_GAP - distance, 0.0, None)
+            overlap[rows, start + rows] = 0.0
+            worst = max(worst, float(overlap.max(initial=0.0)))
+            push[start:stop] = np.einsum("ijk,ij->ik", delta, overlap / (2.0 * distance))
+        if worst < OVERLAP_TOLERANCE:
+            break
+        positions += push
+        if bounds is not None:
+            np.clip(positions, -bounds, bounds, out=positions)
+    return positions
+
+
+def fit_to_volume(positions: "np.ndarray") -> "np.ndarray":
+    """Centre the layout and scale each axis to fill the engine's volume."""
+    if len(positions) == 0:
+        return positions
+    centred = positions - (positions.max(axis=0) + positions.min(axis=0)) / 2.0
+    extent = np.abs(centred).max(axis=0)
+    scales = np.divide(HALF_EXTENTS, extent, out=np.ones(3), where=extent > 0)
+    return centred * scales
+
+
+def compute_layout(repositories: List[Dict[str, Any]],
+                   iterations: int = ITERATIONS) -> "np.ndarray":
+    """Compute positions for the snapshot repositories.
+
+    Args:
+        repositories: Entries from ``data/repos.json`` (need ``name``,
+            ``category`` and ``stars``).
+        iterations: Force-directed iterations to run.
+
+    Returns:
+        An ``(n, 3)`` float32 array of positions in snapshot order.
+    """
+    names = [repo["name"] for repo in repositories]
+    if not names:
+        return np.zeros((0, 3), dtype=np.float32)
+
+    order = list(CATEGORY_ORDER)
+    for repo in repositories:
+        if repo["category"] not in order:
+            order.append(repo["category"])
+    category = np.array([order.index(repo["category"]) for repo in repositories])
+    centres = category_centres(len(order))[category]
+    same = category[:, None] == category[None, :]
+
+    positions = centres + seed_offsets(names) * IDEAL_EDGE_LENGTH
+    temperature = IDEAL_EDGE_LENGTH
+    for _ in range(iterations):
+        displacement = _pairwise_forces(positions, same) + CENTRE_GRAVITY * (centres - positions)
+        length = np.maximum(np.linalg.norm(displacement, axis=1, keepdims=True), 1e-9)
+        positions += displacement / length * np.minimum(length, temperature)
+        temperature *= COOLING
+
+    stars = np.array([repo.get("stars") or 0 for repo in repositories], dtype=float)
+    radii = sphere_radii(stars)
+    bounds = np.array(HALF_EXTENTS)
+    # Spread the spheres apart at the layout's own scale, then fit them to
+    # the engine's volume and settle any overlaps the fit reintroduced
+    # without leaving it.
+    positions = remove_overlaps(positions, radii)
+    positions = remove_overlaps(fit_to_volume(positions), radii, bounds)
+    return np.clip(positions, -bounds, bounds).astype(np.float32)
+
+
+def render_layout(names: List[str], positions: "np.ndarray") -> bytes:
+    """Pack positions behind the layout header."""
+    header = struct.pack(HEADER_FORMAT, LAYOUT_MAGIC, LAYOUT_VERSION, len(names), names_hash(names))
+    return header + positions.astype("<f4").tobytes()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--snapshot", type=Path, default=PROJECT_ROOT / SNAPSHOT_PATH,
+                        help=f"snapshot to lay out (default: {SNAPSHOT_PATH})")
+    parser.add_argument("--output", type=Path, default=PROJECT_ROOT / LAYOUT_PATH,
+                        help=f"layout file to write (default: {LAYOUT_PATH})")
+    parser.add_argument("--iterations", type=int, default=ITERATIONS,
+                        help="force-directed iterations")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if np is None:
+        logger.error("❌ NumPy is required to compute layouts: pip install numpy")
+        return 1
+    try:
+        with open(args.snapshot, encoding="utf-8") as snapshot_file:
+            repositories = json.load(snapshot_file)["repositories"]
+    except (OSError, ValueError, KeyError) as error:
+        logger.error(f"❌ Could not read snapshot {args.snapshot}: {error}")
+        return 1
+
+    names = [repo["name"] for repo in repositories]
+    content = render_layout(names, compute_layout(repositories, args.iterations))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        unchanged = args.output.read_bytes() == content
+    except OSError:
+        unchanged = False
+    if unchanged:
+        logger.info(f"✅ {args.output} unchanged ({len(names)} positions)")
+    else:
+        args.output.write_bytes(content)
+        logger.info(f"🧭 Wrote {len(names)} positions to {args.output} ({len(content):,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
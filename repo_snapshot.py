@@ -0,0 +1,233 @@
+"""Offline repository snapshot compiler for the Ultimate Hyperfocus Constellation.
+
+Takes a saved GitHub ``/users/<name>/repos`` JSON dump (or pages fetched from
+a GitHub-compatible stand-in API), applies the same rules as
+``GitHubAPIManager.transformRepositoryData`` - categories come from the
+matcher shared through ``categoriser.py`` - and writes a compact
+``data/repos.json`` snapshot. The engine renders the
+snapshot immediately on load and reconciles it with live API data in the
+background, so first paint no longer waits on GitHub latency or rate limits.
+The search index for the snapshot (see ``search_index.py``) is written
+alongside it.
+
+Output is deterministic: the same input always produces identical bytes.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from categoriser import CATEGORY_COLORS, categorize
+from search_index import render_index
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+PROJECT_ROOT = Path(__file__).resolve().parent
+SNAPSHOT_PATH = Path("data") / "repos.json"
+SEARCH_INDEX_PATH = Path("data") / "search-index.json"
+SNAPSHOT_VERSION = 1
+USERNAME = "welshDog"
+PER_PAGE = 100
+MAX_PAGES = 50
+REQUEST_TIMEOUT_SECONDS = 30
+DEFAULT_LANGUAGE = "Multiple"
+FNV_OFFSET = 0x811C9DC5
+FNV_PRIME = 0x01000193
+
+logger = logging.getLogger(__name__)
+
+
+def names_hash(names: List[str]) -> int:
+    """FNV-1a (32-bit) over the UTF-8 names joined by newlines.
+
+    Files compiled from a snapshot (layout, search index) carry this hash;
+    ``GitHubAPIManager.namesHash`` mirrors it so the engine can reject
+    files compiled for a different snapshot.
+    """
+    value = FNV_OFFSET
+    for byte in "\n".join(names).encode("utf-8"):
+        value = ((value ^ byte) * FNV_PRIME) & 0xFFFFFFFF
+    return value
+
+
+def transform_repository(repo: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert one raw GitHub repository into the constellation format.
+
+    Positions are left out: the engine lays out repositories that arrive
+    without one.
+    """
+    category = categorize(repo)
+    return {
+        "id": repo.get("id"),
+        "name": repo["name"],
+        "description": (repo.get("description")
+                        or f"Advanced {category} project with neurodivergent-friendly design."),
+        "category": category,
+        "stars": repo.get("stargazers_count") or 0,
+        "forks": repo.get("forks_count") or 0,
+        "language": repo.get("language") or DEFAULT_LANGUAGE,
+        "updated": repo.get("updated_at"),
+        "url": repo.get("html_url"),
+        "demo_url": repo.get("homepage") or None,
+        "color": CATEGORY_COLORS[category],
+        "topics": repo.get("topics") or [],
+    }
+
+
+def transform_repositories(repos: List[Dict[str, Any]],
+                           username: str = USERNAME) -> List[Dict[str, Any]]:
+    """Apply ``transformRepositoryData`` rules to a list of raw repositories.
+
+    Dot-prefixed repositories and the profile repository (named after the
+    user) are dropped; duplicates from overlapping page dumps are skipped.
+    The result is sorted by name: the API lists repositories by last
+    update, and the snapshot (with the layout and index compiled from it)
+    should only change when the repositories do.
+    """
+    seen = set()
+    transformed = []
+    for repo in repos:
+        key = repo.get("id", repo.get("name"))
+        if key in seen:
+            continue
+        seen.add(key)
+        entry = transform_repository(repo)
+        if entry["name"].startswith(".") or entry["name"] == username:
+            continue
+        transformed.append(entry)
+    return sorted(transformed, key=lambda entry: (entry["name"].lower(), entry["name"]))
+
+
+def load_dump(paths: List[Path]) -> List[Dict[str, Any]]:
+    """Read raw repositories from one or more saved API responses.
+
+    Each file may hold a single page (a JSON list) or a list of pages.
+
+    Raises:
+        ValueError: If a file cannot be read or does not hold repositories.
+    """
+    repos = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as dump_file:
+                data = json.load(dump_file)
+        except OSError as error:
+            raise ValueError(f"Could not read dump {path}: {error}") from error
+        except ValueError as error:
+            raise ValueError(f"Invalid dump {path}: {error}") from error
+        if not isinstance(data, list):
+            raise ValueError(f"Invalid dump {path}: expected a JSON list of repositories")
+        for item in data:
+            repos.extend(item if isinstance(item, list) else [item])
+    return repos
+
+
+def fetch_repositories(api_url: str, username: str = USERNAME,
+                       per_page: int = PER_PAGE) -> List[Dict[str, Any]]:
+    """Fetch every page of ``/users/<username>/repos`` from a GitHub-compatible API.
+
+    Args:
+        api_url: Base URL, e.g. ``https://api.github.com`` or a local stand-in.
+        username: Account whose repositories are listed.
+        per_page: Page size to request.
+
+    Raises:
+        ValueError: If a page cannot be fetched or parsed.
+    """
+    repos = []
+    for page in range(1, MAX_PAGES + 1):
+        url = (f"{api_url.rstrip('/')}/users/{username}/repos"
+               f"?per_page={per_page}&sort=updated&page={page}")
+        request = urllib.request.Request(url, headers={
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": f"Ultimate-Hyperfocus-Constellation/{__version__}",
+        })
+        try:
+            with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT_SECONDS) as response:
+                batch = json.load(response)
+        except (urllib.error.URLError, OSError, ValueError) as error:
+            raise ValueError(f"Could not fetch {url}: {error}") from error
+        if not isinstance(batch, list):
+            raise ValueError(f"Unexpected response from {url}: expected a JSON list")
+        repos.extend(batch)
+        if len(batch) < per_page:
+            break
+    return repos
+
+
+def render_snapshot(repositories: List[Dict[str, Any]], username: str = USERNAME) -> bytes:
+    """Serialise the snapshot as compact, key-sorted JSON."""
+    snapshot = {"version": SNAPSHOT_VERSION, "username": username, "repositories": repositories}
+    return (json.dumps(snapshot, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+            + "\n").encode("utf-8")
+
+
+def write_output(path: Path, content: bytes) -> bool:
+    """Write ``content`` to ``path`` unless it is already identical.
+
+    Returns:
+        True when the file was (re)written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if path.read_bytes() == content:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(content)
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", type=Path, nargs="+",
+                        help="saved /users/<name>/repos JSON dump(s)")
+    source.add_argument("--api-url",
+                        help="GitHub-compatible API base URL to fetch pages from")
+    parser.add_argument("--username", default=USERNAME,
+                        help=f"account whose repositories are listed (default: {USERNAME})")
+    parser.add_argument("--output", type=Path, default=PROJECT_ROOT / SNAPSHOT_PATH,
+                        help=f"snapshot file to write (default: {SNAPSHOT_PATH})")
+    parser.add_argument("--index-output", type=Path, default=None,
+                        help=f"search index to write (default: {SEARCH_INDEX_PATH.name} "
+                             "next to the snapshot)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    try:
+        if args.input:
+            raw = load_dump(args.input)
+        else:
+            raw = fetch_repositories(args.api_url, args.username)
+    except ValueError as error:
+        logger.error(f"❌ {error}")
+        return 1
+
+    repositories = transform_repositories(raw, args.username)
+    content = render_snapshot(repositories, args.username)
+    if write_output(args.output, content):
+        logger.info(f"📸 Wrote {len(repositories)} repositories to {args.output} "
+                    f"({len(content):,} bytes)")
+    else:
+        logger.info(f"✅ {args.output} unchanged ({len(repositories)} repositories)")
+
+    index_output = args.index_output or args.output.with_name(SEARCH_INDEX_PATH.name)
+    index = render_index(repositories, names_hash([repo["name"] for repo in repositories]))
+    if write_output(index_output, index):
+        logger.info(f"🔍 Wrote search index to {index_output} ({len(index):,} bytes)")
+    else:
+        logger.info(f"✅ {index_output} unchanged")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,346 @@
 # Create enhanced GitHub API integration with caching
+from categoriser import MATCHER_PLACEHOLDER, render_matcher
+
 github_api_integration = '''/**
  * 🔗 GitHub API Integration with Smart Caching
  * Real-time repository data with rate limit respect
  */
 
+// Compiled from the rules in categoriser.py when this file is generated
+const CATEGORY_MATCHER = __CATEGORY_MATCHER__;
+const CATEGORY_CHAR_CLASSES = githubCharClasses(CATEGORY_MATCHER.alphabet);
+
+/*
+ * Pure helpers below run both here and in the fetch worker, which is built
+ * from their source (GITHUB_WORKER_SOURCE), so they may only use their
+ * arguments, CATEGORY_MATCHER, CATEGORY_CHAR_CLASSES and each other.
+ */
+
+/**
+ * ASCII code -> matcher column (0 for characters no keyword uses)
+ */
+function githubCharClasses(alphabet) {
+    const classes = new Uint8Array(128);
+    Array.from(alphabet).forEach((char, index) => {
+        classes[char.charCodeAt(0)] = index + 1;
+    });
+    return classes;
+}
+
+/**
+ * Pick a category with the shared Aho-Corasick matcher: one pass per
+ * field, each distinct keyword scores its category by field weight and
+ * ties go to the keyword listed first (see categoriser.py)
+ */
+function githubCategorize(repo) {
+    const { delta, output, keywordCategory, weights } = CATEGORY_MATCHER;
+    const width = CATEGORY_MATCHER.alphabet.length + 1;
+    const scores = new Map(); // category index -> [score, earliest keyword]
+    
+    for (const [field, weight] of Object.entries(weights)) {
+        const value = repo[field] || '';
+        const text = (Array.isArray(value) ? value.join(' ') : value).toLowerCase();
+        const found = new Set();
+        let state = 0;
+        
+        for (let i = 0; i < text.length; i++) {
+            const code = text.charCodeAt(i);
+            state = delta[state * width + (code < 128 ? CATEGORY_CHAR_CLASSES[code] : 0)];
+            for (const keyword of output[state]) found.add(keyword);
+        }
+        
+        for (const keyword of found) {
+            const category = keywordCategory[keyword];
+            const score = scores.get(category) || [0, keyword];
+            score[0] += weight;
+            score[1] = Math.min(score[1], keyword);
+            scores.set(category, score);
+        }
+    }
+    
+    let best = null;
+    for (const [category, [score, keyword]] of scores) {
+        if (!best || score > best[1] || (score === best[1] && keyword < best[2])) {
+            best = [category, score, keyword];
+        }
+    }
+    return best ? CATEGORY_MATCHER.categories[best[0]] : CATEGORY_MATCHER.defaultCategory;
+}
+
+/**
+ * Activity score (0-100) of a raw GitHub repository
+ */
+function githubActivityScore(repo) {
+    const now = Date.now();
+    const updated = new Date(repo.updated_at).getTime();
+    const daysSinceUpdate = (now - updated) / (1000 * 60 * 60 * 24);
+    
+    let score = 0;
+    
+    // Recent activity bonus
+    if (daysSinceUpdate < 7) score += 50;
+    else if (daysSinceUpdate < 30) score += 30;
+    else if (daysSinceUpdate < 90) score += 10;
+    
+    // Stars and forks contribution
+    score += Math.min(repo.stargazers_count * 2, 30);
+    score += Math.min(repo.forks_count * 3, 20);
+    
+    // Language diversity (if we have topics)
+    if (repo.topics && repo.topics.length > 0) {
+        score += Math.min(repo.topics.length * 5, 25);
+    }
+    
+    return Math.min(score, 100);
+}
+
+/**
+ * Transform raw GitHub repositories to constellation format
+ */
+function githubTransformRepositories(repos, username) {
+    return repos
+        .filter(repo => !repo.name.startsWith('.') && repo.name !== username)
+        .map(repo => {
+            const category = githubCategorize(repo);
+            return {
+                id: repo.id,
+                name: repo.name,
+                description: repo.description || `Advanced ${category} project with neurodivergent-friendly design.`,
+                category: category,
+                stars: repo.stargazers_count || 0,
+                forks: repo.forks_count || 0,
+                language: repo.language || 'Multiple',
+                updated: new Date(repo.updated_at),
+                url: repo.html_url,
+                demo_url: repo.homepage || null,
+                color: CATEGORY_MATCHER.colors[category],
+                topics: repo.topics || [],
+                activity: githubActivityScore(repo)
+            };
+        });
+}
+
+/**
+ * Worker entry point: fetch, parse and (for repository list pages)
+ * transform and score. Transformed pages come back as plain records plus
+ * typed-array columns (stars, forks, activity, updated) whose buffers are
+ * transferred rather than copied.
+ */
+function githubWorkerMain(scope) {
+    scope.onmessage = async (event) => {
+        const { id, url, init, transform, username } = event.data;
+        try {
+            const response = await fetch(url, init);
+            const headers = {};
+            response.headers.forEach((value, name) => { headers[name] = value; });
+            
+            const result = { id, status: response.status, ok: response.ok, headers };
+            const transfer = [];
+            if (response.ok && response.status !== 304) {
+                const data = await response.json();
+                if (transform) {
+                    const repos = githubTransformRepositories(data, username);
+                    result.columns = {
+                        stars: Uint32Array.from(repos, repo => repo.stars),
+                        forks: Uint32Array.from(repos, repo => repo.forks),
+                        activity: Uint8Array.from(repos, repo => repo.activity),
+                        updated: Float64Array.from(repos, repo => repo.updated.getTime())
+                    };
+                    result.records = repos.map(({ stars, forks, activity, updated, ...record }) => record);
+                    transfer.push(...Object.values(result.columns).map(column => column.buffer));
+                } else {
+                    result.data = data;
+                }
+            }
+            scope.postMessage(result, transfer);
+        } catch (error) {
+            scope.postMessage({ id, error: error.message });
+        }
+    };
+}
+
+const GITHUB_WORKER_SOURCE = [
+    `const CATEGORY_MATCHER = ${JSON.stringify(CATEGORY_MATCHER)};`,
+    githubCharClasses,
+    'const CATEGORY_CHAR_CLASSES = githubCharClasses(CATEGORY_MATCHER.alphabet);',
+    githubCategorize,
+    githubActivityScore,
+    githubTransformRepositories,
+    githubWorkerMain,
+    'githubWorkerMain(self);'
+].join('\\n');
+
+// Request priority lanes, in dispatch order: clicks, first paint, prefetch/pagination
+const REQUEST_LANES = ['interactive', 'normal', 'background'];
+const RATE_LIMIT_WINDOW = 60 * 60 * 1000; // GitHub resets its budget hourly
+
+// Fields getRepositoryDetails needs, fetched for many repositories per query
+const REPOSITORY_DETAILS_FRAGMENT = `fragment RepositoryDetails on Repository {
+    databaseId name nameWithOwner description url homepageUrl
+    stargazerCount forkCount updatedAt pushedAt
+    primaryLanguage { name }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    languages(first: 10, orderBy: { field: SIZE, direction: DESC }) { edges { size node { name } } }
+    defaultBranchRef { target { ... on Commit { oid url message author { name date } } } }
+}`;
+
+/**
+ * Least-recently-used cache bounded by entry count and (estimated) bytes.
+ * Map iteration order is insertion order, so the first key is the oldest.
+ */
+class LRUCache {
+    constructor({ maxEntries = 500, maxBytes = 8 * 1024 * 1024 } = {}) {
+        this.maxEntries = maxEntries;
+        this.maxBytes = maxBytes;
+        this.entries = new Map(); // key -> { value, size }
+        this.bytes = 0;
+        this.hits = 0;
+        this.misses = 0;
+        this.evictions = 0;
+    }
+    
+    /**
+     * Rough in-memory size of a JSON-like value (UTF-16 characters)
+     */
+    static sizeOf(value) {
+        try {
+            return JSON.stringify(value).length * 2;
+        } catch (error) {
+            return 0;
+        }
+    }
+    
+    get(key) {
+        const entry = this.entries.get(key);
+        if (!entry) {
+            this.misses++;
+            return undefined;
+        }
+        this.hits++;
+        // Mark as most recently used
+        this.entries.delete(key);
+        this.entries.set(key, entry);
+        return entry.value;
+    }
+    
+    /**
+     * Read without touching recency or the hit/miss counters
+     */
+    peek(key) {
+        return this.entries.get(key)?.value;
+    }
+    
+    has(key) {
+        return this.entries.has(key);
+    }
+    
+    set(key, value) {
+        this.delete(key);
+        const size = LRUCache.sizeOf(value);
+        this.entries.set(key, { value, size });
+        this.bytes += size;
+        
+        // Evict the oldest entries, but never the one just written
+        while ((this.entries.size > this.maxEntries || this.bytes > this.maxBytes) && this.entries.size > 1) {
+            this.delete(this.entries.keys().next().value);
+            this.evictions++;
+        }
+        return this;
+    }
+    
+    delete(key) {
+        const entry = this.entries.get(key);
+        if (!entry) return false;
+        this.entries.delete(key);
+        this.bytes -= entry.size;
+        return true;
+    }
+    
+    clear() {
+        this.entries.clear();
+        this.bytes = 0;
+    }
+    
+    get size() {
+        return this.entries.size;
+    }
+}
+
 class GitHubAPIManager {
-    constructor() {
-        this.baseURL = 'https://api.github.com';
+    /**
+     * Options (all optional) point the manager at a GitHub-compatible
+     * stand-in: baseURL, graphqlURL and an accessToken. Repository details
+     * are only fetched through GraphQL when a token is configured.
+     */
+    constructor({ baseURL = 'https://api.github.com', graphqlURL = null, accessToken = null } = {}) {
+        this.baseURL = baseURL;
+        this.graphqlURL = graphqlURL || `${baseURL}/graphql`;
+        this.accessToken = accessToken;
         this.username = 'welshDog';
-        this.cache = new Map();
+        this.cache = new LRUCache({ maxEntries: 500, maxBytes: 8 * 1024 * 1024 });
         this.cacheExpiry = 5 * 60 * 1000; // 5 minutes
+        // Stale-while-revalidate: expired entries younger than maxStale are
+        // served at once and refreshed in the background
+        this.staleWhileRevalidate = true;
+        this.maxStale = 24 * 60 * 60 * 1000; // 1 day
+        this.events = new EventTarget();
+        // IndexedDB budget, enforced oldest-first through the lastUpdated index
+        this.persistentCacheBytes = 20 * 1024 * 1024;
+        this.persistentEvictionInterval = 60 * 1000;
+        this.lastPersistentEviction = 0;
+        this.persistentStats = { hits: 0, misses: 0, evictions: 0, bytes: 0 };
+        this.rateLimitLimit = 60;
         this.rateLimitRemaining = 60;
         this.rateLimitReset = Date.now();
-        this.requestQueue = [];
-        this.isProcessingQueue = false;
+        this.requestQueues = Object.fromEntries(REQUEST_LANES.map(lane => [lane, []]));
+        this.maxConcurrentRequests = 4;
+        this.activeRequests = 0;
+        this.queueTimer = null;
+        // Token bucket refilled at remaining / time-to-reset, so the budget
+        // is spread over the window; the reserve is kept for interactive use
+        this.tokenBucketSize = 20;
+        this.tokens = this.tokenBucketSize;
+        this.lastTokenRefill = Date.now();
+        this.interactiveReserve = 5;
+        this.inFlight = new Map(); // request key -> promise shared by concurrent callers
+        this.workerRequests = new Map(); // worker request id -> { request, resolve, reject }
+        this.nextWorkerRequest = 0;
+        this.worker = this.startWorker();
+        this.snapshotURL = 'data/repos.json'; // Written by repo_snapshot.py
+        this.layoutURL = 'data/layout.bin'; // Written by repo_layout.py
+        this.searchIndexURL = 'data/search-index.json'; // Written by repo_snapshot.py
+        this.perPage = 100;
+        this.maxPages = 50;
+        this.pageConcurrency = 3; // Repository list pages requested at once
+        this.detailsBatchSize = 50; // Repositories per GraphQL details query
+        this.detailsPrefetchLimit = 200;
         
         // Initialize IndexedDB for persistent caching
         this.initializeCache();
+        this.listenForServiceWorkerUpdates();
+    }
+    
+    /**
+     * The service worker answers API calls from its own cache and posts
+     * GITHUB_API_UPDATED ({ url }) when a background revalidation lands a
+     * fresher body; revalidate whatever the manager holds for that URL.
+     */
+    listenForServiceWorkerUpdates() {
+        if (typeof navigator === 'undefined' || !navigator.serviceWorker) return;
+        
+        navigator.serviceWorker.addEventListener('message', (event) => {
+            if (event.data?.type !== 'GITHUB_API_UPDATED') return;
+            const { url } = event.data;
+            
+            if (url.startsWith(`${this.baseURL}/users/${this.username}/repos`)) {
+                const cached = this.cache.peek(`user_repos_${this.username}`);
+                if (cached) this.revalidateUserRepositories(cached);
+            } else if (url.startsWith(`${this.baseURL}/repos/${this.username}/`)) {
+                const repoName = url.slice(`${this.baseURL}/repos/${this.username}/`.length).split(/[/?]/)[0];
+                const cached = this.cache.peek(`repo_details_${repoName}`);
+                if (cached) this.revalidateRepositoryDetails(repoName, cached);
+            }
+        });
     }
     
     /**
@@ -26,6 +350,7 @@ class GitHubAPIManager {
         try {
             this.db = await this.openIndexedDB();
             console.log('✅ IndexedDB cache initialized');
+            this.evictPersistentCache();
         } catch (error) {
             console.warn('⚠️ IndexedDB not available, using memory cache only');
             this.db = null;
@@ -34,16 +359,49 @@ class GitHubAPIManager {
     
     openIndexedDB() {
         return new Promise((resolve, reject) => {
-            const request = indexedDB.open('ConstellationCache', 1);
+            const request = indexedDB.open('ConstellationCache', 2);
+            let blocked = false;
             
             request.onerror = () => reject(request.error);
-            request.onsuccess = () => resolve(request.result);
+            request.onsuccess = () => {
+                const db = request.result;
+                if (blocked) {
+                    db.close(); // Already running on the memory cache
+                    return;
+                }
+                // Another tab is upgrading the schema: let it, and carry on
+                // with the memory cache
+                db.onversionchange = () => {
+                    db.close();
+                    this.db = null;
+                };
+                resolve(db);
+            };
+            // A tab still running the previous version holds the database
+            // open; don't wait for it to close
+            request.onblocked = () => {
+                blocked = true;
+                reject(new Error('IndexedDB upgrade blocked by another tab'));
+            };
             
             request.onupgradeneeded = (event) => {
                 const db = event.target.result;
                 if (!db.objectStoreNames.contains('repositories')) {
                     const store = db.createObjectStore('repositories', { keyPath: 'name' });
                     store.createIndex('lastUpdated', 'lastUpdated', { unique: false });
+                } else if (event.oldVersion < 2) {
+                    // Version 1 records carry no lastUpdated/size, so eviction
+                    // could never see them; fill both in rather than dropping
+                    // the cached data
+                    const cursorRequest = event.target.transaction.objectStore('repositories').openCursor();
+                    cursorRequest.onsuccess = () => {
+                        const cursor = cursorRequest.result;
+                        if (!cursor) return;
+                        const record = { ...cursor.value, lastUpdated: cursor.value.timestamp };
+                        record.size = LRUCache.sizeOf(record);
+                        cursor.update(record);
+                        cursor.continue();
+                    };
                 }
             };
         });
@@ -53,6 +411,15 @@ class GitHubAPIManager {
      * Get cached data from IndexedDB
      */
     async getCachedData(key) {
+        const entry = await this.getCachedEntry(key);
+        return entry && Date.now() - entry.timestamp < this.cacheExpiry ? entry.data : null;
+    }
+    
+    /**
+     * Get the full IndexedDB record (data, timestamp and the ETag /
+     * Last-Modified validators), however old it is
+     */
+    async getCachedEntry(key) {
         if (!this.db) return null;
         
         try {
@@ -62,12 +429,9 @@ class GitHubAPIManager {
             
             return new Promise((resolve) => {
                 request.onsuccess = () => {
-                    const result = request.result;
-                    if (result && Date.now() - result.timestamp < this.cacheExpiry) {
-                        resolve(result.data);
-                    } else {
-                        resolve(null);
-                    }
+                    if (request.result) this.persistentStats.hits++;
+                    else this.persistentStats.misses++;
+                    resolve(request.result || null);
                 };
                 request.onerror = () => resolve(null);
             });
@@ -78,63 +442,292 @@ class GitHubAPIManager {
     }
     
     /**
-     * Store data in IndexedDB cache
+     * Store data in IndexedDB cache; `meta` (e.g. the ETag / Last-Modified
+     * validators of each page) is kept alongside for the next refresh
      */
-    async setCachedData(key, data) {
+    async setCachedData(key, data, meta = {}) {
         if (!this.db) return;
         
         try {
             const transaction = this.db.transaction(['repositories'], 'readwrite');
             const store = transaction.objectStore('repositories');
             
-            await store.put({
+            const record = {
+                ...meta,
                 name: key,
                 data: data,
-                timestamp: Date.now()
+                timestamp: Date.now(),
+                lastUpdated: Date.now()
+            };
+            record.size = LRUCache.sizeOf(record);
+            store.put(record);
+            // Settle once the write has committed, so eviction below only
+            // starts afterwards and write errors reach the catch
+            await new Promise((resolve, reject) => {
+                transaction.oncomplete = () => resolve();
+                transaction.onerror = () => reject(transaction.error);
+                transaction.onabort = () => reject(transaction.error || new Error('IndexedDB write aborted'));
             });
         } catch (error) {
             console.warn('Cache write error:', error);
         }
+        
+        if (Date.now() - this.lastPersistentEviction >= this.persistentEvictionInterval) {
+            this.evictPersistentCache();
+        }
+    }
+    
+    /**
+     * Keep the IndexedDB store under persistentCacheBytes by deleting the
+     * least recently written records (walking the lastUpdated index
+     * newest-first and dropping whatever is past the budget).
+     * Resolves to the number of records evicted.
+     */
+    evictPersistentCache() {
+        if (!this.db) return Promise.resolve(0);
+        this.lastPersistentEviction = Date.now();
+        
+        return new Promise((resolve) => {
+            try {
+                const transaction = this.db.transaction(['repositories'], 'readwrite');
+                const request = transaction.objectStore('repositories').index('lastUpdated').openCursor(null, 'prev');
+                let bytes = 0;
+                let evicted = 0;
+                
+                request.onsuccess = () => {
+                    const cursor = request.result;
+                    if (!cursor) return;
+                    const size = cursor.value.size || 0;
+                    if (bytes + size > this.persistentCacheBytes) {
+                        cursor.delete();
+                        evicted++;
+                    } else {
+                        bytes += size;
+                    }
+                    cursor.continue();
+                };
+                transaction.oncomplete = () => {
+                    this.persistentStats.bytes = bytes;
+                    this.persistentStats.evictions += evicted;
+                    if (evicted > 0) console.log(`🧹 Evicted ${evicted} IndexedDB cache records`);
+                    resolve(evicted);
+                };
+                transaction.onerror = () => resolve(0);
+            } catch (error) {
+                console.warn('Cache eviction error:', error);
+                resolve(0);
+            }
+        });
+    }
+    
+    /**
+     * Hit/miss/eviction counters and sizes for both cache layers
+     */
+    getCacheStats() {
+        return {
+            memory: {
+                entries: this.cache.size,
+                bytes: this.cache.bytes,
+                hits: this.cache.hits,
+                misses: this.cache.misses,
+                evictions: this.cache.evictions
+            },
+            persistent: { ...this.persistentStats }
+        };
+    }
+    
+    /**
+     * Load the prebuilt repository snapshot so the first render does not
+     * wait on the GitHub API. Returns null when no snapshot is deployed.
+     */
+    async loadSnapshot() {
+        try {
+            const response = await fetch(this.snapshotURL, { cache: 'no-cache' });
+            if (!response.ok) return null;
+            
+            const snapshot = await response.json();
+            if (!snapshot || !Array.isArray(snapshot.repositories)) return null;
+            
+            const layout = await this.loadLayout(snapshot.repositories.map(repo => repo.name));
+            return snapshot.repositories.map((repo, index) => ({
+                ...repo,
+                updated: new Date(repo.updated),
+                position: layout ? {
+                    x: layout[index * 3],
+                    y: layout[index * 3 + 1],
+                    z: layout[index * 3 + 2]
+                } : repo.position
+            }));
+        } catch (error) {
+            console.warn('⚠️ Repository snapshot unavailable:', error);
+            return null;
+        }
+    }
+    
+    /**
+     * Load the precomputed layout as a Float32Array of x, y, z triples.
+     * Returns null when it is missing or was built for a different snapshot.
+     */
+    async loadLayout(names) {
+        try {
+            const response = await fetch(this.layoutURL, { cache: 'no-cache' });
+            if (!response.ok) return null;
+            
+            const buffer = await response.arrayBuffer();
+            if (buffer.byteLength < 16) return null;
+            
+            // Header: magic 'UHCL', version, count, FNV-1a hash of the names
+            const header = new DataView(buffer, 0, 16);
+            const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+            const count = header.getUint32(8, true);
+            if (magic !== 'UHCL' || header.getUint32(4, true) !== 1 ||
+                count !== names.length || header.getUint32(12, true) !== this.namesHash(names) ||
+                buffer.byteLength !== 16 + count * 12) {
+                console.warn('⚠️ Layout does not match the snapshot, ignoring it');
+                return null;
+            }
+            
+            return new Float32Array(buffer, 16, count * 3);
+        } catch (error) {
+            console.warn('⚠️ Repository layout unavailable:', error);
+            return null;
+        }
+    }
+    
+    /**
+     * Load the search index prebuilt for the snapshot; null when it is
+     * missing or was built for a different snapshot
+     */
+    async loadSearchIndex(names) {
+        try {
+            const response = await fetch(this.searchIndexURL, { cache: 'no-cache' });
+            if (!response.ok) return null;
+            
+            const index = await response.json();
+            if (index.version !== 1 || index.count !== names.length ||
+                index.namesHash !== this.namesHash(names)) {
+                console.warn('⚠️ Search index does not match the snapshot, ignoring it');
+                return null;
+            }
+            return index;
+        } catch (error) {
+            console.warn('⚠️ Search index unavailable:', error);
+            return null;
+        }
+    }
+    
+    /**
+     * 32-bit FNV-1a over the UTF-8 names joined by newlines (see repo_snapshot.py)
+     */
+    namesHash(names) {
+        let hash = 0x811c9dc5;
+        for (const byte of new TextEncoder().encode(names.join('\\n'))) {
+            hash = Math.imul(hash ^ byte, 0x01000193);
+        }
+        return hash >>> 0;
+    }
+    
+    /**
+     * Check whether two repository lists differ in anything that is rendered
+     */
+    repositoriesDiffer(current, next) {
+        if (current.length !== next.length) return true;
+        
+        const known = new Set(current.map(repo => this.repositorySignature(repo)));
+        return next.some(repo => !known.has(this.repositorySignature(repo)));
+    }
+    
+    /**
+     * The rendered fields of a repository, as one comparable string
+     */
+    repositorySignature(repo) {
+        return [
+            repo.id, repo.name, repo.description, repo.category, repo.stars,
+            repo.forks, repo.language, new Date(repo.updated).getTime()
+        ].join('|');
+    }
+    
+    /**
+     * Repositories added, changed (in a rendered field) and removed between
+     * two lists, matched by name
+     */
+    diffRepositories(previous, next) {
+        const before = new Map(previous.map(repo => [repo.name, repo]));
+        const after = new Set(next.map(repo => repo.name));
+        return {
+            added: next.filter(repo => !before.has(repo.name)),
+            changed: next.filter(repo => before.has(repo.name) &&
+                this.repositorySignature(before.get(repo.name)) !== this.repositorySignature(repo)),
+            removed: previous.filter(repo => !after.has(repo.name))
+        };
+    }
+    
+    /**
+     * Listen for 'repositoriesChanged' ({ repositories, added, changed,
+     * removed }) and 'detailsChanged' ({ name, details }), fired when a
+     * background revalidation finds fresher data than what was served
+     */
+    addEventListener(type, listener) {
+        this.events.addEventListener(type, listener);
+    }
+    
+    emit(type, detail) {
+        this.events.dispatchEvent(new CustomEvent(type, { detail }));
+    }
+    
+    /**
+     * Whether an expired cache entry may still be served while it is refreshed
+     */
+    canServeStale(entry) {
+        return Boolean(entry) && this.staleWhileRevalidate && Date.now() - entry.timestamp < this.maxStale;
     }
     
     /**
      * Fetch user repositories with smart caching
+     * Pass { fallback: false } to get a rejection instead of the stub data.
+     * `onPage(repos)` receives each batch as soon as it is available (a
+     * cache hit is a single batch), so the caller can render progressively.
      */
-    async fetchUserRepositories() {
+    async fetchUserRepositories({ fallback = true, onPage = null } = {}) {
         const cacheKey = `user_repos_${this.username}`;
+        const deliver = repos => {
+            if (onPage && repos.length > 0) onPage(repos);
+            return repos;
+        };
         
         // Try cache first
         let cachedData = this.cache.get(cacheKey);
         if (cachedData && Date.now() - cachedData.timestamp < this.cacheExpiry) {
             console.log('📦 Using cached repository data');
-            return cachedData.data;
+            return deliver(cachedData.data);
         }
         
-        // Try IndexedDB cache
-        cachedData = await this.getCachedData(cacheKey);
-        if (cachedData) {
-            console.log('💾 Using IndexedDB cached repository data');
-            this.cache.set(cacheKey, { data: cachedData, timestamp: Date.now() });
-            return cachedData;
+        // Try IndexedDB cache; an expired entry still carries its validators
+        if (!cachedData) {
+            cachedData = await this.getCachedEntry(cacheKey);
+            if (cachedData && Date.now() - cachedData.timestamp < this.cacheExpiry) {
+                console.log('💾 Using IndexedDB cached repository data');
+                this.cache.set(cacheKey, cachedData);
+                return deliver(cachedData.data);
+            }
         }
         
-        // Fetch fresh data
+        if (this.canServeStale(cachedData)) {
+            console.log('⚡ Serving stale repository data, revalidating in the background');
+            this.revalidateUserRepositories(cachedData);
+            return deliver(cachedData.data);
+        }
+        
+        // Fetch fresh data (conditionally, when we have something to revalidate).
+        // A caller joining a fetch already in flight gets its result as one batch.
+        const joining = this.inFlight.has(cacheKey);
         try {
-            const repos = await this.makeAPIRequest(`/users/${this.username}/repos?per_page=100&sort=updated`);
-            
-            // Transform API data to our format
-            const transformedRepos = this.transformRepositoryData(repos);
-            
-            // Cache the results
-            const cacheData = { data: transformedRepos, timestamp: Date.now() };
-            this.cache.set(cacheKey, cacheData);
-            await this.setCachedData(cacheKey, transformedRepos);
-            
-            console.log(`🔄 Fetched ${transformedRepos.length} repositories from GitHub API`);
-            return transformedRepos;
+            const repos = await this.coalesce(cacheKey, () => this.refreshUserRepositories(cachedData, deliver));
+            return joining ? deliver(repos) : repos;
             
         } catch (error) {
             console.error('❌ Failed to fetch repositories:', error);
+            if (!fallback) throw error;
             
             // Return fallback mock data if API fails
             return this.getFallbackRepositories();
@@ -142,133 +735,512 @@ class GitHubAPIManager {
     }
     
     /**
-     * Transform GitHub API data to constellation format
+     * Refresh a stale repository list in the background and emit
+     * 'repositoriesChanged' with the diff if anything rendered changed
      */
-    transformRepositoryData(repos) {
-        const categories = {
-            'hyperfocus': { key: 'core', color: '#00d9ff' },
-            'constellation': { key: 'visual', color: '#7c3aed' },
-            'adhd': { key: 'brain', color: '#06ffa5' },
-            'social': { key: 'social', color: '#f59e0b' },
-            'accessibility': { key: 'accessibility', color: '#10b981' },
-            'creative': { key: 'creative', color: '#ef4444' },
-            'tool': { key: 'dev-tools', color: '#8b5cf6' },
-            'portal': { key: 'portal', color: '#ec4899' },
-            'raspberry': { key: 'hardware', color: '#6366f1' },
-            'research': { key: 'research', color: '#14b8a6' }
-        };
+    revalidateUserRepositories(stale) {
+        const cacheKey = `user_repos_${this.username}`;
+        if (this.inFlight.has(cacheKey)) return; // Already revalidating
         
-        return repos.map((repo, index) => {
-            // Determine category based on name, description, and topics
-            let category = 'dev-tools'; // default
-            const searchText = `${repo.name} ${repo.description || ''} ${(repo.topics || []).join(' ')}`.toLowerCase();
-            
-            for (const [keyword, categoryInfo] of Object.entries(categories)) {
-                if (searchText.includes(keyword)) {
-                    category = categoryInfo.key;
-                    break;
-                }
+        this.coalesce(cacheKey, () => this.refreshUserRepositories(stale, () => {})).then(repos => {
+            const diff = this.diffRepositories(stale.data, repos);
+            if (diff.added.length + diff.changed.length + diff.removed.length > 0) {
+                console.log(`🔄 Revalidated repositories: ${diff.added.length} added, ${diff.changed.length} changed, ${diff.removed.length} removed`);
+                this.emit('repositoriesChanged', { repositories: repos, ...diff });
             }
+        }).catch(error => {
+            console.warn('⚠️ Background repository refresh failed, keeping cached data:', error);
+        });
+    }
+    
+    /**
+     * Fetch the repository list from the API and cache it
+     */
+    async refreshUserRepositories(cachedData, onPage) {
+        const cacheKey = `user_repos_${this.username}`;
+        const { repos, pages, fetched } = await this.fetchRepositoryPages(cachedData, onPage);
+        
+        // Cache the results
+        const cacheData = { data: repos, timestamp: Date.now(), pages: pages };
+        this.cache.set(cacheKey, cacheData);
+        await this.setCachedData(cacheKey, repos, { pages });
+        
+        if (fetched === 0) {
+            console.log(`✅ Repositories unchanged (304), reusing ${repos.length} cached`);
+        } else {
+            console.log(`🔄 Fetched ${repos.length} repositories from GitHub API (${fetched} pages changed)`);
+        }
+        return repos;
+    }
+    
+    /**
+     * Fetch every page of the repository list. Page 1 comes first (its Link
+     * header names the last page), then the rest, pageConcurrency at a time.
+     * Each page is revalidated against the validators stored for it in
+     * `cached`; a 304 reuses that page's slice of the cached list. Pages
+     * are transformed and passed to onPage in arrival order.
+     */
+    async fetchRepositoryPages(cached, onPage) {
+        // Where each cached page starts in cached.data
+        const previous = [];
+        (cached?.pages || []).reduce((start, page) => {
+            previous.push({ ...page, start });
+            return start + page.size;
+        }, 0);
+        
+        const results = [];
+        let fetched = 0;
+        const fetchPage = async (page) => {
+            const known = previous[page - 1];
+            // Page 1 gates the first render; the rest is background work
+            const response = await this.makeConditionalRequest(
+                `/users/${this.username}/repos?per_page=${this.perPage}&sort=updated&page=${page}`, known || {},
+                { priority: page === 1 ? 'normal' : 'background', transform: true });
+            const repos = response.notModified
+                ? cached.data.slice(known.start, known.start + known.size)
+                : response.repos;
+            if (!response.notModified) fetched++;
             
-            const categoryInfo = Object.values(categories).find(c => c.key === category) || categories.tool;
-            
-            return {
-                id: repo.id,
-                name: repo.name,
-                description: repo.description || `Advanced ${category} project with neurodivergent-friendly design.`,
-                category: category,
-                stars: repo.stargazers_count || 0,
-                forks: repo.forks_count || 0,
-                language: repo.language || 'Multiple',
-                updated: new Date(repo.updated_at),
-                url: repo.html_url,
-                demo_url: repo.homepage || null,
-                color: categoryInfo.color,
-                topics: repo.topics || [],
-                position: {
-                    x: (Math.random() - 0.5) * 80,
-                    y: (Math.random() - 0.5) * 60,
-                    z: (Math.random() - 0.5) * 40
-                }
+            results[page - 1] = {
+                repos: repos,
+                etag: response.notModified ? known.etag : response.etag,
+                lastModified: response.notModified ? known.lastModified : response.lastModified
             };
-        }).filter(repo => !repo.name.startsWith('.') && repo.name !== this.username);
+            onPage(repos);
+            return response;
+        };
+        
+        const first = await fetchPage(1);
+        const lastPage = Math.min(this.maxPages, first.notModified
+            ? Math.max(1, previous.length)
+            : this.lastPageFromLink(first.link));
+        
+        let nextPage = 2;
+        const worker = async () => {
+            while (nextPage <= lastPage) await fetchPage(nextPage++);
+        };
+        await Promise.all(Array.from({ length: Math.min(this.pageConcurrency, lastPage - 1) }, worker));
+        
+        // A repository updated mid-fetch can move to another page and show
+        // up twice; keep the first copy and skip page validators next time
+        const seen = new Set();
+        let shifted = false;
+        const repos = [];
+        results.forEach(page => page.repos.forEach(repo => {
+            if (seen.has(repo.id)) {
+                shifted = true;
+                return;
+            }
+            seen.add(repo.id);
+            repos.push(repo);
+        }));
+        
+        const pages = shifted ? [] : results.map(({ repos, etag, lastModified }) => ({
+            size: repos.length, etag, lastModified
+        }));
+        return { repos, pages, fetched };
     }
     
     /**
-     * Make API request with rate limiting
+     * Page number of the rel="last" entry of a GitHub Link header (1 if none)
+     */
+    lastPageFromLink(link) {
+        const last = (link || '').split(',').find(part => part.includes('rel="last"'));
+        if (!last) return 1;
+        
+        const url = last.slice(last.indexOf('<') + 1, last.indexOf('>'));
+        return parseInt(new URL(url, this.baseURL).searchParams.get('page')) || 1;
+    }
+    
+    /**
+     * Transform GitHub API data to constellation format
+     */
+    transformRepositoryData(repos) {
+        return githubTransformRepositories(repos, this.username);
+    }
+    
+    /**
+     * Category of a raw repository (see githubCategorize)
+     */
+    categorizeRepository(repo) {
+        return githubCategorize(repo);
+    }
+    
+    /**
+     * Rebuild repositories from a worker page: records plus typed-array columns
+     */
+    hydrateRepositories(records, columns) {
+        return records.map((record, index) => ({
+            ...record,
+            stars: columns.stars[index],
+            forks: columns.forks[index],
+            activity: columns.activity[index],
+            updated: new Date(columns.updated[index])
+        }));
+    }
+    
+    /**
+     * Start the worker that fetches, parses, transforms and scores API
+     * responses off the main thread. Returns null where workers are not
+     * available; requests then run on the main thread.
+     */
+    startWorker() {
+        if (typeof Worker === 'undefined' || typeof Blob === 'undefined') return null;
+        
+        try {
+            const url = URL.createObjectURL(new Blob([GITHUB_WORKER_SOURCE], { type: 'text/javascript' }));
+            const worker = new Worker(url);
+            worker.onmessage = event => this.settleWorkerRequest(event.data);
+            worker.onerror = event => {
+                // E.g. a content security policy without blob: workers
+                console.warn('⚠️ GitHub worker failed, fetching on the main thread:', event.message);
+                event.preventDefault();
+                worker.terminate();
+                this.worker = null;
+                const pending = [...this.workerRequests.values()];
+                this.workerRequests.clear();
+                pending.forEach(({ request, resolve, reject }) => this.fetchOnMainThread(request).then(resolve, reject));
+            };
+            return worker;
+        } catch (error) {
+            console.warn('⚠️ GitHub worker unavailable, fetching on the main thread:', error);
+            return null;
+        }
+    }
+    
+    /**
+     * Fetch and parse a request ({ url, init, transform }) in the worker,
+     * or here without one. Resolves to { status, ok, headers } plus `data`
+     * (parsed JSON) or, with `transform`, `repos` (constellation format).
      */
-    async makeAPIRequest(endpoint) {
+    fetchAndParse(request) {
+        if (!this.worker) return this.fetchOnMainThread(request);
+        
         return new Promise((resolve, reject) => {
-            this.requestQueue.push({ endpoint, resolve, reject });
+            const id = this.nextWorkerRequest++;
+            this.workerRequests.set(id, { request, resolve, reject });
+            this.worker.postMessage({ id, ...request, username: this.username });
+        });
+    }
+    
+    settleWorkerRequest({ id, error, ...result }) {
+        const pending = this.workerRequests.get(id);
+        if (!pending) return;
+        this.workerRequests.delete(id);
+        
+        if (error) {
+            pending.reject(new Error(error));
+        } else if (result.columns) {
+            pending.resolve({ ...result, repos: this.hydrateRepositories(result.records, result.columns) });
+        } else {
+            pending.resolve(result);
+        }
+    }
+    
+    async fetchOnMainThread({ url, init, transform }) {
+        const response = await fetch(url, init);
+        const headers = {};
+        response.headers.forEach((value, name) => { headers[name] = value; });
+        
+        const result = { status: response.status, ok: response.ok, headers };
+        if (response.ok && response.status !== 304) {
+            const data = await response.json();
+            if (transform) result.repos = this.transformRepositoryData(data);
+            else result.data = data;
+        }
+        return result;
+    }
+    
+    /**
+     * Make API request with rate limiting
+     * `priority` picks the lane: 'interactive', 'normal' or 'background'
+     */
+    async makeAPIRequest(endpoint, { priority = 'normal' } = {}) {
+        return this.enqueueRequest(`GET ${endpoint}`, { endpoint, validators: null }, priority);
+    }
+    
+    /**
+     * Make a conditional API request (If-None-Match / If-Modified-Since).
+     * Resolves to { notModified: true, link } on a 304, which GitHub does
+     * not count against the rate limit, or to { notModified: false, data,
+     * etag, lastModified, link } with the validators for the next request.
+     * With `transform`, repository list pages come back as `repos`
+     * (transformed off the main thread) instead of `data`.
+     */
+    async makeConditionalRequest(endpoint, { etag = null, lastModified = null } = {},
+                                 { priority = 'normal', transform = false } = {}) {
+        return this.enqueueRequest(`GET ${endpoint} ${etag} ${lastModified} ${transform}`,
+            { endpoint, validators: { etag, lastModified }, transform }, priority);
+    }
+    
+    /**
+     * Queue a request in its priority lane, sharing it with any concurrent
+     * caller using the same key. A caller with a higher priority moves a
+     * still-queued shared request up to its own lane.
+     */
+    enqueueRequest(key, request, priority) {
+        if (this.inFlight.has(key)) this.promoteRequest(key, priority);
+        
+        return this.coalesce(key, () => new Promise((resolve, reject) => {
+            this.requestQueues[priority].push({ ...request, key, resolve, reject });
             this.processQueue();
+        }));
+    }
+    
+    /**
+     * Move a queued request to a higher-priority lane
+     */
+    promoteRequest(key, priority) {
+        for (const lane of REQUEST_LANES.slice(REQUEST_LANES.indexOf(priority) + 1)) {
+            const index = this.requestQueues[lane].findIndex(request => request.key === key);
+            if (index !== -1) {
+                this.requestQueues[priority].push(...this.requestQueues[lane].splice(index, 1));
+                this.processQueue();
+                return;
+            }
+        }
+    }
+    
+    /**
+     * Share one in-flight promise between concurrent callers with the same
+     * key: the first caller starts `task`, later ones get its promise (and
+     * its result or error). The entry is dropped once the promise settles.
+     */
+    coalesce(key, task) {
+        const pending = this.inFlight.get(key);
+        if (pending) return pending;
+        
+        const promise = Promise.resolve().then(task).finally(() => {
+            if (this.inFlight.get(key) === promise) this.inFlight.delete(key);
         });
+        this.inFlight.set(key, promise);
+        return promise;
     }
     
     /**
-     * Process API request queue with rate limiting
+     * Run a GraphQL query (needs an access token) and return its data.
+     * Partial errors, such as one missing repository, are logged.
      */
-    async processQueue() {
-        if (this.isProcessingQueue || this.requestQueue.length === 0) return;
+    async makeGraphQLRequest(query, variables = {}, { priority = 'normal' } = {}) {
+        if (!this.accessToken) throw new Error('GitHub GraphQL requires an access token');
         
-        this.isProcessingQueue = true;
+        const body = await new Promise((resolve, reject) => {
+            this.requestQueues[priority].push({
+                endpoint: this.graphqlURL,
+                resolve,
+                reject,
+                validators: null,
+                init: { method: 'POST', body: JSON.stringify({ query, variables }) }
+            });
+            this.processQueue();
+        });
+        
+        if (body.errors && !body.data) {
+            throw new Error(`GitHub GraphQL error: ${body.errors[0].message}`);
+        }
+        if (body.errors) {
+            console.warn('⚠️ GitHub GraphQL partial errors:', body.errors.map(error => error.message));
+        }
+        return body.data;
+    }
+    
+    /**
+     * Dispatch queued requests: highest-priority lane first, at most
+     * maxConcurrentRequests at once, paced by the token bucket
+     */
+    processQueue() {
+        clearTimeout(this.queueTimer);
+        this.queueTimer = null;
+        
+        while (this.activeRequests < this.maxConcurrentRequests) {
+            const lane = REQUEST_LANES.find(name => this.requestQueues[name].length > 0);
+            if (!lane) return;
+            
+            const wait = this.requestDelay(lane);
+            if (wait > 0) {
+                console.log(`⏳ Pacing ${lane} requests, next in ${wait}ms`);
+                this.queueTimer = setTimeout(() => this.processQueue(), wait);
+                return;
+            }
+            
+            const request = this.requestQueues[lane].shift();
+            this.tokens -= 1;
+            if (request.endpoint.startsWith('/')) {
+                this.rateLimitRemaining -= 1; // REST budget; corrected by the response headers
+            }
+            this.activeRequests++;
+            this.executeRequest(request).finally(() => {
+                this.activeRequests--;
+                this.processQueue();
+            });
+        }
+    }
+    
+    /**
+     * Top up the token bucket at the rate that spends what is left of the
+     * rate limit evenly until it resets
+     */
+    refillTokens() {
+        const now = Date.now();
+        if (now >= this.rateLimitReset) {
+            // The window rolled over; assume a full budget until headers say otherwise
+            this.rateLimitRemaining = this.rateLimitLimit;
+            this.rateLimitReset = now + RATE_LIMIT_WINDOW;
+        }
+        
+        const rate = Math.max(0, this.rateLimitRemaining) / (this.rateLimitReset - now); // tokens per ms
+        this.tokens = Math.min(this.tokenBucketSize, this.tokens + (now - this.lastTokenRefill) * rate);
+        this.lastTokenRefill = now;
+    }
+    
+    /**
+     * Milliseconds until the next request in `lane` may be sent (0 = now).
+     * Interactive requests skip the pacing and may use the reserve; the
+     * other lanes wait for a token and leave the reserve alone.
+     */
+    requestDelay(lane) {
+        this.refillTokens();
+        const untilReset = this.rateLimitReset - Date.now();
         
-        while (this.requestQueue.length > 0) {
-            // Check rate limit
-            if (this.rateLimitRemaining <= 1 && Date.now() < this.rateLimitReset) {
-                const waitTime = this.rateLimitReset - Date.now();
-                console.log(`⏳ Rate limit reached, waiting ${waitTime}ms`);
-                await new Promise(resolve => setTimeout(resolve, waitTime));
+        if (this.rateLimitRemaining <= 0) return untilReset;
+        if (lane === 'interactive') return 0;
+        if (this.rateLimitRemaining <= this.interactiveReserve) return untilReset;
+        if (this.tokens >= 1) return 0;
+        return Math.ceil((1 - this.tokens) * untilReset / this.rateLimitRemaining);
+    }
+    
+    /**
+     * Send one queued request and settle its promise
+     */
+    async executeRequest({ endpoint, resolve, reject, validators, init = {}, transform = false }) {
+        try {
+            const headers = {
+                'Accept': 'application/vnd.github.v3+json',
+                'User-Agent': 'Ultimate-Hyperfocus-Constellation/1.0'
+            };
+            if (this.accessToken) headers['Authorization'] = `bearer ${this.accessToken}`;
+            if (init.body) headers['Content-Type'] = 'application/json';
+            if (validators?.etag) headers['If-None-Match'] = validators.etag;
+            if (validators?.lastModified) headers['If-Modified-Since'] = validators.lastModified;
+            
+            // Endpoints are REST paths, or absolute URLs (GraphQL)
+            const url = endpoint.startsWith('/') ? this.baseURL + endpoint : endpoint;
+            const response = await this.fetchAndParse({
+                url,
+                init: { method: init.method || 'GET', headers, body: init.body },
+                transform
+            });
+            const header = name => response.headers[name.toLowerCase()] ?? null;
+            
+            // Update rate limit info (GraphQL is budgeted separately from REST)
+            const resource = header('X-RateLimit-Resource');
+            const remaining = header('X-RateLimit-Remaining');
+            if (remaining !== null && (!resource || resource === 'core')) {
+                this.rateLimitLimit = parseInt(header('X-RateLimit-Limit')) || this.rateLimitLimit;
+                this.rateLimitRemaining = parseInt(remaining);
+                this.rateLimitReset = parseInt(header('X-RateLimit-Reset')) * 1000 || this.rateLimitReset;
             }
             
-            const { endpoint, resolve, reject } = this.requestQueue.shift();
+            // The service worker answered from its cache (it strips the
+            // rate-limit headers there): GitHub saw nothing, so give back
+            // the rate-limit unit processQueue took for it
+            const fromCache = header('sw-cached-at') !== null && remaining === null;
+            if (fromCache && endpoint.startsWith('/')) {
+                this.rateLimitRemaining = Math.min(this.rateLimitLimit, this.rateLimitRemaining + 1);
+            }
+            if (fromCache || (validators && response.status === 304)) {
+                // Nothing spent: refund the token
+                this.tokens = Math.min(this.tokenBucketSize, this.tokens + 1);
+            }
             
-            try {
-                const response = await fetch(this.baseURL + endpoint, {
-                    headers: {
-                        'Accept': 'application/vnd.github.v3+json',
-                        'User-Agent': 'Ultimate-Hyperfocus-Constellation/1.0'
-                    }
-                });
-                
-                // Update rate limit info
-                this.rateLimitRemaining = parseInt(response.headers.get('X-RateLimit-Remaining')) || 0;
-                this.rateLimitReset = parseInt(response.headers.get('X-RateLimit-Reset')) * 1000 || Date.now();
-                
-                if (!response.ok) {
-                    throw new Error(`GitHub API error: ${response.status}`);
-                }
-                
-                const data = await response.json();
-                resolve(data);
-                
-                // Small delay to be respectful
-                await new Promise(resolve => setTimeout(resolve, 100));
-                
-            } catch (error) {
-                reject(error);
+            if (validators && response.status === 304) {
+                resolve({ notModified: true, link: header('Link') });
+            } else if (!response.ok) {
+                throw new Error(`GitHub API error: ${response.status}`);
+            } else {
+                resolve(validators ? {
+                    notModified: false,
+                    data: response.data,
+                    repos: response.repos,
+                    etag: header('ETag'),
+                    lastModified: header('Last-Modified'),
+                    link: header('Link')
+                } : response.data);
             }
+            
+        } catch (error) {
+            reject(error);
         }
+    }
+    
+    /**
+     * Refresh stale repository details in the background and emit
+     * 'detailsChanged' if they differ from what was served
+     */
+    revalidateRepositoryDetails(repoName, stale) {
+        const cacheKey = `repo_details_${repoName}`;
+        if (this.inFlight.has(cacheKey)) return; // Already revalidating
         
-        this.isProcessingQueue = false;
+        this.coalesce(cacheKey, () => this.loadRepositoryDetails(repoName, 'background')).then(details => {
+            if (details && JSON.stringify(details) !== JSON.stringify(stale.data)) {
+                this.emit('detailsChanged', { name: repoName, details });
+            }
+        }).catch(error => {
+            console.warn(`⚠️ Background refresh of ${repoName} failed, keeping cached details:`, error);
+        });
     }
     
     /**
      * Get repository details with enhanced data
+     * Concurrent calls for one repository share a single fetch, as do
+     * calls for a repository a prefetch batch is already fetching.
      */
     async getRepositoryDetails(repoName) {
         const cacheKey = `repo_details_${repoName}`;
         
         // Check cache
-        let cachedData = this.cache.get(cacheKey);
+        const cachedData = this.cache.get(cacheKey);
         if (cachedData && Date.now() - cachedData.timestamp < this.cacheExpiry) {
             return cachedData.data;
         }
         
+        if (this.canServeStale(cachedData)) {
+            this.revalidateRepositoryDetails(repoName, cachedData);
+            return cachedData.data;
+        }
+        
+        const prefetch = this.inFlight.get(`details_batch_${repoName}`);
+        if (prefetch) {
+            const details = await prefetch;
+            if (details) return details;
+        }
+        
+        return this.coalesce(cacheKey, () => this.loadRepositoryDetails(repoName));
+    }
+    
+    /**
+     * Fetch and cache details for one repository: one GraphQL query when
+     * an access token is configured, otherwise (or if GraphQL fails) three
+     * REST calls. Resolves to null if the details are unavailable.
+     */
+    async loadRepositoryDetails(repoName, priority = 'interactive') {
+        const cacheKey = `repo_details_${repoName}`;
+        
+        if (this.accessToken) {
+            try {
+                await this.fetchDetailsBatch([repoName], priority);
+                const cachedData = this.cache.peek(cacheKey);
+                if (cachedData) return cachedData.data;
+            } catch (error) {
+                console.warn(`⚠️ GraphQL details failed for ${repoName}, using REST:`, error);
+            }
+        }
+        
         try {
             const [repo, languages, commits] = await Promise.all([
-                this.makeAPIRequest(`/repos/${this.username}/${repoName}`),
-                this.makeAPIRequest(`/repos/${this.username}/${repoName}/languages`),
-                this.makeAPIRequest(`/repos/${this.username}/${repoName}/commits?per_page=1`)
+                this.makeAPIRequest(`/repos/${this.username}/${repoName}`, { priority }),
+                this.makeAPIRequest(`/repos/${this.username}/${repoName}/languages`, { priority }),
+                this.makeAPIRequest(`/repos/${this.username}/${repoName}/commits?per_page=1`, { priority })
             ]);
             
             const details = {
@@ -291,30 +1263,103 @@ class GitHubAPIManager {
     }
     
     /**
-     * Calculate repository activity score
+     * Warm the details cache for many repositories at once, detailsBatchSize
+     * per GraphQL query (at most detailsPrefetchLimit repositories). Does
+     * nothing without an access token; getRepositoryDetails then uses REST.
+     * Returns how many repositories were fetched.
      */
-    calculateActivityScore(repo, lastCommit) {
-        const now = Date.now();
-        const updated = new Date(repo.updated_at).getTime();
-        const daysSinceUpdate = (now - updated) / (1000 * 60 * 60 * 24);
+    async prefetchRepositoryDetails(repoNames) {
+        if (!this.accessToken) return 0;
         
-        let score = 0;
+        const missing = repoNames.filter(name => {
+            const cacheKey = `repo_details_${name}`;
+            const cachedData = this.cache.peek(cacheKey);
+            if (cachedData && Date.now() - cachedData.timestamp < this.cacheExpiry) return false;
+            return !this.inFlight.has(cacheKey) && !this.inFlight.has(`details_batch_${name}`);
+        }).slice(0, this.detailsPrefetchLimit);
         
-        // Recent activity bonus
-        if (daysSinceUpdate < 7) score += 50;
-        else if (daysSinceUpdate < 30) score += 30;
-        else if (daysSinceUpdate < 90) score += 10;
-        
-        // Stars and forks contribution
-        score += Math.min(repo.stargazers_count * 2, 30);
-        score += Math.min(repo.forks_count * 3, 20);
+        const batches = [];
+        for (let start = 0; start < missing.length; start += this.detailsBatchSize) {
+            batches.push(missing.slice(start, start + this.detailsBatchSize));
+        }
+        await Promise.all(batches.map(names => {
+            const batch = this.fetchDetailsBatch(names, 'background');
+            // getRepositoryDetails waits on the batch instead of fetching again
+            names.forEach(name => this.coalesce(`details_batch_${name}`, () => batch.then(
+                () => this.cache.peek(`repo_details_${name}`)?.data || null,
+                () => null
+            )));
+            return batch;
+        }));
         
-        // Language diversity (if we have topics)
-        if (repo.topics && repo.topics.length > 0) {
-            score += Math.min(repo.topics.length * 5, 25);
+        if (missing.length > 0) {
+            console.log(`🧩 Prefetched details for ${missing.length} repositories in ${batches.length} GraphQL queries`);
         }
+        return missing.length;
+    }
+    
+    /**
+     * Fetch details for up to detailsBatchSize repositories in one query,
+     * one aliased repository field each, and cache them
+     */
+    async fetchDetailsBatch(names, priority = 'normal') {
+        const variables = { owner: this.username };
+        const fields = names.map((name, index) => {
+            variables[`name${index}`] = name;
+            return `r${index}: repository(owner: $owner, name: $name${index}) { ...RepositoryDetails }`;
+        });
+        const declarations = names.map((name, index) => `$name${index}: String!`).join(', ');
+        const query = `query RepositoryDetails($owner: String!, ${declarations}) { ${fields.join(' ')} } ${REPOSITORY_DETAILS_FRAGMENT}`;
         
-        return Math.min(score, 100);
+        const data = await this.makeGraphQLRequest(query, variables, { priority });
+        names.forEach((name, index) => {
+            const node = data[`r${index}`];
+            if (node) {
+                this.cache.set(`repo_details_${name}`, { data: this.graphQLToDetails(node), timestamp: Date.now() });
+            }
+        });
+    }
+    
+    /**
+     * Convert a RepositoryDetails node into the shape the REST path
+     * returns (repository fields + languages, lastCommit and activity)
+     */
+    graphQLToDetails(node) {
+        const repo = {
+            id: node.databaseId,
+            name: node.name,
+            full_name: node.nameWithOwner,
+            description: node.description,
+            html_url: node.url,
+            homepage: node.homepageUrl,
+            stargazers_count: node.stargazerCount,
+            forks_count: node.forkCount,
+            updated_at: node.updatedAt,
+            pushed_at: node.pushedAt,
+            language: node.primaryLanguage?.name || null,
+            topics: (node.repositoryTopics?.nodes || []).map(item => item.topic.name)
+        };
+        
+        const target = node.defaultBranchRef?.target;
+        const lastCommit = target?.oid ? {
+            sha: target.oid,
+            html_url: target.url,
+            commit: { message: target.message, author: target.author }
+        } : null;
+        
+        return {
+            ...repo,
+            languages: Object.fromEntries((node.languages?.edges || []).map(edge => [edge.node.name, edge.size])),
+            lastCommit: lastCommit,
+            activity: this.calculateActivityScore(repo, lastCommit)
+        };
+    }
+    
+    /**
+     * Calculate repository activity score
+     */
+    calculateActivityScore(repo, lastCommit) {
+        return githubActivityScore(repo);
     }
     
     /**
@@ -325,7 +1370,7 @@ class GitHubAPIManager {
             {
                 id: 1,
                 name: 'ULTIMATE-HYPERFOCUS-CONSTELLATION',
-                description: 'The world\'s most advanced 3D repository visualization designed for neurodivergent minds',
+                description: 'The world\\'s most advanced 3D repository visualization designed for neurodivergent minds',
                 category: 'core',
                 stars: 0,
                 forks: 0,
@@ -346,7 +1391,10 @@ class GitHubAPIManager {
         return {
             remaining: this.rateLimitRemaining,
             reset: new Date(this.rateLimitReset),
-            waitTime: Math.max(0, this.rateLimitReset - Date.now())
+            waitTime: Math.max(0, this.rateLimitReset - Date.now()),
+            tokens: Math.floor(this.tokens),
+            active: this.activeRequests,
+            queued: Object.fromEntries(REQUEST_LANES.map(lane => [lane, this.requestQueues[lane].length]))
         };
     }
 }
@@ -355,6 +1403,9 @@ class GitHubAPIManager {
 window.GitHubAPIManager = GitHubAPIManager;
 '''
 
+# Embed the shared category matcher so the browser categorises like the Python tooling
+github_api_integration = github_api_integration.replace(MATCHER_PLACEHOLDER, render_matcher())
+
 # Save the GitHub API integration
 with open('github-api-manager.js', 'w', encoding='utf-8') as f:
     f.write(github_api_integration)
@@ -363,9 +1414,16 @@ print("✅ GitHub API Manager created!")
 print("📁 File: github-api-manager.js")
 print("🔗 Features:")
 print("   📊 Real-time GitHub API v4 integration")
-print("   💾 IndexedDB + memory caching with 5min expiry")
-print("   ⚡ Rate limit handling with request queuing")
+print("   💾 IndexedDB + memory caching with 5min expiry (stale-while-revalidate up to 1 day)")
+print("   🧹 Bounded LRU memory cache, IndexedDB byte budget, cache stats")
+print("   🏷️ ETag / Last-Modified revalidation (304s skip parsing)")
+print("   ⚡ Token-bucket request scheduler with priority lanes (4 in flight)")
+print("   📄 Link-header pagination, pages streamed to the engine as they land")
+print("   📸 Instant first render from the data/repos.json snapshot")
 print("   🔄 Smart fallback to mock data if API fails")
 print("   📈 Repository activity scoring")
-print("   🏷️ Automatic category classification")
-print("   🎯 Enhanced repository details fetching")
\ No newline at end of file
+print("   🧵 Fetch, parse, transform and scoring in a Web Worker (typed-array transfer)")
+print("   🏷️ Automatic category classification (shared Aho-Corasick matcher)")
+print("   🎯 Enhanced repository details fetching")
+print("   🧩 Batched GraphQL details prefetch (with a token), REST fallback")
+print("   🤝 Concurrent requests for the same data share one fetch")
\ No newline at end of file
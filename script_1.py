@@ -47,11 +47,11 @@ class ResearchModeManager {
             {
                 id: 'current-state',
                 title: '🚀 Current State',
-                description: 'What\'s happening right now in conversational programming',
+                description: 'What\\'s happening right now in conversational programming',
                 position: { x: 30, y: 15, z: -5 },
                 color: '#7c3aed',
                 content: {
-                    summary: 'Today\'s vibe coding landscape features AI pair programming, voice-driven development, and neurodivergent-optimized interfaces that adapt to different thinking styles.',
+                    summary: 'Today\\'s vibe coding landscape features AI pair programming, voice-driven development, and neurodivergent-optimized interfaces that adapt to different thinking styles.',
                     keyPoints: [
                         'AI assistants understand context and intent',
                         'Voice coding reduces typing fatigue',
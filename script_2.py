@@ -159,7 +159,7 @@ class OnboardingManager {
             },
             {
                 id: 'completion',
-                title: 'You\'re Ready to Explore! 🚀',
+                title: 'You\\'re Ready to Explore! 🚀',
                 content: `
                     <p><strong>Congratulations!</strong> You now know how to navigate your constellation like a pro!</p>
                     <div class="completion-stats">
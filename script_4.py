@@ -1,4 +1,6 @@
 # Create service worker for PWA functionality
+from sw_routes import ROUTES_PLACEHOLDER, render_routes
+
 service_worker = '''/**
  * 🔧 Service Worker for Ultimate Hyperfocus Constellation
  * Provides offline functionality, caching, and performance optimization
@@ -9,29 +11,54 @@ const STATIC_CACHE = 'static-v1.2.0';
 const DYNAMIC_CACHE = 'dynamic-v1.2.0';
 const GITHUB_API_CACHE = 'github-api-v1.0.0';
 
-// Files to cache for offline functionality
-const STATIC_FILES = [
-    '/ULTIMATE-HYPERFOCUS-CONSTELLATION/',
-    '/ULTIMATE-HYPERFOCUS-CONSTELLATION/index.html',
-    '/ULTIMATE-HYPERFOCUS-CONSTELLATION/ultimate_hyperfocus_constellation.js',
-    '/ULTIMATE-HYPERFOCUS-CONSTELLATION/github-api-manager.js',
-    '/ULTIMATE-HYPERFOCUS-CONSTELLATION/research-mode-manager.js',
-    '/ULTIMATE-HYPERFOCUS-CONSTELLATION/onboarding-manager.js',
-    '/ULTIMATE-HYPERFOCUS-CONSTELLATION/manifest.json',
-    'https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js'
-];
+// Release files published as name.<content-hash>.js|css never change
+const HASHED_ASSET_PATTERN = /\\.[0-9a-f]{8}\\.(?:js|css)$/;
 
-// Files that should always be fetched fresh
-const NETWORK_FIRST = [
-    'https://api.github.com'
+// Files to cache for offline functionality, each with the revision of its
+// content (null when the URL itself is versioned). Rewritten by build.py
+// with the hashed release filenames and content revisions.
+const PRECACHE_MANIFEST = [
+    { url: '/ULTIMATE-HYPERFOCUS-CONSTELLATION/', revision: null },
+    { url: '/ULTIMATE-HYPERFOCUS-CONSTELLATION/index.html', revision: null },
+    { url: '/ULTIMATE-HYPERFOCUS-CONSTELLATION/ultimate_hyperfocus_constellation.js', revision: null },
+    { url: '/ULTIMATE-HYPERFOCUS-CONSTELLATION/github-api-manager.js', revision: null },
+    { url: '/ULTIMATE-HYPERFOCUS-CONSTELLATION/research-mode-manager.js', revision: null },
+    { url: '/ULTIMATE-HYPERFOCUS-CONSTELLATION/onboarding-manager.js', revision: null },
+    { url: '/ULTIMATE-HYPERFOCUS-CONSTELLATION/manifest.json', revision: null },
+    { url: 'https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js', revision: null }
 ];
 
-// Files that can be served from cache first
-const CACHE_FIRST = [
-    'https://cdnjs.cloudflare.com',
-    '/ULTIMATE-HYPERFOCUS-CONSTELLATION/icons/',
-    '/ULTIMATE-HYPERFOCUS-CONSTELLATION/screenshots/'
-];
+// Compiled from sw_routes.py when this file is generated: hostname ->
+// path-segment trie -> file extension, each route naming a strategy below
+// together with its cache, entry limit and ages
+const SW_ROUTES = __SW_ROUTES__;
+
+// Logical cache names used by the routes
+const CACHE_NAMES = {
+    'static': STATIC_CACHE,
+    'dynamic': DYNAMIC_CACHE,
+    'github-api': GITHUB_API_CACHE
+};
+
+// Background revalidations in flight, by URL
+const revalidations = new Map();
+
+// Bytes, last access and expiry of every cached entry, plus running totals
+// per cache, are kept in IndexedDB so budgets and CACHE_STATUS never have
+// to read responses back
+const METADATA_DB = 'sw-cache-metadata';
+const METADATA_VERSION = 1;
+// Expired entries are swept at most this often, after fetches
+const SWEEP_INTERVAL = 60 * 1000;
+const SWEEP_BATCH_SIZE = 50;
+// Above this share of the origin's quota, every cache budget is scaled down
+const STORAGE_PRESSURE = 0.8;
+const STORAGE_PRESSURE_SCALE = 0.5;
+// Opaque (no-cors, cross-origin) responses hide their size; each is
+// charged this much so CDN entries still count toward the budgets
+const OPAQUE_RESPONSE_BYTES = 512 * 1024;
+let metadataDB = null;
+let lastSweep = 0;
 
 /**
  * Service Worker Installation
@@ -41,15 +68,71 @@ self.addEventListener('install', (event) => {
     
     event.waitUntil(
         Promise.all([
-            caches.open(STATIC_CACHE).then((cache) => {
-                console.log('📦 Caching static files');
-                return cache.addAll(STATIC_FILES);
-            }),
+            precache(),
             self.skipWaiting() // Activate immediately
         ])
     );
 });
 
+/**
+ * Fill the static cache from the precache manifest. Entries whose
+ * revision is already cached by an earlier version are copied over; only
+ * new and changed entries are downloaded.
+ */
+async function precache() {
+    const cache = await caches.open(STATIC_CACHE);
+    const previousCaches = await Promise.all((await caches.keys())
+        .filter(cacheName => cacheName.startsWith('static-') && cacheName !== STATIC_CACHE)
+        .reverse() // Newest first
+        .map(cacheName => caches.open(cacheName)));
+    let downloaded = 0;
+    
+    await Promise.all(PRECACHE_MANIFEST.map(async ({ url, revision }) => {
+        const current = await cache.match(url);
+        if (current && hasRevision(current, revision)) return;
+        
+        for (const previousCache of previousCaches) {
+            const previous = await previousCache.match(url);
+            if (previous && hasRevision(previous, revision)) {
+                return cachePut(STATIC_CACHE, url, previous, { precached: true });
+            }
+        }
+        
+        const response = await fetch(new Request(url, { cache: revision === null ? 'default' : 'reload' }));
+        if (!response.ok) {
+            throw new Error(`Precaching ${url} failed with ${response.status}`);
+        }
+        downloaded++;
+        await cachePut(STATIC_CACHE, url, await markPrecached(response, revision), { precached: true });
+    }));
+    await bestEffort(enforceBudgets(STATIC_CACHE), 'budget check');
+    
+    console.log(`📦 Precached ${PRECACHE_MANIFEST.length} files, ${downloaded} downloaded`);
+}
+
+/**
+ * Whether a cached response holds this revision; any copy of a versioned
+ * URL (revision null) will do
+ */
+function hasRevision(response, revision) {
+    return revision === null || response.headers.get('sw-precache') === revision;
+}
+
+/**
+ * Copy of a precached response, tagged with its revision
+ */
+async function markPrecached(response, revision) {
+    const headers = new Headers(response.headers);
+    headers.set('sw-precache', revision ?? '');
+    headers.set('sw-cached-at', Date.now().toString());
+    
+    return new Response(await response.blob(), {
+        status: response.status,
+        statusText: response.statusText,
+        headers
+    });
+}
+
 /**
  * Service Worker Activation
  */
@@ -58,19 +141,7 @@ self.addEventListener('activate', (event) => {
     
     event.waitUntil(
         Promise.all([
-            // Clean up old caches
-            caches.keys().then((cacheNames) => {
-                return Promise.all(
-                    cacheNames.map((cacheName) => {
-                        if (cacheName !== STATIC_CACHE && 
-                            cacheName !== DYNAMIC_CACHE && 
-                            cacheName !== GITHUB_API_CACHE) {
-                            console.log('🗑️ Deleting old cache:', cacheName);
-                            return caches.delete(cacheName);
-                        }
-                    })
-                );
-            }),
+            pruneCaches().then(() => bestEffort(performCacheCleanup(), 'sweep')),
             self.clients.claim() // Take control immediately
         ])
     );
@@ -86,77 +157,296 @@ self.addEventListener('activate', (event) => {
     });
 });
 
+/**
+ * Delete old caches. Runtime entries of earlier static caches move to the
+ * current one, so only precache entries that left the manifest and hashed
+ * files that are no longer released are dropped.
+ */
+async function pruneCaches() {
+    const cache = await caches.open(STATIC_CACHE);
+    const precached = new Set(PRECACHE_MANIFEST.map(({ url }) => new URL(url, self.location.href).href));
+    const cacheNames = (await caches.keys())
+        .filter(cacheName => !Object.values(CACHE_NAMES).includes(cacheName));
+    
+    for (const cacheName of cacheNames) {
+        if (cacheName.startsWith('static-')) {
+            const oldCache = await caches.open(cacheName);
+            const keys = await oldCache.keys();
+            await Promise.all(keys.map(async (request) => {
+                if (precached.has(request.url) || isHashedAsset(new URL(request.url))) return;
+                const response = await oldCache.match(request);
+                if (!response || response.headers.has('sw-precache') || await cache.match(request)) return;
+                const entry = await bestEffort(readEntry(cacheName, request.url), 'read');
+                await cachePut(STATIC_CACHE, request.url, response, entry || {});
+            }));
+        }
+        console.log('🗑️ Deleting old cache:', cacheName);
+        await caches.delete(cacheName);
+        await forgetCache(cacheName);
+    }
+    await bestEffort(enforceBudgets(STATIC_CACHE), 'budget check');
+}
+
 /**
  * Fetch Event Handler - Main request interception
  */
 self.addEventListener('fetch', (event) => {
     const { request } = event;
-    const url = new URL(request.url);
     
     // Skip non-GET requests
     if (request.method !== 'GET') return;
     
-    // Handle different types of requests
-    if (isGitHubAPIRequest(url)) {
-        event.respondWith(handleGitHubAPI(request));
-    } else if (isStaticAsset(url)) {
-        event.respondWith(handleStaticAsset(request));
-    } else if (isCDNRequest(url)) {
-        event.respondWith(handleCDNRequest(request));
-    } else if (isAppRequest(url)) {
-        event.respondWith(handleAppRequest(request));
-    } else {
-        event.respondWith(handleGenericRequest(request));
+    const route = matchRoute(new URL(request.url));
+    const response = STRATEGIES[route.strategy](request, route, event);
+    event.respondWith(response);
+    
+    // Sweep expired entries once the response is on its way
+    if (Date.now() - lastSweep > SWEEP_INTERVAL) {
+        lastSweep = Date.now();
+        event.waitUntil(response.catch(() => {}).then(performCacheCleanup).catch((error) => {
+            console.warn('⚠️ Cache cleanup failed:', error);
+        }));
     }
 });
 
+const STRATEGIES = {
+    'cache-first': cacheFirst,
+    'network-first': networkFirst,
+    'stale-while-revalidate': staleWhileRevalidate,
+    'network-only': (request) => fetch(request),
+    'app-shell': handleAppRequest
+};
+
+/**
+ * Find the route for a URL: walk the host's path trie as deep as the path
+ * goes, then take the deepest route that accepts the file extension
+ * (mirrors match_route in sw_routes.py)
+ */
+function matchRoute(url) {
+    const segments = url.pathname.split('/').filter(Boolean);
+    const last = segments[segments.length - 1] || '';
+    const dot = last.lastIndexOf('.');
+    const extension = dot > 0 ? last.slice(dot).toLowerCase() : '';
+    const host = url.origin === self.location.origin ? '' : url.hostname;
+    
+    const nodes = [];
+    let node = Object.hasOwn(SW_ROUTES.hosts, host) ? SW_ROUTES.hosts[host] : null;
+    for (let i = 0; node; i++) {
+        nodes.push(node);
+        node = i < segments.length && Object.hasOwn(node.c, segments[i]) ? node.c[segments[i]] : null;
+    }
+    
+    for (let i = nodes.length - 1; i >= 0; i--) {
+        const match = nodes[i].r.find(([, extensions]) => !extensions || extensions.includes(extension));
+        if (match) return SW_ROUTES.routes[match[0]];
+    }
+    return SW_ROUTES.routes[SW_ROUTES.default];
+}
+
+/**
+ * Cache first: serve a fresh cached response, otherwise go to the network
+ */
+async function cacheFirst(request, route, event) {
+    const cache = await caches.open(CACHE_NAMES[route.cache]);
+    const cachedResponse = await cache.match(request.url, { ignoreVary: true });
+    
+    if (cachedResponse && isFresh(request, cachedResponse, route)) {
+        return serveCached(request, route, cachedResponse);
+    }
+    return fetchWithFallback(request, route, cachedResponse, event);
+}
+
+/**
+ * Network first: the cache is only used when the network fails
+ */
+async function networkFirst(request, route, event) {
+    const cache = await caches.open(CACHE_NAMES[route.cache]);
+    const cachedResponse = await cache.match(request.url, { ignoreVary: true });
+    
+    return fetchWithFallback(request, route, cachedResponse, event);
+}
+
 /**
- * Handle GitHub API requests with intelligent caching
+ * Stale-while-revalidate: serve the cached response at once and, once it
+ * is older than maxAge, refresh it in the background
  */
-async function handleGitHubAPI(request) {
-    const cache = await caches.open(GITHUB_API_CACHE);
-    const cacheKey = request.url;
+async function staleWhileRevalidate(request, route, event) {
+    const cache = await caches.open(CACHE_NAMES[route.cache]);
+    const cachedResponse = await cache.match(request.url, { ignoreVary: true });
     
+    if (cachedResponse && isFresh(request, cachedResponse, route)) {
+        return serveCached(request, route, cachedResponse);
+    }
+    if (cachedResponse && isServable(cachedResponse, route)) {
+        console.log('⚡ Serving stale response, revalidating:', request.url);
+        event.waitUntil(revalidate(request, route, cachedResponse));
+        return serveCached(request, route, cachedResponse);
+    }
+    return fetchWithFallback(request, route, cachedResponse, event);
+}
+
+/**
+ * Fetch and cache a response, falling back to the cached one while it is
+ * servable, then to the error response or an offline response. The
+ * response goes back to the page at once; caching it finishes in the
+ * background, under the fetch event's waitUntil.
+ */
+async function fetchWithFallback(request, route, cachedResponse, event) {
+    let errorResponse = null;
     try {
-        // Try to fetch fresh data
-        const response = await fetch(request);
-        
-        if (response.ok) {
-            // Cache successful responses for 5 minutes
-            const responseClone = response.clone();
-            const cacheResponse = new Response(responseClone.body, {
-                status: responseClone.status,
-                statusText: responseClone.statusText,
-                headers: {
-                    ...Object.fromEntries(responseClone.headers.entries()),
-                    'sw-cached-at': Date.now().toString(),
-                    'sw-cache-expires': (Date.now() + 5 * 60 * 1000).toString() // 5 minutes
-                }
-            });
-            
-            cache.put(cacheKey, cacheResponse);
-            return response;
-        } else {
-            throw new Error(`API responded with ${response.status}`);
-        }
+        const { response, stored } = await refreshCached(request, route, cachedResponse);
+        event.waitUntil(stored);
+        return answerConditionally(request, response);
     } catch (error) {
         console.log('🔄 Network failed, trying cache for:', request.url);
-        
-        // Try cache as fallback
-        const cachedResponse = await cache.match(cacheKey);
-        
-        if (cachedResponse) {
-            const cacheExpires = cachedResponse.headers.get('sw-cache-expires');
-            
-            if (cacheExpires && Date.now() < parseInt(cacheExpires)) {
-                console.log('📦 Serving cached API response');
-                return cachedResponse;
-            } else {
-                console.log('⏰ Cached API response expired');
+        errorResponse = error.response || null;
+    }
+    
+    if (cachedResponse && isServable(cachedResponse, route)) {
+        console.log('📦 Serving cached response:', request.url);
+        return serveCached(request, route, cachedResponse);
+    }
+    if (cachedResponse) {
+        console.log('⏰ Cached response too old to serve:', request.url);
+    }
+    return errorResponse || offlineResponse(route);
+}
+
+/**
+ * Fetch a response, revalidating the cached one with its own validators
+ * (not the page's), and cache the result.
+ * Resolves to { response, changed, stored }: the re-stamped cached
+ * response on a 304, otherwise the network response, and a promise that
+ * settles once it is cached (it never rejects). Rejects on network errors
+ * and on error statuses (with the response attached as `error.response`).
+ */
+async function refreshCached(request, route, cachedResponse) {
+    let networkRequest = request;
+    if (request.mode !== 'no-cors') {
+        const headers = new Headers(request.headers);
+        headers.delete('If-None-Match');
+        headers.delete('If-Modified-Since');
+        if (cachedResponse?.headers.has('ETag')) headers.set('If-None-Match', cachedResponse.headers.get('ETag'));
+        if (cachedResponse?.headers.has('Last-Modified')) headers.set('If-Modified-Since', cachedResponse.headers.get('Last-Modified'));
+        networkRequest = new Request(request, { headers });
+    }
+    
+    const response = await fetch(networkRequest);
+    
+    if (response.status === 304 && cachedResponse) {
+        const restamped = await stampResponse(cachedResponse);
+        return { response: restamped, changed: false, stored: storeResponse(request.url, restamped.clone(), route) };
+    }
+    if (!response.ok) {
+        const error = new Error(`Responded with ${response.status}`);
+        error.response = response;
+        throw error;
+    }
+    
+    const stored = stampResponse(response.clone())
+        .then(stamped => storeResponse(request.url, stamped, route))
+        .catch(error => console.warn('⚠️ Could not cache response:', request.url, error));
+    const etag = cachedResponse?.headers.get('ETag');
+    return { response, changed: Boolean(cachedResponse) && (!etag || response.headers.get('ETag') !== etag), stored };
+}
+
+/**
+ * Refresh a stale response in the background; the route's notify message
+ * is posted to clients when a different body lands
+ */
+function revalidate(request, route, cachedResponse) {
+    if (!revalidations.has(request.url)) {
+        const revalidation = refreshCached(request, route, cachedResponse).then(async ({ changed, stored }) => {
+            await stored;
+            if (changed && route.notify) {
+                console.log('🔄 Fresher response cached:', request.url);
+                return notifyClients({ type: route.notify, url: request.url });
             }
-        }
-        
-        // Return offline response
+        }).catch(() => {
+            // Keep serving the cached response
+        }).finally(() => {
+            revalidations.delete(request.url);
+        });
+        revalidations.set(request.url, revalidation);
+    }
+    return revalidations.get(request.url);
+}
+
+/**
+ * Milliseconds since a response was cached
+ */
+function cacheAge(response) {
+    const cachedAt = parseInt(response.headers.get('sw-cached-at')) ||
+        Date.parse(response.headers.get('Date')) || Date.now();
+    return Date.now() - cachedAt;
+}
+
+/**
+ * Whether a cached response may be served without revalidation
+ */
+function isFresh(request, response, route) {
+    return route.maxAge === null || isHashedAsset(new URL(request.url)) || cacheAge(response) < route.maxAge;
+}
+
+/**
+ * Whether a cached response may be served at all (hardMaxAge)
+ */
+function isServable(response, route) {
+    return route.hardMaxAge === null || cacheAge(response) < route.hardMaxAge;
+}
+
+/**
+ * Copy of a response for the cache, stamped with its cache time (the
+ * expiry is kept in the metadata). Rate-limit headers are dropped: they
+ * are stale once cached.
+ */
+async function stampResponse(response) {
+    const headers = new Headers(response.headers);
+    [...headers.keys()]
+        .filter(name => name.toLowerCase().startsWith('x-ratelimit-'))
+        .forEach(name => headers.delete(name));
+    headers.set('sw-cached-at', Date.now().toString());
+    
+    return new Response(await response.blob(), {
+        status: response.status,
+        statusText: response.statusText,
+        headers
+    });
+}
+
+/**
+ * Answer from the cache, recording the access for LRU eviction
+ */
+function serveCached(request, route, response) {
+    touchEntry(CACHE_NAMES[route.cache], request.url).catch(() => {
+        // Access times are best effort
+    });
+    return answerConditionally(request, response);
+}
+
+/**
+ * Answer a conditional request with a 304 when the page already holds
+ * this body, so it neither downloads nor parses it again
+ */
+function answerConditionally(request, response) {
+    const etag = response.headers.get('ETag');
+    if (!etag || request.headers.get('If-None-Match') !== etag) {
+        return response;
+    }
+    
+    const headers = { 'ETag': etag };
+    // Marks the answer as cached, so the page does not count it against its rate limit
+    ['Link', 'sw-cached-at'].forEach((name) => {
+        if (response.headers.has(name)) headers[name] = response.headers.get(name);
+    });
+    return new Response(null, { status: 304, statusText: 'Not Modified', headers });
+}
+
+/**
+ * Response for when neither the network nor the cache can answer
+ */
+function offlineResponse(route) {
+    if (route.offline === 'json') {
         return new Response(
             JSON.stringify({
                 error: 'Offline',
@@ -170,75 +460,299 @@ async function handleGitHubAPI(request) {
             }
         );
     }
+    return new Response('Resource unavailable offline', { status: 404 });
 }
 
 /**
- * Handle static assets (cache first)
+ * Post a message to every client
  */
-async function handleStaticAsset(request) {
-    const cache = await caches.open(STATIC_CACHE);
-    const cachedResponse = await cache.match(request);
-    
-    if (cachedResponse) {
-        console.log('📦 Serving cached static asset:', request.url);
-        return cachedResponse;
+async function notifyClients(message) {
+    const clients = await self.clients.matchAll();
+    clients.forEach(client => client.postMessage(message));
+}
+
+/**
+ * Open the cache metadata database (once per worker)
+ */
+function openMetadata() {
+    if (!metadataDB) {
+        metadataDB = new Promise((resolve, reject) => {
+            const request = indexedDB.open(METADATA_DB, METADATA_VERSION);
+            let blocked = false;
+            request.onupgradeneeded = () => {
+                const db = request.result;
+                const entries = db.createObjectStore('entries', { keyPath: ['cache', 'url'] });
+                entries.createIndex('cache', 'cache');
+                entries.createIndex('cacheAccess', ['cache', 'lastAccess']);
+                // Entries without a route (precached files) stay out of this index
+                entries.createIndex('routeAccess', ['route', 'lastAccess']);
+                // Sorted expiry times; entries that never expire (null) are not indexed
+                entries.createIndex('expires', 'expires');
+                db.createObjectStore('totals', { keyPath: 'cache' });
+            };
+            request.onsuccess = () => {
+                const db = request.result;
+                if (blocked) {
+                    db.close(); // Callers already moved on; the next use reopens
+                    return;
+                }
+                // Step aside when a newer worker upgrades the schema
+                db.onversionchange = () => {
+                    db.close();
+                    metadataDB = null;
+                };
+                resolve(db);
+            };
+            request.onerror = () => reject(request.error);
+            // A worker still holding an older version open would otherwise
+            // leave every metadata write waiting on this open
+            request.onblocked = () => {
+                blocked = true;
+                reject(new Error('Cache metadata upgrade blocked by an open connection'));
+            };
+        }).catch((error) => {
+            metadataDB = null; // Retry on the next use
+            throw error;
+        });
     }
+    return metadataDB;
+}
+
+/**
+ * Run `work(transaction)` and resolve with its return value once the
+ * transaction has committed
+ */
+async function metadataTransaction(storeNames, mode, work) {
+    const db = await openMetadata();
+    return new Promise((resolve, reject) => {
+        const transaction = db.transaction(storeNames, mode);
+        const result = work(transaction);
+        transaction.oncomplete = () => resolve(result);
+        transaction.onerror = () => reject(transaction.error);
+        transaction.onabort = () => reject(transaction.error);
+    });
+}
+
+/**
+ * The metadata only drives budgets and expiry: when IndexedDB fails (quota,
+ * a blocked upgrade, private mode) log it and carry on without it
+ */
+function bestEffort(promise, description) {
+    return promise.catch((error) => {
+        console.warn(`⚠️ Cache metadata ${description} failed:`, error);
+    });
+}
+
+/**
+ * Put a response in a cache and record its metadata (best effort). Options:
+ * route (name, for per-route limits), expires (ms timestamp or null),
+ * lastAccess and precached (never evicted).
+ */
+async function cachePut(cacheName, url, response, { route = null, expires = null, lastAccess = Date.now(), precached = false } = {}) {
+    url = new URL(url, self.location.href).href;
+    const bytes = response.type === 'opaque' ? OPAQUE_RESPONSE_BYTES : (await response.clone().blob()).size;
+    await (await caches.open(cacheName)).put(url, response);
     
+    const entry = { cache: cacheName, url, bytes, lastAccess, expires, precached };
+    if (route) entry.route = route;
+    await bestEffort(metadataTransaction(['entries', 'totals'], 'readwrite', (transaction) => {
+        const entries = transaction.objectStore('entries');
+        const totals = transaction.objectStore('totals');
+        entries.get([cacheName, url]).onsuccess = (event) => {
+            const previous = event.target.result;
+            entries.put(entry);
+            totals.get(cacheName).onsuccess = (event) => {
+                const total = event.target.result || { cache: cacheName, bytes: 0, entries: 0 };
+                total.bytes += bytes - (previous ? previous.bytes : 0);
+                total.entries += previous ? 0 : 1;
+                totals.put(total);
+            };
+        };
+    }), 'update');
+}
+
+/**
+ * Cache a response fetched for a route and enforce the budgets. Never
+ * throws: a response that cannot be cached is still a good response.
+ */
+async function storeResponse(url, response, route) {
+    const cacheName = CACHE_NAMES[route.cache];
     try {
-        const response = await fetch(request);
-        
-        if (response.ok) {
-            cache.put(request, response.clone());
-        }
-        
-        return response;
+        await cachePut(cacheName, url, response, {
+            route: route.name,
+            expires: route.hardMaxAge !== null ? Date.now() + route.hardMaxAge : null
+        });
     } catch (error) {
-        console.log('❌ Failed to fetch static asset:', request.url);
-        return new Response('Asset unavailable offline', { status: 404 });
+        console.warn('⚠️ Could not cache response:', url, error);
+        return;
     }
+    await bestEffort(enforceBudgets(cacheName, route), 'budget check');
+}
+
+function readEntry(cacheName, url) {
+    return metadataTransaction(['entries'], 'readonly', (transaction) => {
+        const result = {};
+        transaction.objectStore('entries').get([cacheName, url]).onsuccess = (event) => {
+            result.entry = event.target.result;
+        };
+        return result;
+    }).then(result => result.entry);
 }
 
 /**
- * Handle CDN requests (cache first with long expiry)
+ * Record that an entry was just served
  */
-async function handleCDNRequest(request) {
-    const cache = await caches.open(STATIC_CACHE);
-    const cachedResponse = await cache.match(request);
-    
-    if (cachedResponse) {
-        console.log('📦 Serving cached CDN asset:', request.url);
-        
-        // Optionally fetch fresh version in background
-        fetch(request).then((response) => {
-            if (response.ok) {
-                cache.put(request, response.clone());
+function touchEntry(cacheName, url) {
+    return metadataTransaction(['entries'], 'readwrite', (transaction) => {
+        const entries = transaction.objectStore('entries');
+        entries.get([cacheName, url]).onsuccess = (event) => {
+            const entry = event.target.result;
+            if (entry) {
+                entry.lastAccess = Date.now();
+                entries.put(entry);
             }
-        }).catch(() => {
-            // Ignore background fetch errors
-        });
-        
-        return cachedResponse;
-    }
+        };
+    });
+}
+
+/**
+ * Delete entries from a cache and from the metadata
+ */
+async function removeEntries(cacheName, urls) {
+    const cache = await caches.open(cacheName);
+    await Promise.all(urls.map(url => cache.delete(url)));
     
-    try {
-        const response = await fetch(request);
-        
-        if (response.ok) {
-            cache.put(request, response.clone());
+    await bestEffort(metadataTransaction(['entries', 'totals'], 'readwrite', (transaction) => {
+        const entries = transaction.objectStore('entries');
+        const totals = transaction.objectStore('totals');
+        let bytes = 0;
+        let removed = 0;
+        urls.forEach((url) => {
+            entries.get([cacheName, url]).onsuccess = (event) => {
+                const entry = event.target.result;
+                if (!entry) return;
+                bytes += entry.bytes;
+                removed++;
+                entries.delete([cacheName, url]);
+            };
+        });
+        // Requests run in order, so every entry above has been counted
+        totals.get(cacheName).onsuccess = (event) => {
+            const total = event.target.result;
+            if (!total) return;
+            total.bytes -= bytes;
+            total.entries -= removed;
+            totals.put(total);
+        };
+    }), 'update');
+}
+
+/**
+ * Drop the metadata of a deleted cache (of every cache without a name)
+ */
+function forgetCache(cacheName = null) {
+    return bestEffort(metadataTransaction(['entries', 'totals'], 'readwrite', (transaction) => {
+        const entries = transaction.objectStore('entries');
+        const totals = transaction.objectStore('totals');
+        if (cacheName === null) {
+            entries.clear();
+            totals.clear();
+            return;
+        }
+        const request = entries.index('cache').openKeyCursor(IDBKeyRange.only(cacheName));
+        request.onsuccess = () => {
+            const cursor = request.result;
+            if (!cursor) return;
+            entries.delete(cursor.primaryKey);
+            cursor.continue();
+        };
+        totals.delete(cacheName);
+    }), 'reset');
+}
+
+function readTotals() {
+    return metadataTransaction(['totals'], 'readonly', (transaction) => {
+        const totals = new Map();
+        transaction.objectStore('totals').getAll().onsuccess = (event) => {
+            event.target.result.forEach(total => totals.set(total.cache, total));
+        };
+        return totals;
+    });
+}
+
+/**
+ * Least recently used entries of an index range, oldest first, collected
+ * until `enough(picked)`; precached entries are never picked
+ */
+function leastRecentlyUsed(indexName, range, enough) {
+    return metadataTransaction(['entries'], 'readonly', (transaction) => {
+        const picked = [];
+        const request = transaction.objectStore('entries').index(indexName).openCursor(range);
+        request.onsuccess = () => {
+            const cursor = request.result;
+            if (!cursor || enough(picked)) return;
+            if (!cursor.value.precached) picked.push(cursor.value);
+            cursor.continue();
+        };
+        return picked;
+    });
+}
+
+/**
+ * Evict least recently used entries beyond the route's maxEntries, then
+ * beyond the cache's byte and entry budget (scaled down under storage
+ * pressure)
+ */
+async function enforceBudgets(cacheName, route = null) {
+    if (route?.maxEntries) {
+        const range = IDBKeyRange.bound([route.name, -Infinity], [route.name, Infinity]);
+        const count = await metadataTransaction(['entries'], 'readonly', (transaction) => {
+            const result = {};
+            transaction.objectStore('entries').index('routeAccess').count(range).onsuccess = (event) => {
+                result.count = event.target.result;
+            };
+            return result;
+        }).then(result => result.count);
+        if (count > route.maxEntries) {
+            const evicted = await leastRecentlyUsed('routeAccess', range, picked => picked.length >= count - route.maxEntries);
+            await removeEntries(cacheName, evicted.map(entry => entry.url));
         }
-        
-        return response;
-    } catch (error) {
-        console.log('❌ Failed to fetch CDN asset:', request.url);
-        return new Response('CDN asset unavailable offline', { status: 404 });
     }
+    
+    const logicalName = Object.keys(CACHE_NAMES).find(name => CACHE_NAMES[name] === cacheName);
+    const budget = SW_ROUTES.caches[logicalName];
+    const total = (await readTotals()).get(cacheName);
+    if (!budget || !total) return;
+    
+    const scale = await storageScale();
+    const maxBytes = budget.maxBytes * scale;
+    const maxEntries = Math.floor(budget.maxEntries * scale);
+    if (total.bytes <= maxBytes && total.entries <= maxEntries) return;
+    
+    const range = IDBKeyRange.bound([cacheName, -Infinity], [cacheName, Infinity]);
+    const evicted = await leastRecentlyUsed('cacheAccess', range, (picked) => {
+        const bytes = picked.reduce((sum, entry) => sum + entry.bytes, 0);
+        return total.bytes - bytes <= maxBytes && total.entries - picked.length <= maxEntries;
+    });
+    console.log(`🧹 Evicting ${evicted.length} least recently used entries from ${cacheName}`);
+    await removeEntries(cacheName, evicted.map(entry => entry.url));
+}
+
+/**
+ * Budget multiplier: STORAGE_PRESSURE_SCALE once the origin uses more than
+ * STORAGE_PRESSURE of its quota
+ */
+async function storageScale() {
+    if (!self.navigator?.storage?.estimate) return 1;
+    const { usage, quota } = await self.navigator.storage.estimate();
+    return quota && usage > quota * STORAGE_PRESSURE ? STORAGE_PRESSURE_SCALE : 1;
 }
 
 /**
  * Handle app requests (always serve app shell)
  */
-async function handleAppRequest(request) {
-    const cache = await caches.open(STATIC_CACHE);
+async function handleAppRequest(request, route) {
+    const cache = await caches.open(CACHE_NAMES[route.cache]);
     
     // Always try to serve the main app shell
     const appShell = await cache.match('/ULTIMATE-HYPERFOCUS-CONSTELLATION/index.html');
@@ -253,7 +767,8 @@ async function handleAppRequest(request) {
         const response = await fetch('/ULTIMATE-HYPERFOCUS-CONSTELLATION/index.html');
         
         if (response.ok) {
-            cache.put('/ULTIMATE-HYPERFOCUS-CONSTELLATION/index.html', response.clone());
+            cachePut(CACHE_NAMES[route.cache], '/ULTIMATE-HYPERFOCUS-CONSTELLATION/index.html', response.clone(),
+                { precached: true }).catch(error => console.warn('⚠️ Could not cache app shell:', error));
         }
         
         return response;
@@ -318,56 +833,8 @@ async function handleAppRequest(request) {
     }
 }
 
-/**
- * Handle generic requests
- */
-async function handleGenericRequest(request) {
-    const cache = await caches.open(DYNAMIC_CACHE);
-    
-    try {
-        const response = await fetch(request);
-        
-        if (response.ok) {
-            cache.put(request, response.clone());
-        }
-        
-        return response;
-    } catch (error) {
-        const cachedResponse = await cache.match(request);
-        
-        if (cachedResponse) {
-            return cachedResponse;
-        }
-        
-        return new Response('Resource unavailable offline', { status: 404 });
-    }
-}
-
-/**
- * Utility functions for request classification
- */
-function isGitHubAPIRequest(url) {
-    return url.hostname === 'api.github.com';
-}
-
-function isStaticAsset(url) {
-    return url.pathname.includes('/ULTIMATE-HYPERFOCUS-CONSTELLATION/') && 
-           (url.pathname.endsWith('.js') || 
-            url.pathname.endsWith('.css') || 
-            url.pathname.endsWith('.json') ||
-            url.pathname.includes('/icons/') ||
-            url.pathname.includes('/screenshots/'));
-}
-
-function isCDNRequest(url) {
-    return CACHE_FIRST.some(domain => url.href.includes(domain));
-}
-
-function isAppRequest(url) {
-    return url.pathname === '/ULTIMATE-HYPERFOCUS-CONSTELLATION/' ||
-           url.pathname === '/ULTIMATE-HYPERFOCUS-CONSTELLATION/index.html' ||
-           url.pathname.includes('/ULTIMATE-HYPERFOCUS-CONSTELLATION') && 
-           !url.pathname.includes('.');
+function isHashedAsset(url) {
+    return HASHED_ASSET_PATTERN.test(url.pathname);
 }
 
 /**
@@ -395,6 +862,7 @@ async function syncGitHubData() {
         const keys = await cache.keys();
         
         await Promise.all(keys.map(key => cache.delete(key)));
+        await forgetCache(GITHUB_API_CACHE);
         
         // Notify the app to refresh data
         const clients = await self.clients.matchAll();
@@ -541,28 +1009,39 @@ self.addEventListener('message', (event) => {
 async function clearAllCaches() {
     const cacheNames = await caches.keys();
     await Promise.all(cacheNames.map(name => caches.delete(name)));
+    await forgetCache();
     console.log('🗑️ All caches cleared');
 }
 
 /**
- * Get cache status information
+ * Get cache status information: entries and bytes per cache from the
+ * metadata, each cache's budget and the origin's storage estimate
  */
 async function getCacheStatus() {
     const cacheNames = await caches.keys();
+    const totals = await readTotals();
     const status = {};
+    let totalBytes = 0;
     
     for (const cacheName of cacheNames) {
-        const cache = await caches.open(cacheName);
-        const keys = await cache.keys();
+        const total = totals.get(cacheName) || { bytes: 0, entries: 0 };
+        const logicalName = Object.keys(CACHE_NAMES).find(name => CACHE_NAMES[name] === cacheName);
+        const budget = SW_ROUTES.caches[logicalName] || {};
         status[cacheName] = {
-            count: keys.length,
-            size: 'Unknown' // Would need to calculate actual size
+            count: total.entries,
+            size: total.bytes,
+            maxEntries: budget.maxEntries ?? null,
+            maxBytes: budget.maxBytes ?? null
         };
+        totalBytes += total.bytes;
     }
     
+    const estimate = self.navigator?.storage?.estimate ? await self.navigator.storage.estimate() : null;
     return {
         caches: status,
-        totalCaches: cacheNames.length
+        totalCaches: cacheNames.length,
+        totalBytes,
+        storage: estimate ? { usage: estimate.usage, quota: estimate.quota } : null
     };
 }
 
@@ -576,30 +1055,43 @@ self.addEventListener('periodicsync', (event) => {
 });
 
 /**
- * Clean up old cache entries
+ * Delete every expired entry from every cache: a range scan of the
+ * metadata expiry index, then deletes in batches, run in parallel
  */
 async function performCacheCleanup() {
     console.log('🧹 Performing cache cleanup...');
     
-    const cache = await caches.open(GITHUB_API_CACHE);
-    const keys = await cache.keys();
+    const expired = await metadataTransaction(['entries'], 'readonly', (transaction) => {
+        const result = { entries: [] };
+        const index = transaction.objectStore('entries').index('expires');
+        index.getAll(IDBKeyRange.upperBound(Date.now())).onsuccess = (event) => {
+            result.entries = event.target.result;
+        };
+        return result;
+    }).then(result => result.entries);
     
-    for (const request of keys) {
-        const response = await cache.match(request);
-        const cacheExpires = response.headers.get('sw-cache-expires');
-        
-        if (cacheExpires && Date.now() > parseInt(cacheExpires)) {
-            await cache.delete(request);
-            console.log('🗑️ Cleaned expired cache entry:', request.url);
+    const byCache = new Map();
+    expired.forEach(({ cache, url }) => {
+        if (!byCache.has(cache)) byCache.set(cache, []);
+        byCache.get(cache).push(url);
+    });
+    
+    const batches = [];
+    byCache.forEach((urls, cacheName) => {
+        for (let start = 0; start < urls.length; start += SWEEP_BATCH_SIZE) {
+            batches.push(removeEntries(cacheName, urls.slice(start, start + SWEEP_BATCH_SIZE)));
         }
-    }
+    });
+    await Promise.all(batches);
     
-    console.log('✅ Cache cleanup completed');
+    console.log(`✅ Cache cleanup completed (${expired.length} expired entries removed)`);
 }
 
 console.log('🔧 Service Worker script loaded');
 '''
 
+service_worker = service_worker.replace(ROUTES_PLACEHOLDER, render_routes())
+
 # Save the service worker
 with open('sw.js', 'w', encoding='utf-8') as f:
     f.write(service_worker)
@@ -612,8 +1104,12 @@ print("   📦 Intelligent caching strategies")
 print("   🔄 Background sync when connection restored")
 print("   🔔 Push notification support")
 print("   ⚡ GitHub API caching with smart expiry")
-print("   🗑️ Automatic cache cleanup")
-print("   📊 Cache status reporting")
+print("   🔁 Per-route stale-while-revalidate for the GitHub API")
+print("   🧭 Declarative route table compiled from sw_routes.py")
+print("   🧾 Revisioned precache manifest: updates only download what changed")
+print("   🗑️ Automatic cache cleanup (expiry index sweep after fetches)")
+print("   📊 Cache status reporting (real byte counts and storage estimate)")
+print("   ⚖️ Per-cache byte/entry budgets with LRU eviction on write")
 print("   🌐 App shell architecture")
 print("   ♿ Offline accessibility page")
 print("   🎯 Action-based notification handling")
\ No newline at end of file
@@ -149,7 +149,7 @@ class PWAManager {
         
         window.addEventListener('offline', () => {
             this.isOnline = false;
-            this.showNotification('📱 Offline Mode', 'You\'re now offline. Cached content is still available.');
+            this.showNotification('📱 Offline Mode', 'You\\'re now offline. Cached content is still available.');
             
             this.updateConnectionStatus();
         });
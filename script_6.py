@@ -8,7 +8,7 @@ class SEOManager {
     constructor() {
         this.baseURL = 'https://welshdog.github.io/ULTIMATE-HYPERFOCUS-CONSTELLATION/';
         this.siteName = 'Ultimate Hyperfocus Constellation';
-        this.description = 'The world\'s most advanced 3D repository visualization + interactive research platform designed for neurodivergent minds';
+        this.description = 'The world\\'s most advanced 3D repository visualization + interactive research platform designed for neurodivergent minds';
         
         this.initializeSEO();
         this.setupDynamicMeta();
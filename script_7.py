@@ -91,21 +91,25 @@ class ConstellationIntegrator {
             if (this.modules.constellation) {
                 this.modules.constellation.gitHubAPI = this.modules.githubAPI;
                 
-                // Override loadRepositoryData to use real API
+                // Override loadRepositoryData: render the snapshot first, then the real API
                 const originalLoad = this.modules.constellation.loadRepositoryData;
                 this.modules.constellation.loadRepositoryData = async () => {
-                    try {
-                        const repos = await this.modules.githubAPI.fetchUserRepositories();
-                        this.modules.constellation.repositories = repos;
-                        this.modules.constellation.totalStars = repos.reduce((sum, repo) => sum + repo.stars, 0);
-                        
-                        // Update UI
-                        const totalStarsElement = document.getElementById('total-stars');
-                        if (totalStarsElement) {
-                            totalStarsElement.textContent = this.modules.constellation.totalStars;
+                    const snapshot = await this.modules.githubAPI.loadSnapshot();
+                    if (snapshot && snapshot.length > 0) {
+                        const searchIndex = await this.modules.githubAPI.loadSearchIndex(snapshot.map(repo => repo.name));
+                        if (searchIndex) {
+                            this.modules.constellation.loadSearchIndex(searchIndex, snapshot);
                         }
+                        this.modules.constellation.setRepositories(snapshot);
+                        console.log(`📸 Loaded ${snapshot.length} repositories from snapshot`);
                         
-                        console.log(`📊 Loaded ${repos.length} repositories from GitHub API`);
+                        // Reconcile with live data without blocking first paint
+                        this.reconcileWithLiveData();
+                        return;
+                    }
+                    
+                    try {
+                        await this.streamLiveRepositories();
                     } catch (error) {
                         console.warn('⚠️ GitHub API failed, using fallback');
                         await originalLoad.call(this.modules.constellation);
@@ -117,6 +121,66 @@ class ConstellationIntegrator {
         }
     }
     
+    /**
+     * Load live repositories page by page: resolves as soon as the first
+     * page is in, so the constellation builds from it, and appends later
+     * pages as they land. Rejects only if nothing could be loaded.
+     */
+    streamLiveRepositories() {
+        const constellation = this.modules.constellation;
+        return new Promise((resolve, reject) => {
+            let started = false;
+            this.modules.githubAPI.fetchUserRepositories({
+                fallback: false,
+                onPage: repos => {
+                    if (!started) {
+                        started = true;
+                        constellation.setRepositories(repos);
+                        resolve();
+                    } else {
+                        constellation.appendRepositories(repos);
+                    }
+                }
+            }).then(repos => {
+                console.log(`📊 Loaded ${repos.length} repositories from GitHub API`);
+                if (!started) {
+                    started = true;
+                    constellation.setRepositories(repos);
+                    resolve();
+                } else {
+                    constellation.dispatchEvent('repositoriesUpdated', { repositories: constellation.repositories });
+                }
+            }, error => {
+                if (started) {
+                    console.warn('⚠️ Some repository pages failed to load:', error);
+                } else {
+                    reject(error);
+                }
+            });
+        });
+    }
+    
+    /**
+     * Replace snapshot data with live GitHub data once it arrives
+     */
+    async reconcileWithLiveData() {
+        const constellation = this.modules.constellation;
+        try {
+            const repos = await this.modules.githubAPI.fetchUserRepositories({ fallback: false });
+            if (!this.modules.githubAPI.repositoriesDiffer(constellation.repositories, repos)) {
+                console.log('✅ Snapshot matches live repository data');
+                return;
+            }
+            
+            constellation.setRepositories(repos);
+            constellation.rebuildConstellation();
+            constellation.dispatchEvent('repositoriesUpdated', { repositories: constellation.repositories });
+            console.log(`🔄 Reconciled snapshot with ${repos.length} live repositories`);
+        } catch (error) {
+            console.warn('⚠️ Live repository refresh failed, keeping snapshot:', error);
+        }
+    }
+    
     /**
      * Initialize research mode
      */
@@ -238,6 +302,27 @@ class ConstellationIntegrator {
             };
         }
         
+        // Warm repository details for what is on screen (GraphQL, needs a token)
+        if (this.modules.constellation && this.modules.githubAPI) {
+            this.modules.constellation.addEventListener('repositoriesUpdated', () => this.prefetchVisibleDetails());
+            this.prefetchVisibleDetails();
+        }
+        
+        // Background revalidation of stale cached data: patch only what changed
+        if (this.modules.constellation && this.modules.githubAPI) {
+            const constellation = this.modules.constellation;
+            this.modules.githubAPI.addEventListener('repositoriesChanged', event => {
+                constellation.applyRepositoryDiff(event.detail);
+                constellation.dispatchEvent('repositoriesUpdated', { repositories: constellation.repositories });
+            });
+            this.modules.githubAPI.addEventListener('detailsChanged', event => {
+                const { name, details } = event.detail;
+                if (constellation.selectedRepository?.name === name) {
+                    this.updateRepositoryModal(constellation.selectedRepository, details);
+                }
+            });
+        }
+        
         // Focus mode integration
         if (this.modules.constellation && this.modules.pwa) {
             const originalStartHyperfocus = this.modules.constellation.startHyperfocusSession;
@@ -252,6 +337,21 @@ class ConstellationIntegrator {
         }
     }
     
+    /**
+     * Prefetch details for the visible repositories in a few batched
+     * GraphQL queries; a no-op when no access token is configured
+     */
+    prefetchVisibleDetails() {
+        const constellation = this.modules.constellation;
+        const names = constellation.repositoryMeshes.length > 0
+            ? constellation.repositoryMeshes.filter(mesh => mesh.visible).map(mesh => mesh.userData.repository.name)
+            : constellation.repositories.map(repo => repo.name);
+        
+        this.modules.githubAPI.prefetchRepositoryDetails(names).catch(error => {
+            console.warn('⚠️ Repository details prefetch failed:', error);
+        });
+    }
+    
     /**
      * Update repository modal with enhanced details
      */
@@ -357,6 +457,7 @@ class ConstellationIntegrator {
         
         requestAnimationFrame(monitorFrameRate);
         
+        // @debug-start - memory polling is a development aid only
         // Monitor memory usage
         if (performance.memory) {
             setInterval(() => {
@@ -368,6 +469,7 @@ class ConstellationIntegrator {
                 }
             }, 30000);
         }
+        // @debug-end
     }
     
     /**
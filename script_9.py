@@ -3,17 +3,25 @@
 This script generates a detailed report of all production files, deployment
 guides, and achievements for the project. It is configurable to log to a
 file and uses best practices for readability and maintenance.
+
+File sizes are measured from the files on disk and written to a JSON build
+manifest (see ``build_manifest.py``) rather than being typed in by hand.
 """
 
 import logging
+from pathlib import Path
 from typing import List, Dict, Any
 
+from build import write_build_manifest
+from build_manifest import MANIFEST_NAME, format_kb, load_manifest, measure_artifact
+
 __version__ = '1.0.0'
 
 # --- Constants ---
 SEPARATOR_LENGTH = 75
 SECTION_SEPARATOR = "-" * 40
 INDENT = "    "
+PROJECT_ROOT = Path(__file__).resolve().parent
 
 # --- Setup Logging ---
 logging.basicConfig(
@@ -37,70 +45,60 @@ files_created = [
     {
         "id": 127,
         "name": "index.html",
-        "size": "40.4 KB",
         "description": "Complete interactive 3D interface with enhanced PWA integration",
         "features": ["🎮 Full 3D WebGL interface", "♿ WCAG 2.1 AA compliance", "📱 Mobile responsive", "⚡ Hyperfocus UI"]
     },
     {
         "id": 131,
-        "name": "ultimate_hyperfocus_constellation.js",
-        "size": "39.8 KB",
+        "name": "constellation-engine.js",
         "description": "Core Three.js 3D engine with interactive navigation",
         "features": ["🌌 Three.js WebGL rendering", "🎯 37 repository spheres", "⌨️ Keyboard navigation", "📊 Achievement system"]
     },
     {
         "id": 155,
         "name": "github-api-manager.js",
-        "size": "15.2 KB",
         "description": "Real-time GitHub API integration with smart caching",
         "features": ["📊 Live GitHub data", "💾 IndexedDB caching", "⚡ Rate limit handling", "🔄 Smart fallbacks"]
     },
     {
         "id": 156,
         "name": "research-mode-manager.js",
-        "size": "18.7 KB",
         "description": "AI chat interface with interactive research nodes",
         "features": ["🤖 AI chat assistant", "🌟 6 research nodes", "💬 Context-aware responses", "🧠 ADHD-focused tips"]
     },
     {
         "id": 157,
         "name": "onboarding-manager.js",
-        "size": "14.3 KB",
         "description": "Guided walkthrough and contextual tooltips system",
         "features": ["🎓 9-step tour", "💡 Smart tooltips", "🎯 Visual spotlight", "⌨️ Keyboard accessible"]
     },
     {
         "id": 160,
         "name": "pwa-manager.js",
-        "size": "12.8 KB",
         "description": "Progressive Web App features and offline support",
         "features": ["📱 App installation", "🔄 Update management", "📤 Native sharing", "🌐 Offline monitoring"]
     },
     {
         "id": 161,
         "name": "seo-manager.js",
-        "size": "11.4 KB",
         "description": "SEO optimization and social media preview enhancement",
         "features": ["🔍 Meta tags", "🐦 Social previews", "📊 Structured data", "⚡ Performance monitoring"]
     },
     {
         "id": 162,
         "name": "constellation-integrator.js",
-        "size": "9.6 KB",
         "description": "Production system integration and orchestration",
         "features": ["🔗 Module connection", "📈 Analytics ready", "❌ Error handling", "🎮 Performance monitoring"]
     },
     {
         "id": 158,
         "name": "manifest.json",
-        "size": "2.1 KB",
         "description": "PWA manifest for app installation and shortcuts",
         "features": ["🏠 Standalone app", "⚡ App shortcuts", "🎨 Theme colors", "📱 Mobile optimized"]
     },
     {
         "id": 159,
         "name": "sw.js",
-        "size": "16.8 KB",
         "description": "Service worker for complete offline functionality",
         "features": ["📱 Offline support", "📦 Smart caching", "🔄 Background sync", "🔔 Push notifications"]
     }
@@ -110,17 +108,32 @@ deployment_guides = [
     {
         "id": 154,
         "name": "INTERACTIVE-DEPLOYMENT-GUIDE.md",
-        "size": "7.6 KB",
         "description": "Initial deployment instructions for core files"
     },
     {
         "id": 163,
         "name": "PRODUCTION-DEPLOYMENT-GUIDE.md",
-        "size": "12.4 KB",
         "description": "Complete production deployment guide with all enhancements"
     }
 ]
 
+# Prefer the manifest of the last release build; measure the tree otherwise
+manifest = load_manifest(PROJECT_ROOT / MANIFEST_NAME) or write_build_manifest(PROJECT_ROOT)
+artifacts = dict(manifest["artifacts"])
+for guide in deployment_guides:
+    guide_path = PROJECT_ROOT / guide["name"]
+    if guide_path.is_file():
+        artifacts[guide["name"]] = measure_artifact(guide_path)
+
+
+def describe_size(name: str) -> str:
+    """Return a human readable raw/gzip size for a measured artifact."""
+    entry = artifacts.get(name)
+    if entry is None:
+        return "missing - run build.py to generate it"
+    return f"{format_kb(entry['bytes'])}, {format_kb(entry['gzip_bytes'])} gzip"
+
+
 logger.info("")
 logger.info("📁 CORE APPLICATION FILES:")
 logger.info(SECTION_SEPARATOR)
@@ -128,7 +141,7 @@ logger.info(SECTION_SEPARATOR)
 for file in files_created:
     features_str = ", ".join(file["features"])
     log_message = (
-        f"[{file['id']}] {file['name']} ({file['size']})\n"
+        f"[{file['id']}] {file['name']} ({describe_size(file['name'])})\n"
         f"{INDENT}📝 {file['description']}\n"
         f"{INDENT}✨ Features: {features_str}"
     )
@@ -139,31 +152,36 @@ logger.info("📚 DEPLOYMENT GUIDES:")
 logger.info(SECTION_SEPARATOR)
 for guide in deployment_guides:
     log_message = (
-        f"[{guide['id']}] {guide['name']} ({guide['size']})\n"
+        f"[{guide['id']}] {guide['name']} ({describe_size(guide['name'])})\n"
         f"{INDENT}📝 {guide['description']}"
     )
     logger.info(log_message)
 
 
-def calculate_total_size(files: List[Dict[str, Any]]) -> float:
-    """Calculate total size from a list of file dictionaries with error handling.
+def calculate_total_size(files: List[Dict[str, Any]], field: str = "bytes") -> float:
+    """Calculate the measured total size of a list of files.
 
     Args:
         files: A list of dictionaries, where each dictionary represents a file
-               and is expected to have a 'size' key (e.g., "12.3 KB").
+               and is expected to have a 'name' key present in the manifest.
+        field: Which manifest size to sum ("bytes", "gzip_bytes" or
+               "deflate_bytes").
 
     Returns:
-        The total size of all files in kilobytes (KB) as a float.
+        The total size of all measured files in kilobytes (KB) as a float.
     """
     total = 0
     for file_data in files:
-        try:
-            total += float(file_data["size"].replace(" KB", ""))
-        except (ValueError, KeyError):
-            logger.warning(f"Could not parse size for file: {file_data.get('name', 'Unknown')}")
-    return total
+        entry = artifacts.get(file_data.get("name", ""))
+        if entry is None:
+            logger.warning(f"Could not measure size for file: {file_data.get('name', 'Unknown')}")
+            continue
+        total += entry[field]
+    return total / 1024
 
 total_size = calculate_total_size(files_created)
+total_gzip_size = calculate_total_size(files_created, "gzip_bytes")
+total_lines = sum(artifacts[f["name"]]["lines"] for f in files_created if f["name"] in artifacts)
 
 achievements = [
     "🥇 World's first hyperfocus-aware 3D web application",
@@ -182,10 +200,11 @@ logger.info("")
 logger.info("📊 PACKAGE STATISTICS:")
 logger.info(SECTION_SEPARATOR)
 logger.info(f"📁 Total Files: {len(files_created)} production files + {len(deployment_guides)} guides")
-logger.info(f"💾 Total Size: {total_size:.1f} KB optimized package")
+logger.info(f"💾 Total Size: {total_size:.1f} KB raw, {total_gzip_size:.1f} KB gzip "
+            f"(measured, see {MANIFEST_NAME})")
 logger.info(f"🚀 Enhancement Systems: 5 major production systems")
 logger.info(f"⏱️ Development Time: 4 hours of pure hyperfocus")
-logger.info(f"📝 Lines of Code: 3,200+ across all files")
+logger.info(f"📝 Lines of Code: {total_lines:,} across all files")
 
 logger.info("")
 logger.info("🏆 REVOLUTIONARY ACHIEVEMENTS:")
@@ -0,0 +1,208 @@
+/**
+ * 🔍 Repository Search Index
+ * Trigram/prefix inverted index behind searchRepositories
+ */
+
+// Searchable fields in the order SearchIndex.documentText joins them
+const SEARCH_FIELDS = ['name', 'description', 'language', 'topics'];
+const SEARCH_FIELD_WEIGHTS = [3, 1, 2, 2];
+const SEARCH_NAME_PREFIX_BONUS = 3;
+const SEARCH_WORD_SEPARATOR = /[^a-z0-9\u0080-\u{10FFFF}]+/u;
+
+/**
+ * Inverted index over repository name, description, language and topics.
+ * Tokenisation must match search_index.py, which prebuilds the index for
+ * the data/repos.json snapshot.
+ */
+class SearchIndex {
+    constructor() {
+        this.trigrams = new Map(); // term -> Set of document ids
+        this.prefixes = new Map();
+        this.documents = []; // document id -> { key, text, fields }, null once removed
+        this.freeIds = []; // ids of removed documents, reused by addDocument
+        this.idsByKey = new Map(); // repository name -> document id
+        this.lastSearch = null; // { needle, ids } for search-as-you-type refinement
+    }
+
+    /**
+     * Adopt an index compiled by search_index.py for `repos` (snapshot order)
+     */
+    static fromJSON(data, repos) {
+        const index = new SearchIndex();
+        repos.forEach(repo => index.addDocument(repo, false));
+        const decode = (terms, target) => {
+            for (const [term, gaps] of Object.entries(terms)) {
+                const postings = new Set();
+                let id = 0;
+                for (const gap of gaps) {
+                    id += gap;
+                    postings.add(id);
+                }
+                target.set(term, postings);
+            }
+        };
+        decode(data.trigrams, index.trigrams);
+        decode(data.prefixes, index.prefixes);
+        return index;
+    }
+
+    static documentText(repo) {
+        return [
+            repo.name || '',
+            repo.description || '',
+            repo.language || '',
+            (repo.topics || []).join(' ')
+        ].join('\n').toLowerCase();
+    }
+
+    static terms(text) {
+        const trigrams = new Set();
+        const prefixes = new Set();
+        for (const word of text.split(SEARCH_WORD_SEPARATOR)) {
+            const chars = Array.from(word);
+            for (let length = 1; length <= Math.min(chars.length, 2); length++) {
+                prefixes.add(chars.slice(0, length).join(''));
+            }
+            for (let start = 0; start + 3 <= chars.length; start++) {
+                trigrams.add(chars[start] + chars[start + 1] + chars[start + 2]);
+            }
+        }
+        return { trigrams, prefixes };
+    }
+
+    addDocument(repo, indexTerms = true) {
+        const id = this.freeIds.length ? this.freeIds.pop() : this.documents.length;
+        const text = SearchIndex.documentText(repo);
+        this.documents[id] = { key: repo.name, text, fields: text.split('\n') };
+        this.idsByKey.set(repo.name, id);
+        this.lastSearch = null;
+        if (!indexTerms) return;
+
+        const { trigrams, prefixes } = SearchIndex.terms(text);
+        const post = (map, term) => {
+            if (!map.has(term)) map.set(term, new Set());
+            map.get(term).add(id);
+        };
+        trigrams.forEach(term => post(this.trigrams, term));
+        prefixes.forEach(term => post(this.prefixes, term));
+    }
+
+    removeDocument(key) {
+        const id = this.idsByKey.get(key);
+        if (id === undefined) return;
+        const { trigrams, prefixes } = SearchIndex.terms(this.documents[id].text);
+        const unpost = (map, term) => {
+            const postings = map.get(term);
+            if (!postings) return;
+            postings.delete(id);
+            if (postings.size === 0) map.delete(term);
+        };
+        trigrams.forEach(term => unpost(this.trigrams, term));
+        prefixes.forEach(term => unpost(this.prefixes, term));
+        this.documents[id] = null;
+        this.freeIds.push(id);
+        this.idsByKey.delete(key);
+        this.lastSearch = null;
+    }
+
+    /**
+     * Bring the index in line with `repos`, re-indexing only repositories
+     * that were added, removed or whose searchable text changed
+     */
+    sync(repos) {
+        const keys = new Set();
+        let changed = 0;
+        repos.forEach(repo => {
+            keys.add(repo.name);
+            const id = this.idsByKey.get(repo.name);
+            if (id !== undefined && this.documents[id].text === SearchIndex.documentText(repo)) return;
+            this.removeDocument(repo.name);
+            this.addDocument(repo);
+            changed++;
+        });
+        for (const key of Array.from(this.idsByKey.keys())) {
+            if (!keys.has(key)) {
+                this.removeDocument(key);
+                changed++;
+            }
+        }
+        return changed;
+    }
+
+    /**
+     * Candidate documents: every query word must occur inside some
+     * document word (trigrams), or start one when shorter than 3 characters
+     */
+    candidates(needle) {
+        // Typing extends the previous query, so its matches bound the new ones
+        if (this.lastSearch && Array.from(this.lastSearch.needle).length >= 3 &&
+            needle.includes(this.lastSearch.needle)) {
+            return this.lastSearch.ids;
+        }
+
+        const postingLists = [];
+        for (const word of needle.split(SEARCH_WORD_SEPARATOR)) {
+            const chars = Array.from(word);
+            if (chars.length === 0) continue;
+            if (chars.length < 3) {
+                postingLists.push(this.prefixes.get(word) || new Set());
+                continue;
+            }
+            for (let start = 0; start + 3 <= chars.length; start++) {
+                postingLists.push(this.trigrams.get(chars[start] + chars[start + 1] + chars[start + 2]) || new Set());
+            }
+        }
+        if (postingLists.length === 0) {
+            return this.documents.map((document, id) => id).filter(id => this.documents[id]);
+        }
+
+        postingLists.sort((a, b) => a.size - b.size);
+        const ids = [];
+        for (const id of postingLists[0]) {
+            let inAll = true;
+            for (let i = 1; i < postingLists.length && inAll; i++) {
+                inAll = postingLists[i].has(id);
+            }
+            if (inAll) ids.push(id);
+        }
+        return ids;
+    }
+
+    /**
+     * Ranked search: returns repository names, best match first
+     */
+    search(query) {
+        const needle = query.trim().toLowerCase();
+        if (!needle) return [];
+
+        // One- and two-character words use prefix semantics ("ai" finds "ai-tools", not "brain")
+        const shortQuery = Array.from(needle).length < 3 && needle.split(SEARCH_WORD_SEPARATOR).some(Boolean);
+        const matches = (field) => shortQuery
+            ? field.split(SEARCH_WORD_SEPARATOR).some(word => word.startsWith(needle))
+            : field.includes(needle);
+
+        // Verify candidates (trigrams can match out of order) and score by field
+        const ids = [];
+        const scores = [];
+        for (const id of this.candidates(needle)) {
+            const fields = this.documents[id].fields;
+            let score = 0;
+            for (let field = 0; field < SEARCH_FIELDS.length; field++) {
+                if (matches(fields[field])) score += SEARCH_FIELD_WEIGHTS[field];
+            }
+            if (score === 0) continue;
+            if (fields[0].startsWith(needle)) score += SEARCH_NAME_PREFIX_BONUS;
+            ids.push(id);
+            scores[id] = score;
+        }
+        this.lastSearch = { needle, ids };
+
+        return ids
+            .slice()
+            .sort((a, b) => scores[b] - scores[a] || a - b)
+            .map(id => this.documents[id].key);
+    }
+}
+
+// Export the search index
+window.SearchIndex = SearchIndex;
@@ -0,0 +1,101 @@
+"""Inverted search index for the Ultimate Hyperfocus Constellation.
+
+Builds the trigram/prefix index that ``SearchIndex`` (``search-index.js``)
+answers ``searchRepositories`` queries from. Every word of a repository's
+name, description, language and topics contributes its trigrams, plus its
+one- and two-character prefixes for short queries. Posting lists are sorted
+repository indexes (snapshot order), gap-encoded to keep the file small.
+
+``repo_snapshot.py`` writes the index next to ``data/repos.json``; the
+engine adopts it as-is for the snapshot and updates it incrementally when
+live data arrives. The tokenisation rules here and in ``search-index.js``
+must stay identical.
+"""
+
+import json
+import re
+from typing import List, Dict, Any, Iterable, Set, Tuple
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+INDEX_VERSION = 1
+INDEXED_FIELDS = ("name", "description", "language", "topics")
+TRIGRAM_LENGTH = 3
+MAX_PREFIX_LENGTH = TRIGRAM_LENGTH - 1
+# Lowercase ASCII letters and digits form words, as does anything non-ASCII
+_WORD_SEPARATOR = re.compile("[^a-z0-9\u0080-\U0010ffff]+")
+
+
+def document_text(repo: Dict[str, Any]) -> str:
+    """Lowercased searchable text of a repository, one field per line."""
+    fields = []
+    for field in INDEXED_FIELDS:
+        value = repo.get(field) or ""
+        fields.append(" ".join(value) if isinstance(value, list) else str(value))
+    return "\n".join(fields).lower()
+
+
+def words(text: str) -> List[str]:
+    """Split lowercased text into indexable words."""
+    return [word for word in _WORD_SEPARATOR.split(text) if word]
+
+
+def document_terms(text: str) -> Tuple[Set[str], Set[str]]:
+    """Return the ``(trigrams, prefixes)`` a document is indexed under."""
+    trigrams, prefixes = set(), set()
+    for word in words(text):
+        for length in range(1, min(len(word), MAX_PREFIX_LENGTH) + 1):
+            prefixes.add(word[:length])
+        for start in range(len(word) - TRIGRAM_LENGTH + 1):
+            trigrams.add(word[start:start + TRIGRAM_LENGTH])
+    return trigrams, prefixes
+
+
+def _gap_encode(postings: Iterable[int]) -> List[int]:
+    """Turn sorted document ids into first value + successive differences."""
+    encoded, previous = [], 0
+    for document in postings:
+        encoded.append(document - previous)
+        previous = document
+    return encoded
+
+
+def build_index(repositories: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[int]]]:
+    """Index the repositories by trigram and short prefix.
+
+    Args:
+        repositories: Snapshot entries, in snapshot order.
+
+    Returns:
+        ``trigrams`` and ``prefixes`` maps from term to gap-encoded
+        posting list, both with sorted keys.
+    """
+    trigram_postings: Dict[str, List[int]] = {}
+    prefix_postings: Dict[str, List[int]] = {}
+    for document, repo in enumerate(repositories):
+        trigrams, prefixes = document_terms(document_text(repo))
+        for term in trigrams:
+            trigram_postings.setdefault(term, []).append(document)
+        for term in prefixes:
+            prefix_postings.setdefault(term, []).append(document)
+    return {
+        "trigrams": {term: _gap_encode(trigram_postings[term]) for term in sorted(trigram_postings)},
+        "prefixes": {term: _gap_encode(prefix_postings[term]) for term in sorted(prefix_postings)},
+    }
+
+
+def render_index(repositories: List[Dict[str, Any]], names_hash: int) -> bytes:
+    """Serialise the index with the header the engine validates.
+
+    Args:
+        repositories: Snapshot entries, in snapshot order.
+        names_hash: ``repo_snapshot.names_hash`` of the snapshot names.
+    """
+    index = {
+        "version": INDEX_VERSION,
+        "count": len(repositories),
+        "namesHash": names_hash,
+        **build_index(repositories),
+    }
+    return (json.dumps(index, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
@@ -0,0 +1,235 @@
+"""Production stripping of development-only JavaScript.
+
+Removes ``console.log``/``console.warn`` calls and blocks fenced with
+``// @debug-start`` ... ``// @debug-end`` from the emitted JS, while keeping
+``console.error``. Stripping never changes the number of lines in a file -
+removed code is replaced with blank lines or ``void 0`` - so the bundle's
+line-level source map into the ``script*.py`` templates stays valid.
+
+The scanner understands strings, template literals, comments and regex
+literals, so calls mentioned inside them are left alone.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+STRIPPED_METHODS = ("log", "warn")
+DEBUG_START_MARKER = "@debug-start"
+DEBUG_END_MARKER = "@debug-end"
+
+_CALL_PATTERN = re.compile(r"console\s*\.\s*(%s)\s*\(" % "|".join(STRIPPED_METHODS))
+# A "/" after one of these characters starts a regex literal, not a division
+_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+_STATEMENT_BOUNDARIES = set(";{}")
+
+
+def _skip_string(source: str, index: int) -> int:
+    """Return the index just past the quoted string starting at ``index``."""
+    quote = source[index]
+    index += 1
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == quote or char == "\n":
+            return index + 1
+        index += 1
+    return index
+
+
+def _skip_template(source: str, index: int) -> int:
+    """Return the index just past the template literal starting at ``index``."""
+    index += 1
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "`":
+            return index + 1
+        if source.startswith("${", index):
+            index = _skip_code_until(source, index + 2, "}") + 1
+            continue
+        index += 1
+    return index
+
+
+def _skip_regex(source: str, index: int) -> int:
+    """Return the index just past the regex literal starting at ``index``."""
+    index += 1
+    in_class = False
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "\n":
+            return index
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            index += 1
+            while index < len(source) and (source[index].isalnum() or source[index] == "_"):
+                index += 1
+            return index
+        index += 1
+    return index
+
+
+def _skip_literal(source: str, index: int, previous: str) -> Optional[int]:
+    """Skip a string, template, comment or regex literal starting at ``index``.
+
+    Args:
+        source: The JavaScript source.
+        index: Position to inspect.
+        previous: The last significant (non-space) code character before it.
+
+    Returns:
+        The index just past the literal, or None if ``index`` starts code.
+    """
+    char = source[index]
+    if char in "'\"":
+        return _skip_string(source, index)
+    if char == "`":
+        return _skip_template(source, index)
+    if source.startswith("//", index):
+        end = source.find("\n", index)
+        return len(source) if end == -1 else end
+    if source.startswith("/*", index):
+        end = source.find("*/", index + 2)
+        return len(source) if end == -1 else end + 2
+    if char == "/" and (not previous or previous in _REGEX_PRECEDERS):
+        return _skip_regex(source, index)
+    return None
+
+
+def _last_significant(source: str, start: int, end: int, previous: str) -> str:
+    """Return the significant character after skipping ``source[start:end]``.
+
+    Comments are transparent; any other literal ends with its own closing
+    character (a quote, backtick or regex flag).
+    """
+    if source.startswith(("//", "/*"), start):
+        return previous
+    return source[end - 1]
+
+
+def _skip_code_until(source: str, index: int, closer: str) -> int:
+    """Return the index of the ``closer`` that balances the current nesting."""
+    openers = {")": "(", "}": "{", "]": "["}
+    depth = 0
+    previous = ""
+    while index < len(source):
+        skipped = _skip_literal(source, index, previous)
+        if skipped is not None:
+            previous = _last_significant(source, index, skipped, previous)
+            index = skipped
+            continue
+        char = source[index]
+        if char == openers[closer]:
+            depth += 1
+        elif char == closer:
+            if depth == 0:
+                return index
+            depth -= 1
+        if not char.isspace():
+            previous = char
+        index += 1
+    return index
+
+
+def _find_calls(source: str) -> List[Tuple[int, int, str]]:
+    """Locate stripped console calls outside of literals.
+
+    Returns:
+        ``(start, end, previous)`` triples where ``end`` is just past the
+        closing parenthesis and ``previous`` is the last significant code
+        character before the call.
+    """
+    calls = []
+    index = 0
+    previous = ""
+    while index < len(source):
+        skipped = _skip_literal(source, index, previous)
+        if skipped is not None:
+            previous = _last_significant(source, index, skipped, previous)
+            index = skipped
+            continue
+        match = _CALL_PATTERN.match(source, index)
+        at_word_start = index == 0 or not (source[index - 1].isalnum() or source[index - 1] in "_$.")
+        if match and at_word_start:
+            end = _skip_code_until(source, match.end(), ")") + 1
+            calls.append((index, end, previous))
+            index = end
+            previous = ")"
+            continue
+        if not source[index].isspace():
+            previous = source[index]
+        index += 1
+    return calls
+
+
+def strip_console_calls(source: str) -> str:
+    """Remove ``console.log``/``console.warn`` calls, preserving line count.
+
+    A call that forms a whole statement on its own lines is blanked out
+    (keeping its newlines). Anywhere else - arrow function bodies,
+    ``if (x) console.log(...)`` and the like - the call is replaced with
+    ``void 0`` so the surrounding code keeps the same meaning.
+    """
+    pieces = []
+    cursor = 0
+    for start, end, previous in _find_calls(source):
+        line_start = source.rfind("\n", 0, start) + 1
+        statement_end = end
+        while statement_end < len(source) and source[statement_end] in " \t":
+            statement_end += 1
+        if statement_end < len(source) and source[statement_end] == ";":
+            statement_end += 1
+        line_end = source.find("\n", statement_end)
+        line_end = len(source) if line_end == -1 else line_end
+
+        own_line = (not source[line_start:start].strip()
+                    and not source[statement_end:line_end].strip())
+        if own_line and (not previous or previous in _STATEMENT_BOUNDARIES):
+            pieces.append(source[cursor:line_start])
+            pieces.append("\n" * source.count("\n", line_start, line_end))
+            cursor = line_end
+        else:
+            pieces.append(source[cursor:start])
+            pieces.append("void 0" + "\n" * source.count("\n", start, end))
+            cursor = end
+    pieces.append(source[cursor:])
+    return "".join(pieces)
+
+
+def strip_debug_blocks(source: str) -> str:
+    """Blank out every line between debug markers (inclusive).
+
+    Raises:
+        ValueError: If a ``@debug-start`` marker is never closed.
+    """
+    lines = source.split("\n")
+    inside = False
+    for number, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("//") and DEBUG_START_MARKER in stripped:
+            inside = True
+        if inside:
+            lines[number] = ""
+        if stripped.startswith("//") and DEBUG_END_MARKER in stripped:
+            inside = False
+    if inside:
+        raise ValueError(f"Unterminated {DEBUG_START_MARKER} block")
+    return "\n".join(lines)
+
+
+def strip_debug(source: str) -> str:
+    """Apply all production stripping to a JavaScript source."""
+    return strip_console_calls(strip_debug_blocks(source))
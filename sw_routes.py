@@ -0,0 +1,173 @@
+"""Service worker routing table for the Ultimate Hyperfocus Constellation.
+
+Each request the service worker intercepts is matched by hostname, then by
+path prefix, then by file extension. Prefixes form a trie over path
+segments, so the most specific prefix wins. Every route names one of the
+caching strategies implemented in ``sw.js``, plus the cache, entry limit
+and ages it uses. Each cache has a byte and entry budget, which the worker
+enforces least-recently-used first.
+
+``script_4.py`` embeds the compiled table (see ``render_routes``), so the
+routes below are the single place request handling is configured.
+"""
+
+import json
+import posixpath
+from typing import List, Dict, Any, Optional, Tuple
+
+from asset_hashing import BASE_PATH
+
+__version__ = '1.0.0'
+
+# --- Constants ---
+STRATEGIES = ("cache-first", "network-first", "stale-while-revalidate", "network-only", "app-shell")
+ROUTES_PLACEHOLDER = "__SW_ROUTES__"
+MINUTE = 60 * 1000
+DAY = 24 * 60 * MINUTE
+MB = 1024 * 1024
+GITHUB_API_HOST = "api.github.com"
+APP_ASSET_EXTENSIONS = (".js", ".css", ".json", ".bin", ".map", ".ico", ".png", ".svg",
+                        ".webp", ".webmanifest", ".woff2", ".txt", ".xml")
+
+# Budgets per logical cache (sw.js maps the names to its versioned cache
+# constants). Every write evicts the least recently used entries beyond
+# them; precached files are never evicted.
+CACHE_BUDGETS = {
+    "static": {"max_bytes": 30 * MB, "max_entries": 300},
+    "dynamic": {"max_bytes": 10 * MB, "max_entries": 200},
+    "github-api": {"max_bytes": 15 * MB, "max_entries": 1500},
+}
+
+# Route options:
+#   host          hostname to match; None means the service worker's own origin
+#   prefix        path prefix, matched on whole segments
+#   extensions    extensions of the last path segment to match ("" for none);
+#                 None matches any
+#   strategy      one of STRATEGIES
+#   cache         one of CACHE_BUDGETS (not used by network-only)
+#   max_entries   entries kept in the cache for this route (None: unlimited)
+#   max_age       ms a cached response is served without revalidation by
+#                 cache-first and stale-while-revalidate (None: forever;
+#                 hashed release files never expire)
+#   hard_max_age  ms after which a cached response is never served, even
+#                 offline (None: no limit)
+#   notify        message type posted to clients when a revalidation caches
+#                 a different body
+#   offline       "json" for a JSON 503 when nothing can be served, else a
+#                 plain-text 404
+ROUTES = (
+    {"name": "github-rate-limit", "host": GITHUB_API_HOST, "prefix": "/rate_limit",
+     "strategy": "network-only"},
+    {"name": "github-users", "host": GITHUB_API_HOST, "prefix": "/users/",
+     "strategy": "stale-while-revalidate", "cache": "github-api", "max_entries": 200,
+     "max_age": 5 * MINUTE, "hard_max_age": 7 * DAY, "notify": "GITHUB_API_UPDATED",
+     "offline": "json"},
+    {"name": "github-repos", "host": GITHUB_API_HOST, "prefix": "/repos/",
+     "strategy": "stale-while-revalidate", "cache": "github-api", "max_entries": 1000,
+     "max_age": 10 * MINUTE, "hard_max_age": 7 * DAY, "notify": "GITHUB_API_UPDATED",
+     "offline": "json"},
+    {"name": "github-api", "host": GITHUB_API_HOST, "prefix": "/",
+     "strategy": "network-first", "cache": "github-api", "max_entries": 100,
+     "hard_max_age": DAY, "offline": "json"},
+    {"name": "cdn", "host": "cdnjs.cloudflare.com", "prefix": "/",
+     "strategy": "stale-while-revalidate", "cache": "static", "max_entries": 20,
+     "max_age": DAY},
+    {"name": "icons", "prefix": BASE_PATH + "icons/",
+     "strategy": "stale-while-revalidate", "cache": "static", "max_age": DAY},
+    {"name": "screenshots", "prefix": BASE_PATH + "screenshots/",
+     "strategy": "stale-while-revalidate", "cache": "static", "max_age": DAY},
+    {"name": "app-assets", "prefix": BASE_PATH, "extensions": APP_ASSET_EXTENSIONS,
+     "strategy": "stale-while-revalidate", "cache": "static", "max_age": 0},
+    {"name": "app-shell", "prefix": BASE_PATH, "extensions": ("", ".html"),
+     "strategy": "app-shell", "cache": "static"},
+)
+# Anything no route matches
+DEFAULT_ROUTE = {"name": "default", "strategy": "network-first", "cache": "dynamic",
+                 "max_entries": 100, "hard_max_age": 7 * DAY}
+
+
+def path_segments(path: str) -> List[str]:
+    """Split a URL path into its non-empty segments."""
+    return [segment for segment in path.split("/") if segment]
+
+
+def compile_route(route: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one route and convert it to the shape ``sw.js`` reads.
+
+    Raises:
+        ValueError: If the strategy or cache is unknown, or a caching
+            strategy has no cache.
+    """
+    if route["strategy"] not in STRATEGIES:
+        raise ValueError(f"Route {route['name']}: unknown strategy {route['strategy']!r}")
+    cache = route.get("cache")
+    if route["strategy"] != "network-only" and cache not in CACHE_BUDGETS:
+        raise ValueError(f"Route {route['name']}: unknown cache {cache!r}")
+    return {
+        "name": route["name"],
+        "strategy": route["strategy"],
+        "cache": cache,
+        "maxEntries": route.get("max_entries"),
+        "maxAge": route.get("max_age"),
+        "hardMaxAge": route.get("hard_max_age"),
+        "notify": route.get("notify"),
+        "offline": route.get("offline", "text"),
+    }
+
+
+def compile_routes(routes: Tuple[Dict[str, Any], ...] = ROUTES,
+                   default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Compile the routes into the lookup table ``sw.js`` matches against.
+
+    Returns:
+        ``routes`` (compiled routes, by index), ``default`` (the index of
+        the fallback route), ``caches`` (logical cache name -> ``maxBytes``
+        and ``maxEntries``) and ``hosts``: hostname ("" for the service
+        worker's own origin) -> trie root. A trie node is ``{"c": {segment:
+        node}, "r": [[route index, extensions or null], ...]}``; ``r`` is
+        in config order, so the first route listed wins on the same node.
+
+    Raises:
+        ValueError: For an invalid route (see ``compile_route``).
+    """
+    default = DEFAULT_ROUTE if default is None else default
+    compiled = [compile_route(route) for route in routes] + [compile_route(default)]
+    hosts: Dict[str, Dict[str, Any]] = {}
+    for index, route in enumerate(routes):
+        node = hosts.setdefault(route.get("host") or "", {"c": {}, "r": []})
+        for segment in path_segments(route["prefix"]):
+            node = node["c"].setdefault(segment, {"c": {}, "r": []})
+        extensions = route.get("extensions")
+        node["r"].append([index, sorted(extensions) if extensions is not None else None])
+    budgets = {name: {"maxBytes": budget["max_bytes"], "maxEntries": budget["max_entries"]}
+               for name, budget in CACHE_BUDGETS.items()}
+    return {"routes": compiled, "default": len(compiled) - 1, "caches": budgets, "hosts": hosts}
+
+
+def match_route(table: Dict[str, Any], host: str, path: str) -> Dict[str, Any]:
+    """Reference implementation of the ``sw.js`` lookup, for checking routes.
+
+    Walks the trie as deep as the path goes, then takes the deepest node
+    with a route whose extensions accept the last path segment.
+    """
+    nodes = []
+    node = table["hosts"].get(host)
+    segments = path_segments(path)
+    if node is not None:
+        nodes.append(node)
+        for segment in segments:
+            node = node["c"].get(segment)
+            if node is None:
+                break
+            nodes.append(node)
+    extension = posixpath.splitext(segments[-1])[1].lower() if segments else ""
+    for node in reversed(nodes):
+        for index, extensions in node["r"]:
+            if extensions is None or extension in extensions:
+                return table["routes"][index]
+    return table["routes"][table["default"]]
+
+
+def render_routes() -> str:
+    """Serialise the compiled table as a single-line JS object literal."""
+    return json.dumps(compile_routes(), separators=(",", ":"), sort_keys=True)
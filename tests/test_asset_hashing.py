@@ -0,0 +1,163 @@
+"""Tests for content-hashed release names in asset_hashing.py."""
+
+import hashlib
+
+import pytest
+
+import asset_hashing
+from asset_hashing import BASE_PATH
+
+
+def test_content_hash():
+    data = b"console.log('hi');\n"
+    assert asset_hashing.content_hash(data) == hashlib.sha256(data).hexdigest()[:asset_hashing.HASH_LENGTH]
+
+
+@pytest.mark.parametrize("name, hashable", [
+    ("app.js", True), ("css/styles.css", True), ("sw.js", False), ("index.html", False),
+    ("manifest.json", False), ("data/repos.json", False), ("dir/sw.js", False),
+])
+def test_is_hashable(name, hashable):
+    assert asset_hashing.is_hashable(name) is hashable
+
+
+def test_hashed_name_keeps_directory_and_extension():
+    data = b"body {}"
+    digest = asset_hashing.content_hash(data)
+    assert asset_hashing.hashed_name("css/styles.css", data) == f"css/styles.{digest}.css"
+    assert asset_hashing.hashed_name("a.b.js", data) == f"a.b.{digest}.js"
+
+
+def test_rewrite_html_references():
+    html = ('<link rel="stylesheet" href="styles.css">\n'
+            "<script src='js/app.js?v=2'></script>\n"
+            '<script src="https://cdn.example/app.js"></script>\n'
+            '<script src="//cdn.example/styles.css"></script>\n'
+            '<a href="app.js">not a script or link tag</a>\n')
+    mapping = {"styles.css": "styles.11111111.css", "app.js": "app.22222222.js"}
+    assert asset_hashing.rewrite_html_references(html, mapping) == (
+        '<link rel="stylesheet" href="styles.11111111.css">\n'
+        "<script src='js/app.22222222.js?v=2'></script>\n"
+        '<script src="https://cdn.example/app.js"></script>\n'
+        '<script src="//cdn.example/styles.css"></script>\n'
+        '<a href="app.js">not a script or link tag</a>\n'
+    )
+
+
+def test_precache_urls_replace_local_scripts_with_published_ones():
+    existing = [BASE_PATH, BASE_PATH + "index.html", BASE_PATH + "old.js", BASE_PATH + "styles.css",
+                "https://cdn.example/three.min.js", BASE_PATH + "manifest.json"]
+    mapping = {"styles.css": "styles.11111111.css", "app.js": "app.22222222.js"}
+    assert asset_hashing.precache_urls(existing, mapping) == [
+        BASE_PATH, BASE_PATH + "index.html", BASE_PATH + "manifest.json",
+        BASE_PATH + "app.22222222.js", BASE_PATH + "styles.11111111.css",
+        "https://cdn.example/three.min.js",
+    ]
+
+
+def test_plan_release():
+    assets = {
+        "index.html": b'<script src="app.js"></script><script src="module.js"></script>',
+        "app.js": b"app();",
+        "module.js": b"module();",
+        "data/repos.json": b"{}",
+    }
+    files, contents = asset_hashing.plan_release(assets)
+    app = asset_hashing.hashed_name("app.js", assets["app.js"])
+    module = asset_hashing.hashed_name("module.js", assets["module.js"])
+    assert files == {"index.html": "index.html", "app.js": app, "module.js": module,
+                     "data/repos.json": "data/repos.json"}
+    assert contents["index.html"] == f'<script src="{app}"></script><script src="{module}"></script>'.encode()
+    assert contents[app] == b"app();"
+    assert contents["data/repos.json"] == b"{}"
+
+
+def test_render_headers_marks_hashed_files_immutable():
+    headers = asset_hashing.render_headers({"app.js": "app.22222222.js", "index.html": "index.html"})
+    assert headers.decode("utf-8") == (
+        f"{BASE_PATH}app.22222222.js\n  Cache-Control: {asset_hashing.IMMUTABLE_CACHE_CONTROL}\n\n"
+        f"{BASE_PATH}index.html\n  Cache-Control: {asset_hashing.REVALIDATE_CACHE_CONTROL}\n"
+    )
+
+
+def test_precache_manifest_revisions():
+    urls = [BASE_PATH, BASE_PATH + "index.html", BASE_PATH + "app.22222222.js",
+            BASE_PATH + "icons/icon.png", "https://cdn.example/three.min.js"]
+    assert asset_hashing.precache_manifest(urls, {"index.html": "abcd1234"}) == [
+        (BASE_PATH, "abcd1234"),
+        (BASE_PATH + "index.html", "abcd1234"),
+        (BASE_PATH + "app.22222222.js", None),
+        (BASE_PATH + "icons/icon.png", None),
+        ("https://cdn.example/three.min.js", None),
+    ]
+
+
+SERVICE_WORKER = (
+    "const STATIC_CACHE = 'static-v1';\n"
+    "const PRECACHE_MANIFEST = [\n"
+    f"    {{ url: '{BASE_PATH}', revision: null }},\n"
+    f"    {{ url: '{BASE_PATH}old.js', revision: null }},\n"
+    "    { url: 'https://cdn.example/three.min.js', revision: null }\n"
+    "];\n"
+    "self.addEventListener('install', () => {});\n"
+)
+
+
+def test_rewrite_service_worker_regenerates_manifest():
+    rewritten = asset_hashing.rewrite_service_worker(
+        SERVICE_WORKER, {"app.js": "app.22222222.js"}, {"index.html": "abcd1234"})
+    assert (
+        "const PRECACHE_MANIFEST = [\n"
+        f"    {{ url: '{BASE_PATH}', revision: 'abcd1234' }},\n"
+        f"    {{ url: '{BASE_PATH}app.22222222.js', revision: null }},\n"
+        "    { url: 'https://cdn.example/three.min.js', revision: null }\n"
+        "];\n"
+    ) in rewritten
+    assert "old.js" not in rewritten
+    assert rewritten.endswith("self.addEventListener('install', () => {});\n")
+
+
+def _static_cache(source):
+    return asset_hashing._STATIC_CACHE_PATTERN.search(source).group(0)
+
+
+def test_static_cache_follows_manifest_content():
+    mapping = {"app.js": "app.22222222.js"}
+    first = asset_hashing.rewrite_service_worker(SERVICE_WORKER, mapping, {"index.html": "abcd1234"})
+    again = asset_hashing.rewrite_service_worker(SERVICE_WORKER, mapping, {"index.html": "abcd1234"})
+    changed_page = asset_hashing.rewrite_service_worker(SERVICE_WORKER, mapping, {"index.html": "ffff0000"})
+    changed_script = asset_hashing.rewrite_service_worker(SERVICE_WORKER, {"app.js": "app.33333333.js"},
+                                                          {"index.html": "abcd1234"})
+    assert _static_cache(first) != "const STATIC_CACHE = 'static-v1';"
+    assert _static_cache(first) == _static_cache(again)
+    assert _static_cache(changed_page) != _static_cache(first)
+    assert _static_cache(changed_script) != _static_cache(first)
+
+
+def test_rewrite_service_worker_without_manifest_is_unchanged():
+    source = "const STATIC_CACHE = 'static-v1';\n"
+    assert asset_hashing.rewrite_service_worker(source, {"app.js": "app.22222222.js"}) == source
+
+
+def test_plan_release_versions_precached_pages():
+    assets = {"index.html": b'<script src="app.js"></script>', "app.js": b"app();",
+              "sw.js": SERVICE_WORKER.encode("utf-8")}
+    files, contents = asset_hashing.plan_release(assets)
+    assert files["sw.js"] == "sw.js"
+    worker = contents["sw.js"].decode("utf-8")
+    index_revision = asset_hashing.content_hash(contents["index.html"])
+    assert f"{{ url: '{BASE_PATH}', revision: '{index_revision}' }}" in worker
+    assert f"{{ url: '{BASE_PATH}{files['app.js']}', revision: null }}" in worker
+
+
+def test_plan_release_keeps_names_chosen_ahead():
+    assets = {"bundle.js": b"//# sourceMappingURL=bundle.abcd1234.js.map\n", "bundle.js.map": b"{}",
+              "sw.js": SERVICE_WORKER.encode("utf-8")}
+    published = {"bundle.js": "bundle.abcd1234.js", "bundle.js.map": "bundle.abcd1234.js.map"}
+    files, contents = asset_hashing.plan_release(assets, not_precached=("bundle.js.map",),
+                                                 published=published)
+    assert files["bundle.js"] == "bundle.abcd1234.js"
+    assert contents["bundle.abcd1234.js.map"] == b"{}"
+    worker = contents["sw.js"].decode("utf-8")
+    assert "bundle.abcd1234.js'" in worker
+    assert ".map" not in worker
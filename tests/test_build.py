@@ -0,0 +1,105 @@
+"""Tests for generator discovery, fingerprinting and publishing in build.py."""
+
+import textwrap
+
+import pytest
+
+import build
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A generator that imports ``routes``, which imports ``paths``."""
+    files = {
+        "script_demo.py": """
+            from routes import ROUTES
+
+            TEMPLATE = "const ROUTES = __ROUTES__;"
+            with open('demo.js', 'w') as output:
+                output.write(TEMPLATE.replace('__ROUTES__', repr(ROUTES)))
+        """,
+        "routes.py": """
+            from paths import BASE_PATH
+
+            ROUTES = [BASE_PATH + "api/"]
+        """,
+        "paths.py": """
+            BASE_PATH = "/app/"
+        """,
+        "unrelated.py": """
+            VALUE = 1
+        """,
+    }
+    for name, source in files.items():
+        (tmp_path / name).write_text(textwrap.dedent(source), encoding="utf-8")
+    return tmp_path
+
+
+def fingerprint(root):
+    generators = build.discover_generators(root)
+    assert [generator["name"] for generator in generators] == ["script_demo.py"]
+    return generators[0]["fingerprint"]
+
+
+def edit(path, old, new):
+    path.write_text(path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+
+
+def test_discovers_outputs(project):
+    assert build.discover_generators(project)[0]["outputs"] == ["demo.js"]
+
+
+def test_local_imports_are_followed_transitively(project):
+    tree = build.ast.parse((project / "script_demo.py").read_text(encoding="utf-8"))
+    assert build._local_imports(tree, project) == [project / "paths.py", project / "routes.py"]
+
+
+def test_template_change_invalidates(project):
+    before = fingerprint(project)
+    edit(project / "script_demo.py", "const ROUTES", "var ROUTES")
+    assert fingerprint(project) != before
+
+
+def test_generator_code_change_invalidates(project):
+    before = fingerprint(project)
+    edit(project / "script_demo.py", "repr(ROUTES)", "str(ROUTES)")
+    assert fingerprint(project) != before
+
+
+def test_transitive_import_change_invalidates(project):
+    before = fingerprint(project)
+    edit(project / "paths.py", '"/app/"', '"/other/"')
+    assert fingerprint(project) != before
+
+
+def test_comments_and_unrelated_modules_do_not_invalidate(project):
+    before = fingerprint(project)
+    edit(project / "paths.py", "BASE_PATH =", "# The deployed prefix\nBASE_PATH =")
+    edit(project / "unrelated.py", "1", "2")
+    assert fingerprint(project) == before
+
+
+def test_plan_build_selects_stale_generators(project, tmp_path_factory):
+    out_dir = tmp_path_factory.mktemp("out")
+    generators = build.discover_generators(project)
+    state = {"script_demo.py": generators[0]["fingerprint"]}
+
+    assert build.plan_build(generators, state, out_dir) == generators  # output missing
+    (out_dir / "demo.js").write_text("", encoding="utf-8")
+    assert build.plan_build(generators, state, out_dir) == []
+    assert build.plan_build(generators, state, out_dir, force=True) == generators
+    assert build.plan_build(generators, {"script_demo.py": "old"}, out_dir) == generators
+
+
+def test_published_page_links_the_hashed_stylesheet(tmp_path):
+    out_dir, dist_dir = tmp_path / "out", tmp_path / "dist"
+    out_dir.mkdir()
+    (out_dir / "index.html").write_text(
+        '<html><head><link rel="stylesheet" href="https://s3.example/dump/styles.css"></head>'
+        "<body></body></html>", encoding="utf-8")
+    (out_dir / "styles.css").write_text("body { margin: 0; }", encoding="utf-8")
+    files = build.publish_release(out_dir, dist_dir, ["index.html", "styles.css"])
+    assert files["styles.css"].startswith("styles.") and files["styles.css"] != "styles.css"
+    page = (dist_dir / "index.html").read_text(encoding="utf-8")
+    assert f'<link rel="stylesheet" href="{files["styles.css"]}">' in page
+    assert "s3.example" not in page
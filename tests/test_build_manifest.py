@@ -0,0 +1,71 @@
+"""Tests for the measured build manifest in build_manifest.py."""
+
+import gzip
+import hashlib
+import json
+import zlib
+
+import build
+from build_manifest import MANIFEST_NAME, build_manifest, load_manifest, total_sizes
+
+ASSETS = {
+    "index.html": b"<html><body>constellation</body></html>\n" * 40,
+    "app.js": b"const star = 1;\n" * 200,
+    "styles.css": b"body { margin: 0 }",
+}
+PUBLISHED = {"index.html": "index.html", "app.js": "app.1a2b3c4d.js", "styles.css": "styles.5e6f7a8b.css"}
+
+
+def release(tmp_path):
+    out_dir, dist_dir = tmp_path / "out", tmp_path / "dist"
+    out_dir.mkdir()
+    dist_dir.mkdir()
+    for name, data in ASSETS.items():
+        (dist_dir / PUBLISHED[name]).write_bytes(data)
+    build.emit_precompressed(dist_dir, list(PUBLISHED.values()))
+    return out_dir, dist_dir
+
+
+def test_manifest_measures_published_assets(tmp_path):
+    out_dir, dist_dir = release(tmp_path)
+    manifest = build.write_build_manifest(out_dir, PUBLISHED, dist_dir)
+    assert load_manifest(out_dir / MANIFEST_NAME) == json.loads(json.dumps(manifest))
+    assert manifest["missing"] == []
+
+    for name, data in ASSETS.items():
+        entry = manifest["artifacts"][name]
+        assert entry["bytes"] == len(data)
+        assert entry["gzip_bytes"] == len(gzip.compress(data, compresslevel=9, mtime=0))
+        assert entry["deflate_bytes"] == len(zlib.compress(data, 9))
+        assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+        assert entry["lines"] == data.count(b"\n") + (0 if data.endswith(b"\n") else 1)
+        assert entry.get("file", name) == PUBLISHED[name]
+    assert manifest["artifacts"]["app.js"]["precompressed"] == [".gz", ".zz"]
+    # too small to pay off
+    assert manifest["artifacts"]["styles.css"]["precompressed"] == []
+
+
+def test_totals_and_critical_path(tmp_path):
+    out_dir, dist_dir = release(tmp_path)
+    artifacts = build.write_build_manifest(out_dir, PUBLISHED, dist_dir)["artifacts"]
+    totals = build_manifest(dist_dir, PUBLISHED)["totals"]
+    assert totals["files"] == 3
+    assert totals["bytes"] == sum(len(data) for data in ASSETS.values())
+    assert totals["gzip_bytes"] == sum(entry["gzip_bytes"] for entry in artifacts.values())
+
+    critical = total_sizes(artifacts[name] for name in ("app.js", "styles.css"))
+    assert critical["files"] == 2
+    assert critical["bytes"] == len(ASSETS["app.js"]) + len(ASSETS["styles.css"])
+    assert critical["gzip_bytes"] == artifacts["app.js"]["gzip_bytes"] + artifacts["styles.css"]["gzip_bytes"]
+
+
+def test_missing_files_are_listed_and_rebuilds_are_byte_identical(tmp_path):
+    out_dir, dist_dir = release(tmp_path)
+    files = {**PUBLISHED, "gone.js": "gone.00000000.js"}
+    manifest = build.write_build_manifest(out_dir, files, dist_dir)
+    assert manifest["missing"] == ["gone.js"]
+    assert "gone.js" not in manifest["artifacts"]
+
+    first = (out_dir / MANIFEST_NAME).read_bytes()
+    build.write_build_manifest(out_dir, files, dist_dir)
+    assert (out_dir / MANIFEST_NAME).read_bytes() == first
@@ -0,0 +1,174 @@
+"""Tests for the bundle, its source map and the page rewrites in bundler.py."""
+
+import json
+import textwrap
+
+import pytest
+
+import bundler
+
+_BASE64 = {digit: value for value, digit in enumerate(bundler._BASE64_DIGITS)}
+
+
+def decode_vlqs(segment):
+    """Decode a source map segment into its integers."""
+    values, value, shift = [], 0, 0
+    for character in segment:
+        digit = _BASE64[character]
+        value |= (digit & 0b11111) << shift
+        shift += 5
+        if not digit & 0b100000:
+            values.append(-(value >> 1) if value & 1 else value >> 1)
+            value, shift = 0, 0
+    return values
+
+
+def resolve_mappings(mappings):
+    """Turn ``mappings`` into one absolute (source, line, column) per bundle line."""
+    resolved, state = [], [0, 0, 0]
+    for segment in mappings.split(";"):
+        if not segment:
+            resolved.append(None)
+            continue
+        _, *deltas = decode_vlqs(segment)
+        state = [before + delta for before, delta in zip(state, deltas)]
+        resolved.append(tuple(state))
+    return resolved
+
+
+@pytest.mark.parametrize("value, encoded", [
+    (0, "A"), (1, "C"), (-1, "D"), (15, "e"), (16, "gB"), (-16, "hB"), (123, "2H"),
+])
+def test_encode_vlq(value, encoded):
+    assert bundler.encode_vlq(value) == encoded
+
+
+@pytest.mark.parametrize("value", [0, 5, -5, 31, 32, -1000, 123456])
+def test_encode_vlq_round_trips(value):
+    assert decode_vlqs(bundler.encode_vlq(value)) == [value]
+
+
+@pytest.fixture
+def modules(tmp_path):
+    """One hand-written module and one written by a generator template."""
+    (tmp_path / "plain.js").write_text("const a = 1;\nconst b = 2;\n", encoding="utf-8")
+    (tmp_path / "script_gen.py").write_text(textwrap.dedent("""\
+        # Generator
+        GENERATED = '''function one() {}
+        function two() {}
+        '''
+        with open('generated.js', 'w') as f:
+            f.write(GENERATED)
+    """), encoding="utf-8")
+    (tmp_path / "generated.js").write_text("function one() {}\nfunction two() {}\n", encoding="utf-8")
+    generators = [{"name": "script_gen.py", "path": str(tmp_path / "script_gen.py"),
+                   "outputs": ["generated.js"]}]
+    return tmp_path, generators
+
+
+def test_template_origin(modules):
+    root, _ = modules
+    # Line 2 (zero-based 1), just after the opening quotes
+    assert bundler.template_origin(root / "script_gen.py", "generated.js") == (1, 15)
+    assert bundler.template_origin(root / "script_gen.py", "other.js") is None
+
+
+def test_bundle_lines_map_back_to_their_sources(modules):
+    root, generators = modules
+    bundle, source_map = bundler.build_bundle(root, generators, ("plain.js", "missing.js", "generated.js"))
+    lines = bundle.decode("utf-8").rstrip("\n").split("\n")
+    source_map = json.loads(source_map)
+
+    assert lines[1] == "(function () {"
+    assert lines[-1] == f"//# sourceMappingURL={bundler.BUNDLE_NAME}.map"
+    assert source_map["sources"] == ["plain.js", "script_gen.py"]
+    assert source_map["sourcesContent"][0] == "const a = 1;\nconst b = 2;\n"
+
+    resolved = resolve_mappings(source_map["mappings"])
+    assert len(resolved) == len(lines)
+    sources = [(root / name).read_text(encoding="utf-8").split("\n") for name in source_map["sources"]]
+    mapped = [(line, position) for line, position in zip(lines, resolved) if position]
+    assert [line for line, _ in mapped] == [
+        "const a = 1;", "const b = 2;", "function one() {}", "function two() {}"]
+    for line, (source, source_line, column) in mapped:
+        assert sources[source][source_line][column:].startswith(line)
+
+
+def test_transform_is_applied_to_the_bundle(modules):
+    root, generators = modules
+    bundle, _ = bundler.build_bundle(root, generators, ("plain.js",), transform=str.upper)
+    assert "CONST A = 1;" in bundle.decode("utf-8")
+
+
+def test_rewrite_html_for_bundle_replaces_module_tags():
+    html = textwrap.dedent("""\
+        <body>
+            <script src="https://cdn.example/three.min.js"></script>
+            <script src="js/plain.js?v=1"></script>
+            <script src="js/generated.js"></script>
+            <script src="analytics.js"></script>
+        </body>
+    """)
+    rewritten = bundler.rewrite_html_for_bundle(html, ("plain.js", "generated.js"))
+    assert rewritten == textwrap.dedent(f"""\
+        <body>
+            <script src="https://cdn.example/three.min.js"></script>
+            <script src="js/{bundler.BUNDLE_NAME}"></script>
+            <script src="analytics.js"></script>
+        </body>
+    """)
+
+
+def test_insert_script_tags_adds_only_missing_scripts():
+    html = '<html><body>\n    <script src="https://cdn.example/three.min.js"></script>\n</body></html>\n--part--\n'
+    rewritten = bundler.insert_script_tags(html, (bundler.THREE_URL, bundler.BUNDLE_NAME, "ui.js"))
+    assert rewritten == (
+        '<html><body>\n    <script src="https://cdn.example/three.min.js"></script>\n'
+        f'    <script src="{bundler.BUNDLE_NAME}"></script>\n    <script src="ui.js"></script>\n'
+        '</body></html>\n--part--\n'
+    )
+    assert bundler.insert_script_tags(rewritten, (bundler.BUNDLE_NAME,)) == rewritten
+
+
+def test_insert_script_tags_needs_a_body():
+    with pytest.raises(ValueError):
+        bundler.insert_script_tags("<div></div>", ("ui.js",))
+
+
+def test_link_stylesheets_points_saved_links_at_local_files():
+    html = ('<html><head>\n'
+            '    <link rel="stylesheet" href="https://s3.example/dump/styles.css?v=1">\n'
+            '    <link rel="preconnect" href="https://cdn.example/styles.css">\n'
+            '    <link href="https://fonts.example/css2?family=Inter" rel="stylesheet">\n'
+            '</head><body></body></html>\n')
+    rewritten = bundler.link_stylesheets(html, ["styles.css", "print.css"])
+    assert rewritten == (
+        '<html><head>\n'
+        '    <link rel="stylesheet" href="styles.css">\n'
+        '    <link rel="preconnect" href="https://cdn.example/styles.css">\n'
+        '    <link href="https://fonts.example/css2?family=Inter" rel="stylesheet">\n'
+        '    <link rel="stylesheet" href="print.css">\n'
+        '</head><body></body></html>\n'
+    )
+    assert bundler.link_stylesheets(rewritten, ["styles.css", "print.css"]) == rewritten
+
+
+def test_link_stylesheets_needs_a_head():
+    with pytest.raises(ValueError):
+        bundler.link_stylesheets("<div></div>", ["styles.css"])
+
+
+def test_name_bundle_hashes_the_bundle_and_its_map_together(modules):
+    root, generators = modules
+    bundle, source_map = bundler.build_bundle(root, generators, ("plain.js",))
+    named_bundle, named_map, names = bundler.name_bundle(bundle, source_map)
+    published = names[bundler.BUNDLE_NAME]
+    assert published.startswith("constellation.bundle.") and published != bundler.BUNDLE_NAME
+    assert names[bundler.BUNDLE_NAME + ".map"] == published + ".map"
+    assert named_bundle.decode("utf-8").endswith(f"\n//# sourceMappingURL={published}.map\n")
+    assert json.loads(named_map)["file"] == published
+    # only the references change, so the mappings still line up
+    assert len(named_bundle.split(b"\n")) == len(bundle.split(b"\n"))
+
+    changed, _ = bundler.build_bundle(root, generators, ("plain.js",), transform=str.upper)
+    assert bundler.name_bundle(changed, source_map)[2][bundler.BUNDLE_NAME] != published
@@ -0,0 +1,107 @@
+"""Tests for the Aho-Corasick categoriser and its browser counterpart."""
+
+import json
+import random
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import build
+import categoriser
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def match(automaton, text):
+    """Run ``text`` through a compiled automaton; return the keyword indexes found."""
+    classes = {char: column for column, char in enumerate(automaton["alphabet"], start=1)}
+    width = len(classes) + 1
+    found, state = set(), 0
+    for char in text.lower():
+        state = automaton["delta"][state * width + classes.get(char, 0)]
+        found.update(automaton["output"][state])
+    return found
+
+
+def test_automaton_table_shape():
+    automaton = categoriser.compile_automaton(["he", "she", "his", "hers"])
+    assert automaton["alphabet"] == "ehirs"
+    assert len(automaton["delta"]) == len(automaton["output"]) * (len(automaton["alphabet"]) + 1)
+    # Class 0 (a character no keyword uses) always leads back to the root
+    width = len(automaton["alphabet"]) + 1
+    assert all(automaton["delta"][state * width] == 0 for state in range(len(automaton["output"])))
+
+
+def test_automaton_follows_failure_links():
+    automaton = categoriser.compile_automaton(["he", "she", "his", "hers"])
+    assert match(automaton, "ushers") == {0, 1, 3}
+    assert match(automaton, "ahishers") == {0, 1, 2, 3}
+    assert match(automaton, "hhhh") == set()
+
+
+def test_automaton_matches_substring_search():
+    keywords = [keyword for keyword, _, _ in categoriser.CATEGORY_RULES] + ["tooling", "to", "ools"]
+    automaton = categoriser.compile_automaton(keywords)
+    rng = random.Random(7)
+    alphabet = "adehilnoprstuy -"
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        text += rng.choice(keywords) if rng.random() < 0.5 else ""
+        expected = {index for index, keyword in enumerate(keywords) if keyword in text}
+        assert match(automaton, text) == expected, text
+
+
+def test_find_keywords_reports_each_keyword_once_in_order():
+    keywords = [keyword for keyword, _, _ in categoriser.CATEGORY_RULES]
+    tool, portal = keywords.index("tool"), keywords.index("portal")
+    assert categoriser.find_keywords("Portal TOOL portal tooling") == [portal, tool]
+
+
+@pytest.mark.parametrize("repo, category", [
+    ({}, categoriser.DEFAULT_CATEGORY),
+    ({"name": "dotfiles", "description": None, "topics": None}, categoriser.DEFAULT_CATEGORY),
+    ({"name": "hyperfocus-tool"}, "core"),  # tie: the keyword listed first wins
+    ({"name": "x", "description": "adhd research notes"}, "brain"),
+    ({"name": "portal", "topics": ["adhd", "adhd-tools"]}, "portal"),  # 3 beats 2 + 2 split
+    ({"name": "notes", "topics": ["raspberry"], "description": "a creative tool"}, "hardware"),
+    ({"name": "Constellation", "description": "HYPERFOCUS"}, "visual"),
+])
+def test_categorize(repo, category):
+    assert categoriser.categorize(repo) == category
+
+
+def test_render_matcher_rejects_non_ascii_keywords(monkeypatch):
+    monkeypatch.setattr(categoriser, "AUTOMATON", categoriser.compile_automaton(["café"]))
+    with pytest.raises(ValueError):
+        categoriser.render_matcher()
+
+
+def random_repositories(count, seed=3000):
+    """Repositories mixing category keywords, near misses and noise."""
+    rng = random.Random(seed)
+    words = [keyword for keyword, _, _ in categoriser.CATEGORY_RULES]
+    words += ["tools", "too", "adh", "hyper", "focus", "Social", "RESEARCH", "café", "ünïcode", "raspberr"]
+
+    def text(maximum):
+        return " ".join(rng.choice(words) for _ in range(rng.randint(0, maximum)))
+
+    return [{
+        "name": rng.choice(["-", "_", ""]).join(rng.choice(words) for _ in range(rng.randint(1, 3))),
+        "description": text(6) if rng.random() < 0.8 else None,
+        "topics": [rng.choice(words) for _ in range(rng.randint(0, 4))] if rng.random() < 0.8 else None,
+    } for _ in range(count)]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_browser_matcher_agrees_with_python():
+    """``githubCategorize`` in the generated github-api-manager.js must match ``categorize``."""
+    generated = build.run_generator(str(PROJECT_ROOT / "script.py"))["github-api-manager.js"]
+    helpers = generated.decode("utf-8").split("\nclass LRUCache")[0]
+    repos = random_repositories(3000)
+    script = helpers + "\nconst repos = JSON.parse(require('fs').readFileSync(0, 'utf8'));\n" \
+        "process.stdout.write(JSON.stringify(repos.map(githubCategorize)));\n"
+    result = subprocess.run(["node", "-e", script], input=json.dumps(repos),
+                            capture_output=True, text=True, check=True)
+    assert json.loads(result.stdout) == [categoriser.categorize(repo) for repo in repos]
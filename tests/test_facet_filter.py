@@ -0,0 +1,115 @@
+"""Tests for the bitset facet filter in facet-filter.js (run under node)."""
+
+import json
+import random
+import shutil
+import subprocess
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+CATEGORIES = ["ai", "tools", "research", "social"]
+LANGUAGES = ["Python", "JavaScript", "Rust", None]
+TOPICS = ["adhd", "focus", "3d", "llm"]
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+
+
+def random_repositories(count, seed=3):
+    rng = random.Random(seed)
+    return [{
+        "name": f"repo-{index}",
+        "category": rng.choice(CATEGORIES),
+        "language": rng.choice(LANGUAGES),
+        "topics": rng.sample(TOPICS, rng.randint(0, 2)),
+        "stars": rng.choice([0, 3, 12, 60, 700]),
+        "forks": rng.choice([0, 2, 7, 20]),
+        "updated": (NOW - timedelta(days=rng.choice([1, 20, 60, 400]))).isoformat(),
+    } for index in range(count)]
+
+
+def activity(repo):
+    days = (NOW - datetime.fromisoformat(repo["updated"])).days
+    return next((name for name, limit in (("week", 7), ("month", 30), ("quarter", 90)) if days < limit),
+                "dormant")
+
+
+def matches(repo, index, facet, value):
+    """Reference semantics: one facet value, or any of a list of them."""
+    if facet == "search":
+        return index in value
+    if isinstance(value, list):
+        return any(matches(repo, index, facet, item) for item in value)
+    if facet == "topic":
+        return value in repo["topics"]
+    if facet == "activity":
+        return activity(repo) == value
+    if facet in ("minStars", "minForks"):
+        return repo["stars" if facet == "minStars" else "forks"] >= value
+    return repo[facet] == value
+
+
+def visible(repositories, filters):
+    return {index for index, repo in enumerate(repositories)
+            if all(value is None or matches(repo, index, facet, value) for facet, value in filters.items())}
+
+
+def run_filter(repositories, queries):
+    """Apply ``queries`` in order; report changed indexes, count and visibility after each."""
+    script = "global.window = global;\n" + (PROJECT_ROOT / "facet-filter.js").read_text(encoding="utf-8") + f"""
+const {{ repos, queries }} = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const filter = new FacetFilter();
+filter.build(repos, {int(NOW.timestamp() * 1000)});
+const results = queries.map((filters) => {{
+    const changed = filter.apply(filters).sort((a, b) => a - b);
+    const shown = repos.map((_, index) => index).filter(index => filter.isVisible(index));
+    return {{ changed, count: filter.count(), shown }};
+}});
+process.stdout.write(JSON.stringify(results));
+"""
+    result = subprocess.run(["node", "-e", script], input=json.dumps({"repos": repositories, "queries": queries}),
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def check(repositories, queries):
+    previous = set(range(len(repositories)))
+    for filters, result in zip(queries, run_filter(repositories, queries)):
+        expected = visible(repositories, filters)
+        assert result["shown"] == sorted(expected), filters
+        assert result["count"] == len(expected), filters
+        assert result["changed"] == sorted(previous ^ expected), filters
+        previous = expected
+
+
+def test_intersection_union_and_clearing():
+    repositories = random_repositories(100)
+    check(repositories, [
+        {"category": "ai"},
+        {"category": "ai", "language": "Python"},
+        {"category": ["ai", "tools"], "language": ["Python", "Rust"]},
+        {"category": ["ai", "tools"], "topic": "adhd", "activity": ["week", "month"]},
+        {"category": None, "topic": ["focus", "llm"], "minStars": 50},
+        {"minStars": 13, "minForks": 7},
+        {"search": [0, 31, 32, 33, 63, 64, 99], "category": "research"},
+        {"search": [0, 31, 32, 33, 63, 64, 99]},
+        {"category": "no-such-category"},
+        {},
+    ])
+
+
+@pytest.mark.parametrize("count", [1, 31, 32, 33, 64, 65, 130])
+def test_counts_across_word_boundaries(count):
+    repositories = random_repositories(count, seed=count)
+    check(repositories, [{"category": "ai"}, {"category": None, "minStars": 1}, {"language": None}, {}])
+
+
+def test_highest_bit_of_a_word():
+    repositories = random_repositories(64)
+    for repo in repositories:
+        repo["category"] = "tools"
+    repositories[31]["category"] = repositories[63]["category"] = "ai"
+    check(repositories, [{"category": "ai"}, {"category": "tools"}, {"category": ["ai", "tools"]}])
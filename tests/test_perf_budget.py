@@ -0,0 +1,94 @@
+"""Tests for the performance budget gate in perf_budget.py."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+import perf_budget
+
+BUDGET = {
+    "max_growth_percent": 10,
+    "default": {"bytes": 1000, "gzip_bytes": 400},
+    "modules": {"big.js": {"bytes": 3000, "gzip_bytes": 900, "reason": "needs the room"}},
+    "critical_path": {"files": ["app.js", "styles.css"], "bytes": 1500, "gzip_bytes": 600},
+}
+
+
+def manifest(**sizes):
+    return {"artifacts": {name: {"bytes": raw, "gzip_bytes": gzipped}
+                          for name, (raw, gzipped) in sizes.items()}}
+
+
+PASSING = manifest(**{"app.js": (900, 300), "styles.css": (500, 200), "big.js": (2500, 800),
+                      "index.html": (50000, 9000)})
+
+
+def test_passing_budget():
+    assert perf_budget.check_budget(PASSING, BUDGET) == []
+    assert perf_budget.check_budget(PASSING, BUDGET, PASSING) == []
+
+
+def test_over_limit_assets():
+    current = manifest(**{"app.js": (1001, 300), "styles.css": (400, 200), "big.js": (2500, 901)})
+    assert perf_budget.check_budget(current, BUDGET) == [
+        "app.js: bytes 1.0 KB exceeds budget of 1.0 KB",
+        "big.js: gzip_bytes 0.9 KB exceeds budget of 0.9 KB",
+    ]
+    over = manifest(**{"app.js": (1000, 400), "styles.css": (501, 201)})
+    assert perf_budget.check_budget(over, BUDGET) == [
+        "critical path: bytes 1.5 KB exceeds budget of 1.5 KB",
+        "critical path: gzip_bytes 0.6 KB exceeds budget of 0.6 KB",
+    ]
+
+
+def test_missing_critical_path_file():
+    current = manifest(**{"app.js": (900, 300)})
+    assert perf_budget.check_budget(current, BUDGET) == [
+        "critical path: styles.css is missing from the manifest"]
+
+
+def test_growth_against_baseline():
+    baseline = manifest(**{"app.js": (500, 200), "styles.css": (500, 200)})
+    current = manifest(**{"app.js": (551, 220), "styles.css": (500, 200)})
+    # the critical path as a whole only grew 5.1%
+    assert perf_budget.check_budget(current, BUDGET, baseline) == [
+        "app.js: bytes grew 10.2% (0.5 KB -> 0.5 KB), limit is 10%"]
+    # new artifacts have nothing to grow from
+    assert perf_budget.check_budget(manifest(**{"new.js": (900, 300), "app.js": (500, 200),
+                                                "styles.css": (500, 200)}), BUDGET, baseline) == []
+
+
+@pytest.fixture
+def repository(tmp_path):
+    if shutil.which("git") is None:
+        pytest.skip("needs git")
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "build-manifest.json").write_text(json.dumps(PASSING), encoding="utf-8")
+    git("add", "build-manifest.json")
+    git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "baseline")
+    return tmp_path
+
+
+def test_baseline_from_git(repository):
+    assert perf_budget.load_baseline_from_git("HEAD", cwd=repository) == PASSING
+    assert perf_budget.load_baseline_from_git("no-such-ref", cwd=repository) is None
+    assert perf_budget.load_baseline_from_git("HEAD", "other.json", cwd=repository) is None
+
+
+def test_main_skips_growth_checks_without_a_baseline(tmp_path, caplog):
+    (tmp_path / "manifest.json").write_text(json.dumps(PASSING), encoding="utf-8")
+    (tmp_path / "budget.json").write_text(json.dumps(BUDGET), encoding="utf-8")
+    args = ["--manifest", str(tmp_path / "manifest.json"), "--budget", str(tmp_path / "budget.json")]
+    with caplog.at_level("INFO"):
+        assert perf_budget.main([*args, "--baseline-ref", "no-such-ref-anywhere"]) == 0
+    assert "No baseline manifest found" in caplog.text
+
+    shrunk = manifest(**{"app.js": (100, 50), "styles.css": (500, 200), "big.js": (2500, 800)})
+    (tmp_path / "baseline.json").write_text(json.dumps(shrunk), encoding="utf-8")
+    assert perf_budget.main([*args, "--baseline", str(tmp_path / "baseline.json")]) == 1
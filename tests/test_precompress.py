@@ -0,0 +1,71 @@
+"""Tests for the precompressed siblings in precompress.py."""
+
+import gzip
+import os
+import random
+import zlib
+
+import build
+import precompress
+from precompress import MAX_COMPRESSED_RATIO, MIN_COMPRESSIBLE_BYTES
+
+COMPRESSIBLE = b"const constellation = 'hyperfocus';\n" * 100
+
+
+def incompressible(size, seed=1):
+    return random.Random(seed).randbytes(size)
+
+
+def test_small_files_are_not_compressed():
+    assert precompress.compressed_variants(b"a" * (MIN_COMPRESSIBLE_BYTES - 1)) == {}
+    assert set(precompress.compressed_variants(b"a" * MIN_COMPRESSIBLE_BYTES)) == {".gz", ".zz"}
+
+
+def test_pays_off_threshold():
+    assert precompress.pays_off(1000 * 10, 9000)
+    assert not precompress.pays_off(1000 * 10, 9001)
+    assert not precompress.pays_off(MIN_COMPRESSIBLE_BYTES - 1, 1)
+    assert precompress.compressed_variants(incompressible(4096)) == {}
+    for suffix, payload in precompress.compressed_variants(COMPRESSIBLE).items():
+        assert len(payload) <= len(COMPRESSIBLE) * MAX_COMPRESSED_RATIO, suffix
+
+
+def test_variants_round_trip_and_are_deterministic():
+    variants = precompress.compressed_variants(COMPRESSIBLE)
+    assert gzip.decompress(variants[".gz"]) == COMPRESSIBLE
+    assert zlib.decompress(variants[".zz"]) == COMPRESSIBLE
+    # no timestamp in the gzip header
+    assert variants[".gz"][4:8] == b"\0\0\0\0"
+    assert precompress.compressed_variants(COMPRESSIBLE) == variants
+
+
+def test_is_compressible():
+    assert all(precompress.is_compressible(name) for name in ("a.js", "a.css", "a.json", "index.html"))
+    assert not any(precompress.is_compressible(name) for name in ("a.png", "a.js.map", "layout.bin"))
+
+
+def test_rebuild_leaves_no_stale_siblings(tmp_path):
+    (tmp_path / "app.js").write_bytes(COMPRESSIBLE)
+    (tmp_path / "icon.png").write_bytes(COMPRESSIBLE)
+    assert sorted(build.emit_precompressed(tmp_path, ["app.js", "icon.png"])) == ["app.js.gz", "app.js.zz"]
+    assert gzip.decompress((tmp_path / "app.js.gz").read_bytes()) == COMPRESSIBLE
+
+    # unchanged siblings are not rewritten
+    os.utime(tmp_path / "app.js.gz", (0, 0))
+    assert build.emit_precompressed(tmp_path, ["app.js"]) == []
+    assert (tmp_path / "app.js.gz").stat().st_mtime == 0
+
+    # once compression no longer pays off, the siblings go
+    (tmp_path / "app.js").write_bytes(incompressible(4096))
+    assert build.emit_precompressed(tmp_path, ["app.js"]) == []
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["app.js", "icon.png"]
+
+
+def test_new_release_prunes_siblings_of_old_hashed_files(tmp_path):
+    for name in ("app.11111111.js", "app.22222222.js"):
+        (tmp_path / name).write_bytes(COMPRESSIBLE)
+    build.emit_precompressed(tmp_path, ["app.11111111.js", "app.22222222.js"])
+    removed = build.prune_release(tmp_path, {"app.js": "app.22222222.js"})
+    assert removed == ["app.11111111.js", "app.11111111.js.gz", "app.11111111.js.zz"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "app.22222222.js", "app.22222222.js.gz", "app.22222222.js.zz"]
@@ -0,0 +1,86 @@
+"""Tests for the build-time 3D layout in repo_layout.py."""
+
+import random
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import repo_layout
+from categoriser import CATEGORY_ORDER
+from repo_snapshot import names_hash
+
+ITERATIONS = 60
+
+
+def snapshot_repositories(count, seed=7):
+    rng = random.Random(seed)
+    return [{"name": f"repo-{index}", "category": rng.choice(CATEGORY_ORDER),
+             "stars": int(rng.expovariate(1 / 30))} for index in range(count)]
+
+
+@pytest.fixture(scope="module")
+def layout():
+    repositories = snapshot_repositories(150)
+    return repositories, repo_layout.compute_layout(repositories, ITERATIONS)
+
+
+def test_layout_is_deterministic(layout):
+    repositories, positions = layout
+    again = repo_layout.compute_layout([dict(repo) for repo in repositories], ITERATIONS)
+    assert positions.dtype == np.float32
+    assert positions.shape == (len(repositories), 3)
+    assert positions.tobytes() == again.tobytes()
+
+
+def test_layout_stays_inside_the_engine_volume(layout):
+    _, positions = layout
+    assert np.all(np.abs(positions) <= np.array(repo_layout.HALF_EXTENTS, dtype=np.float32))
+    # the per-axis fit uses the whole volume, not just its tightest axis
+    assert np.all(np.abs(positions).max(axis=0) > 0.9 * np.array(repo_layout.HALF_EXTENTS))
+
+
+def test_layout_has_no_overlapping_spheres(layout):
+    repositories, positions = layout
+    radii = repo_layout.sphere_radii(np.array([repo["stars"] for repo in repositories], dtype=float))
+    centres = positions.astype(float)
+    distance = np.linalg.norm(centres[:, None] - centres[None, :], axis=2)
+    np.fill_diagonal(distance, np.inf)
+    assert np.all(distance - radii[:, None] - radii[None, :] > repo_layout.SPHERE_GAP - 0.01)
+
+
+def test_remove_overlaps_splits_coincident_spheres_in_a_corner():
+    bounds = np.array(repo_layout.HALF_EXTENTS)
+    positions = np.tile(bounds, (3, 1))
+    radii = np.ones(3)
+    resolved = repo_layout.remove_overlaps(positions, radii, bounds)
+    distance = np.linalg.norm(resolved[:, None] - resolved[None, :], axis=2)
+    np.fill_diagonal(distance, np.inf)
+    assert distance.min() > 2.0 + repo_layout.SPHERE_GAP - 0.01
+    assert np.all(np.abs(resolved) <= bounds)
+
+
+def test_render_layout_header_and_payload():
+    names = ["alpha", "béta", "gamma"]
+    positions = np.arange(9, dtype=np.float32).reshape(3, 3)
+    content = repo_layout.render_layout(names, positions)
+    magic, version, count, digest = struct.unpack_from(repo_layout.HEADER_FORMAT, content)
+    assert (magic, version, count) == (b"UHCL", repo_layout.LAYOUT_VERSION, 3)
+    assert struct.calcsize(repo_layout.HEADER_FORMAT) == 16
+    assert digest == names_hash(names)
+    assert np.frombuffer(content[16:], dtype="<f4").tolist() == list(range(9))
+
+
+def test_names_hash_is_fnv1a_over_newline_joined_names():
+    value = 0x811C9DC5
+    for byte in "alpha\nbéta".encode("utf-8"):
+        value = ((value ^ byte) * 0x01000193) % 2 ** 32
+    assert names_hash(["alpha", "béta"]) == value
+    assert names_hash([]) == 0x811C9DC5
+    # "a" FNV-1a 32-bit test vector
+    assert names_hash(["a"]) == 0xE40C292C
+
+
+def test_empty_snapshot():
+    assert repo_layout.compute_layout([]).shape == (0, 3)
@@ -0,0 +1,61 @@
+"""Tests for the offline repository snapshot in repo_snapshot.py."""
+
+import json
+
+import repo_snapshot
+from categoriser import CATEGORY_COLORS, categorize
+from repo_snapshot import SEARCH_INDEX_PATH, SNAPSHOT_PATH, names_hash
+
+RAW = [
+    {"id": 3, "name": "zen-timer", "description": "ADHD focus timer", "stargazers_count": 12,
+     "forks_count": 1, "language": "Python", "updated_at": "2024-03-01T00:00:00Z",
+     "html_url": "https://github.com/welshDog/zen-timer", "homepage": "", "topics": ["adhd"]},
+    {"id": 1, "name": "Aurora", "description": None, "stargazers_count": None,
+     "updated_at": "2024-02-01T00:00:00Z"},
+    {"id": 2, "name": "ai-agent", "description": "LLM research agent", "stargazers_count": 40,
+     "language": "TypeScript", "topics": ["ai", "research"]},
+    {"id": 4, "name": ".github"},
+    {"id": 5, "name": "welshDog"},
+]
+
+
+def write_dump(path, pages):
+    path.write_text(json.dumps(pages), encoding="utf-8")
+    return path
+
+
+def run(tmp_path, dump):
+    output = tmp_path / SNAPSHOT_PATH
+    assert repo_snapshot.main(["--input", str(dump), "--output", str(output)]) == 0
+    return output
+
+
+def test_snapshot_is_sorted_and_has_the_fields_the_engine_reads(tmp_path):
+    output = run(tmp_path, write_dump(tmp_path / "dump.json", RAW))
+    snapshot = json.loads(output.read_text(encoding="utf-8"))
+    assert snapshot["version"] == repo_snapshot.SNAPSHOT_VERSION
+    repositories = snapshot["repositories"]
+    assert [repo["name"] for repo in repositories] == ["ai-agent", "Aurora", "zen-timer"]
+    for repo, raw in zip(repositories, (RAW[2], RAW[1], RAW[0])):
+        assert repo["category"] == categorize(raw)
+        assert repo["color"] == CATEGORY_COLORS[repo["category"]]
+        assert repo["stars"] == (raw.get("stargazers_count") or 0)
+    assert repositories[2]["demo_url"] is None
+    # compact, key-sorted JSON
+    text = output.read_text(encoding="utf-8")
+    assert text == json.dumps(snapshot, sort_keys=True, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def test_snapshot_is_deterministic(tmp_path):
+    first = run(tmp_path, write_dump(tmp_path / "dump.json", RAW)).read_bytes()
+    index = (tmp_path / SNAPSHOT_PATH).with_name(SEARCH_INDEX_PATH.name).read_bytes()
+
+    # the same repositories in another order, split over pages with an overlap
+    reordered = write_dump(tmp_path / "pages.json", [list(reversed(RAW[:3])), RAW[1:]])
+    other = tmp_path / "other"
+    other.mkdir()
+    assert run(other, reordered).read_bytes() == first
+    assert (other / SNAPSHOT_PATH).with_name(SEARCH_INDEX_PATH.name).read_bytes() == index
+
+    names = [repo["name"] for repo in json.loads(first)["repositories"]]
+    assert json.loads(index)["namesHash"] == names_hash(names)
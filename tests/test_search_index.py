@@ -0,0 +1,141 @@
+"""Tests for the trigram/prefix search index in search_index.py."""
+
+import json
+import random
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import search_index
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+REPOSITORIES = [
+    {"name": "Hyperfocus-Timer", "description": "ADHD focus timer", "language": "JavaScript",
+     "topics": ["adhd", "productivity"]},
+    {"name": "dotfiles", "description": None, "language": None, "topics": []},
+    {"name": "café_au_lait", "description": "Münster maps, dotted", "language": "Python"},
+]
+
+
+def decode(postings):
+    """Undo the gap encoding of a posting list."""
+    documents, total = [], 0
+    for gap in postings:
+        total += gap
+        documents.append(total)
+    return documents
+
+
+def test_document_text_joins_fields_lowercased():
+    assert search_index.document_text(REPOSITORIES[0]) == \
+        "hyperfocus-timer\nadhd focus timer\njavascript\nadhd productivity"
+    assert search_index.document_text(REPOSITORIES[1]) == "dotfiles\n\n\n"
+
+
+def test_words_split_on_ascii_punctuation_only():
+    assert search_index.words("café_au-lait v2.0\nmünster") == ["café", "au", "lait", "v2", "0", "münster"]
+
+
+def test_document_terms():
+    trigrams, prefixes = search_index.document_terms("ab hello x")
+    assert trigrams == {"hel", "ell", "llo"}
+    assert prefixes == {"a", "ab", "h", "he", "x"}
+
+
+def test_postings_are_sorted_and_gap_encoded():
+    index = search_index.build_index(REPOSITORIES)
+    assert list(index["trigrams"]) == sorted(index["trigrams"])
+    assert list(index["prefixes"]) == sorted(index["prefixes"])
+    assert index["trigrams"]["foc"] == [0]
+    assert index["trigrams"]["dot"] == [1, 1]  # documents 1 and 2
+    assert index["prefixes"]["d"] == [1, 1]
+    assert decode(index["prefixes"]["m"]) == [2]
+
+
+def test_postings_match_brute_force():
+    rng = random.Random(11)
+    vocabulary = ["alpha", "beta", "gamma", "ab", "x", "tool", "tools", "münster", "v2", "a-b_c"]
+    repositories = [{
+        "name": rng.choice(vocabulary) + rng.choice(["", "-", "_"]) + rng.choice(vocabulary),
+        "description": " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 5))),
+        "topics": [rng.choice(vocabulary) for _ in range(rng.randint(0, 3))],
+    } for _ in range(200)]
+    index = search_index.build_index(repositories)
+    terms = [search_index.document_terms(search_index.document_text(repo)) for repo in repositories]
+    for kind, position in (("trigrams", 0), ("prefixes", 1)):
+        expected = {}
+        for document, document_terms in enumerate(terms):
+            for term in document_terms[position]:
+                expected.setdefault(term, []).append(document)
+        assert {term: decode(postings) for term, postings in index[kind].items()} == expected
+
+
+def test_render_index_header():
+    rendered = json.loads(search_index.render_index(REPOSITORIES, 1234))
+    assert rendered["version"] == search_index.INDEX_VERSION
+    assert rendered["count"] == len(REPOSITORIES)
+    assert rendered["namesHash"] == 1234
+    assert rendered["trigrams"] == search_index.build_index(REPOSITORIES)["trigrams"]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_browser_index_agrees_with_python():
+    """``SearchIndex`` in search-index.js must index exactly like ``build_index``."""
+    script = "global.window = global;\n" + (PROJECT_ROOT / "search-index.js").read_text(encoding="utf-8") + """
+const repos = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const index = new SearchIndex();
+repos.forEach(repo => index.addDocument(repo));
+const dump = map => Object.fromEntries([...map].map(([term, ids]) => [term, [...ids].sort((a, b) => a - b)]));
+process.stdout.write(JSON.stringify({ trigrams: dump(index.trigrams), prefixes: dump(index.prefixes) }));
+"""
+    result = subprocess.run(["node", "-e", script], input=json.dumps(REPOSITORIES),
+                            capture_output=True, text=True, check=True)
+    browser = json.loads(result.stdout)
+    index = search_index.build_index(REPOSITORIES)
+    for kind in ("trigrams", "prefixes"):
+        assert browser[kind] == {term: decode(postings) for term, postings in index[kind].items()}
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_removed_ids_are_reused():
+    """A long session of live updates must not grow the index without bound."""
+    rng = random.Random(5)
+    words = ["focus", "timer", "adhd", "graph", "llm", "notes", "3d", "café"]
+    rounds, renamed, live = [], [], [f"repo-{index}" for index in range(100)]
+    for round_number in range(40):
+        names = [name if rng.random() < 0.8 else f"{name.split('~')[0]}~{round_number}" for name in live]
+        renamed.append(len(set(names) - set(live)))
+        live = names
+        rounds.append([{"name": name, "description": " ".join(rng.sample(words, 3)),
+                        "language": rng.choice(["Python", "Rust", None])} for name in live])
+    script = "global.window = global;\n" + (PROJECT_ROOT / "search-index.js").read_text(encoding="utf-8") + """
+const rounds = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const byKey = (index, map) => [...map].map(([term, ids]) =>
+    [term, [...ids].map(id => index.documents[id].key).sort()]).sort(([a], [b]) => (a < b ? -1 : 1));
+const index = new SearchIndex();
+const results = rounds.map((repos) => {
+    index.sync(repos);
+    const fresh = new SearchIndex();
+    repos.forEach(repo => fresh.addDocument(repo));
+    const same = JSON.stringify(byKey(index, index.trigrams)) === JSON.stringify(byKey(fresh, fresh.trigrams)) &&
+        JSON.stringify(byKey(index, index.prefixes)) === JSON.stringify(byKey(fresh, fresh.prefixes));
+    const searches = ['foc', 'ti', 'café', 'rust'].map(query =>
+        [index.search(query).sort(), fresh.search(query).sort()]);
+    return { slots: index.documents.length, live: index.idsByKey.size, same, searches };
+});
+process.stdout.write(JSON.stringify(results));
+"""
+    result = subprocess.run(["node", "-e", script], input=json.dumps(rounds),
+                            capture_output=True, text=True, check=True)
+    for state in json.loads(result.stdout):
+        assert state["live"] == 100
+        assert state["same"]
+        for churned, fresh in state["searches"]:
+            assert churned == fresh
+        # sync adds new repositories before removing the old ones, so a
+        # round needs at most one extra slot per rename
+        assert state["slots"] <= 100 + max(renamed)
+    assert sum(renamed) > 300
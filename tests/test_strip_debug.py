@@ -0,0 +1,79 @@
+"""Tests for production stripping in strip_debug.py."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from strip_debug import strip_console_calls, strip_debug, strip_debug_blocks
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("source, expected", [
+    # Whole statements are blanked, keeping their lines
+    ("a();\nconsole.log('x');\nb();\n", "a();\n\nb();\n"),
+    ("a();\n    console.warn(\n        'x', y\n    );\nb();\n", "a();\n\n\n\nb();\n"),
+    # Single-statement bodies keep a statement
+    ("if (x) console.log('x');\nb();\n", "if (x) void 0;\nb();\n"),
+    ("if (x)\n    console.log('x');\nelse b();\n", "if (x)\n    void 0;\nelse b();\n"),
+    ("const f = () => console.log('x');\n", "const f = () => void 0;\n"),
+    ("p.catch(e => console.warn(e, (1 + 2)));\n", "p.catch(e => void 0);\n"),
+    # console.error and look-alikes survive
+    ("console.error('x');\n", "console.error('x');\n"),
+    ("myconsole.log('x');\nthis.console.log('y');\n", "myconsole.log('x');\nthis.console.log('y');\n"),
+])
+def test_strip_console_calls(source, expected):
+    assert strip_console_calls(source) == expected
+
+
+@pytest.mark.parametrize("source", [
+    "const s = 'console.log(1)';\n",
+    'const s = "a \\" console.log(1)";\n',
+    "const t = `console.log(${value})`;\n",
+    "// console.log('commented out')\n",
+    "/* console.log('x') */ a();\n",
+    "const r = /console.log\\(/g;\n",
+    "const r = x.match(/[/]console.log\\(/);\n",
+])
+def test_calls_inside_literals_are_kept(source):
+    assert strip_console_calls(source) == source
+
+
+def test_call_arguments_containing_literals():
+    source = "console.log(')', `${a + ')'}`, /\\)/);\nb();\n"
+    assert strip_console_calls(source) == "\nb();\n"
+
+
+def test_division_is_not_a_regex():
+    source = "const half = total / 2; console.log('/');\nb();\n"
+    assert strip_console_calls(source) == "const half = total / 2; void 0;\nb();\n"
+
+
+def test_strip_debug_blocks():
+    source = "a();\n// @debug-start\ndebugger;\nshow();\n    // @debug-end\nb();\n"
+    assert strip_debug_blocks(source) == "a();\n\n\n\n\nb();\n"
+
+
+def test_unterminated_debug_block():
+    with pytest.raises(ValueError):
+        strip_debug_blocks("// @debug-start\na();\n")
+
+
+@pytest.mark.parametrize("name", ["constellation-engine.js", "facet-filter.js", "search-index.js",
+                                  "ui-interactions.js"])
+def test_line_count_is_preserved(name):
+    source = (PROJECT_ROOT / name).read_text(encoding="utf-8")
+    stripped = strip_debug(source)
+    assert stripped.count("\n") == source.count("\n")
+    assert "console.error" not in source or "console.error" in stripped
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+@pytest.mark.parametrize("name", ["constellation-engine.js", "facet-filter.js", "search-index.js",
+                                  "ui-interactions.js"])
+def test_stripped_source_still_parses(name, tmp_path):
+    target = tmp_path / name
+    target.write_text(strip_debug((PROJECT_ROOT / name).read_text(encoding="utf-8")), encoding="utf-8")
+    subprocess.run(["node", "--check", str(target)], check=True, capture_output=True)
@@ -0,0 +1,97 @@
+"""Tests for the service worker route table and its lookup in sw.js."""
+
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import build
+import sw_routes
+from sw_routes import BASE_PATH, GITHUB_API_HOST
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TABLE = sw_routes.compile_routes()
+
+CASES = [
+    (GITHUB_API_HOST, "/rate_limit", "github-rate-limit"),
+    (GITHUB_API_HOST, "/users/octocat", "github-users"),
+    (GITHUB_API_HOST, "/users/octocat/repos", "github-users"),
+    (GITHUB_API_HOST, "/repos/octocat/hello/languages", "github-repos"),
+    (GITHUB_API_HOST, "/search/repositories", "github-api"),
+    (GITHUB_API_HOST, "/", "github-api"),
+    # prefixes match whole segments only
+    (GITHUB_API_HOST, "/rate_limits", "github-api"),
+    (GITHUB_API_HOST, "/usersx/octocat", "github-api"),
+    ("cdnjs.cloudflare.com", "/ajax/libs/three.js/r128/three.min.js", "cdn"),
+    ("", BASE_PATH + "icons/icon-192.png", "icons"),
+    ("", BASE_PATH + "screenshots/wide.webp", "screenshots"),
+    # a deeper prefix wins regardless of extension
+    ("", BASE_PATH + "icons/readme.html", "icons"),
+    ("", BASE_PATH + "constellation.bundle.1a2b3c4d.js", "app-assets"),
+    ("", BASE_PATH + "data/repos.JSON", "app-assets"),
+    ("", BASE_PATH + "styles.css", "app-assets"),
+    ("", BASE_PATH, "app-shell"),
+    ("", BASE_PATH + "index.html", "app-shell"),
+    ("", BASE_PATH + "some/deep/link", "app-shell"),
+    ("", BASE_PATH + ".well-known", "app-shell"),
+    # no route accepts the extension, nor anything outside the app
+    ("", BASE_PATH + "archive.zip", "default"),
+    ("", "/other-project/index.html", "default"),
+    ("", "/", "default"),
+    ("fonts.example.com", "/font.woff2", "default"),
+]
+
+
+@pytest.mark.parametrize("host, path, name", CASES)
+def test_match_route(host, path, name):
+    assert sw_routes.match_route(TABLE, host, path)["name"] == name
+
+
+def test_first_listed_route_wins_on_the_same_node():
+    routes = ({"name": "first", "prefix": "/a/", "strategy": "network-only"},
+              {"name": "second", "prefix": "/a", "strategy": "network-only"})
+    table = sw_routes.compile_routes(routes)
+    assert sw_routes.match_route(table, "", "/a/b")["name"] == "first"
+
+
+def test_compiled_route_shape():
+    route = sw_routes.match_route(TABLE, GITHUB_API_HOST, "/users/octocat")
+    assert route == {"name": "github-users", "strategy": "stale-while-revalidate",
+                     "cache": "github-api", "maxEntries": 200, "maxAge": 5 * sw_routes.MINUTE,
+                     "hardMaxAge": 7 * sw_routes.DAY, "notify": "GITHUB_API_UPDATED",
+                     "offline": "json"}
+    assert TABLE["routes"][TABLE["default"]]["name"] == sw_routes.DEFAULT_ROUTE["name"]
+    assert set(TABLE["caches"]) == set(sw_routes.CACHE_BUDGETS)
+
+
+@pytest.mark.parametrize("route, message", [
+    ({"name": "bad", "prefix": "/", "strategy": "cache-last", "cache": "static"}, "unknown strategy"),
+    ({"name": "bad", "prefix": "/", "strategy": "cache-first", "cache": "nowhere"}, "unknown cache"),
+    ({"name": "bad", "prefix": "/", "strategy": "cache-first"}, "unknown cache"),
+])
+def test_compile_route_rejects_invalid_routes(route, message):
+    with pytest.raises(ValueError, match=message):
+        sw_routes.compile_routes((route,))
+
+
+def test_network_only_needs_no_cache():
+    assert sw_routes.compile_route({"name": "live", "prefix": "/", "strategy": "network-only"})["cache"] is None
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_service_worker_lookup_agrees_with_python():
+    """``matchRoute`` in the generated sw.js must match ``match_route``."""
+    generated = build.run_generator(str(PROJECT_ROOT / "script_4.py"))["sw.js"].decode("utf-8")
+    routes = re.search(r"^const SW_ROUTES = .*;$", generated, re.MULTILINE).group(0)
+    lookup = re.search(r"^function matchRoute\(url\) \{$.*?^\}$", generated, re.MULTILINE | re.DOTALL).group(0)
+    origin = "https://example.github.io"
+    urls = [(f"https://{host}" if host else origin) + path for host, path, _ in CASES]
+    script = f"const self = {{ location: new URL('{origin}/') }};\n{routes}\n{lookup}\n" \
+        "const urls = JSON.parse(require('fs').readFileSync(0, 'utf8'));\n" \
+        "process.stdout.write(JSON.stringify(urls.map((url) => matchRoute(new URL(url)).name)));\n"
+    result = subprocess.run(["node", "-e", script], input=json.dumps(urls),
+                            capture_output=True, text=True, check=True)
+    assert json.loads(result.stdout) == [name for _, _, name in CASES]